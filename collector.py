@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Headless Collector
+Datenerfassung und Logging als Daemon ohne PyQt6, Matplotlib und pystray
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import argparse
+import signal
+import sys
+import threading
+import time
+from typing import Optional
+
+from utils.config import ConfigManager
+from utils.logging import SystemLogger
+from utils.rate_control import RateController
+from utils.resources import ResourceBudget, COLLECTOR_BUDGET, HEADLESS_FORBIDDEN_MODULES
+from utils.snapshot import SnapshotSampler
+
+
+class CollectorDaemon:
+    """
+    Headless Collector für SystemMonitorX
+    - SnapshotSampler + SystemLogger, gesteuert über die Konfiguration
+    - SIGINT/SIGTERM: sauber beenden und Buffer schreiben
+    - SIGHUP: Konfiguration neu laden (Intervall, Buffer, Dateien)
+    - SIGUSR1: Buffer sofort schreiben und Status ausgeben
+    """
+
+    def __init__(self, config_manager: ConfigManager, logs_dir: str = "logs",
+                 interval_ms: Optional[int] = None):
+        self.config_manager = config_manager
+        self.interval_ms = interval_ms
+
+        self.sampler = SnapshotSampler()
+        self.logger = SystemLogger(logs_dir=logs_dir, sampler=self.sampler)
+
+        # Log-Intervall wie in der GUI über Rate-Control (SIGHUP wendet Änderungen an)
+        self.rate_control = RateController(config_manager)
+        self.rate_control.register("logging", self.set_log_interval)
+        self.apply_logging_config()
+
+        self.stop_event = threading.Event()
+        self.metrics_server = None
+        self.publisher = None
+        self.agent_publisher = None
+        self.shared_snapshot = None
+
+    def start_metrics_server(self, host: Optional[str] = None, port: Optional[int] = None) -> bool:
+        """Lokalen Metrics-Endpoint starten (Werte aus der Konfiguration, falls nicht angegeben)"""
+        from utils.metrics_server import MetricsServer, DEFAULT_PORT
+        config = self.config_manager.get_metrics_server_config()
+        self.metrics_server = MetricsServer(
+            self.sampler,
+            host or config.get("host", "127.0.0.1"),
+            config.get("port", DEFAULT_PORT) if port is None else port
+        )
+        if not self.metrics_server.start():
+            self.metrics_server = None
+            return False
+        return True
+
+    def start_publisher(self, path: Optional[str] = None) -> bool:
+        """Snapshot-Publisher (Unix-Socket) starten"""
+        from utils.publisher import SnapshotPublisher, DEFAULT_MAX_QUEUE
+        config = self.config_manager.get_publisher_config()
+        self.publisher = SnapshotPublisher(
+            self.sampler,
+            path or config.get("socket_path") or None,
+            int(config.get("max_queue", DEFAULT_MAX_QUEUE))
+        )
+        if not self.publisher.start():
+            self.publisher = None
+            return False
+        return True
+
+    def start_agent(self, host: str = "127.0.0.1", port: Optional[int] = None) -> bool:
+        """Agent-Modus: Snapshots per TCP für die Flotten-Ansicht verteilen"""
+        from utils.publisher import SnapshotPublisher, DEFAULT_AGENT_PORT, DEFAULT_MAX_QUEUE
+        config = self.config_manager.get_publisher_config()
+        self.agent_publisher = SnapshotPublisher(
+            self.sampler,
+            max_queue=int(config.get("max_queue", DEFAULT_MAX_QUEUE)),
+            host=host,
+            port=DEFAULT_AGENT_PORT if port is None else port
+        )
+        if not self.agent_publisher.start():
+            self.agent_publisher = None
+            return False
+        return True
+
+    def start_shared_snapshot(self, name: Optional[str] = None) -> bool:
+        """Snapshots ins Shared Memory schreiben (Ringpuffer für lokale Leser)"""
+        from utils.shared_snapshot import SharedSnapshotWriter, DEFAULT_SLOTS
+        config = self.config_manager.get_shared_memory_config()
+        self.shared_snapshot = SharedSnapshotWriter(
+            self.sampler,
+            name or config.get("name") or None,
+            int(config.get("slots", DEFAULT_SLOTS))
+        )
+        if not self.shared_snapshot.start():
+            self.shared_snapshot = None
+            return False
+        return True
+
+    def set_log_interval(self, interval_ms: int):
+        """Log-Intervall setzen (--interval hat Vorrang vor der Konfiguration)"""
+        self.logger.set_interval(self.interval_ms or interval_ms)
+
+    def apply_logging_config(self):
+        """Buffer-Größe, Anzahl Dateien und Verlaufs-Aufbewahrung aus der Konfiguration übernehmen"""
+        logging_config = self.config_manager.get_logging_config()
+        self.logger.buffer_size = max(1, int(logging_config.get("buffer_size", 60)))
+        self.logger.max_files = max(1, int(logging_config.get("max_files", 10)))
+        self.logger.history.retention_days = max(1, int(logging_config.get("history_retention_days", 14)))
+
+    def install_signal_handlers(self):
+        """Signal-Handler registrieren (nur im Haupt-Thread möglich)"""
+        signal.signal(signal.SIGINT, self.on_stop_signal)
+        signal.signal(signal.SIGTERM, self.on_stop_signal)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self.on_reload_signal)
+        if hasattr(signal, "SIGUSR1"):
+            signal.signal(signal.SIGUSR1, self.on_status_signal)
+
+    def on_stop_signal(self, signum, frame):
+        """SIGINT/SIGTERM: Hauptschleife beenden"""
+        print(f"Signal {signal.Signals(signum).name} empfangen - Collector wird beendet...")
+        self.stop_event.set()
+
+    def on_reload_signal(self, signum, frame):
+        """SIGHUP: Konfiguration neu laden"""
+        try:
+            self.config_manager.settings = self.config_manager.load_settings()
+            self.apply_logging_config()
+            self.rate_control.apply()
+            print("Konfiguration neu geladen")
+        except Exception as e:
+            print(f"Fehler beim Neuladen der Konfiguration: {e}")
+
+    def on_status_signal(self, signum, frame):
+        """SIGUSR1: Buffer schreiben und Status ausgeben"""
+        # Im Hintergrund: der Logging-Thread könnte gerade den Lock halten
+        threading.Thread(target=self._write_status, daemon=True).start()
+
+    def _write_status(self):
+        """Buffer schreiben und Status ausgeben"""
+        self.logger.force_save()
+        status = self.logger.get_logging_status()
+        print(f"Collector-Status: {self.sampler.sample_count} Samples, "
+              f"Intervall {self.logger.interval * 1000:.0f} ms, "
+              f"Buffer {status['buffer_size']}/{status['max_buffer_size']}")
+
+    def run(self, duration: Optional[float] = None):
+        """Erfassen, bis ein Stop-Signal kommt (oder die Dauer abgelaufen ist)"""
+        self.logger.start_logging()
+        print(f"Collector läuft (Intervall {self.logger.interval * 1000:.0f} ms, "
+              f"Logs: {self.logger.logs_dir})")
+        try:
+            # Event.wait wird von Signal-Handlern unterbrochen
+            self.stop_event.wait(duration)
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Logging stoppen und restlichen Buffer schreiben"""
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        self.logger.stop_logging()
+        if self.publisher is not None:
+            self.publisher.stop()
+        if self.agent_publisher is not None:
+            self.agent_publisher.stop()
+        if self.shared_snapshot is not None:
+            self.shared_snapshot.stop()
+        self.logger.force_save()
+        self.config_manager.flush()
+
+
+def run_benchmark(daemon: CollectorDaemon, duration: float) -> int:
+    """Collector für eine feste Dauer laufen lassen und Verbrauch gegen das Budget prüfen"""
+    budget = ResourceBudget(COLLECTOR_BUDGET, watched_modules=HEADLESS_FORBIDDEN_MODULES)
+    started = time.perf_counter()
+    daemon.run(duration)
+    elapsed = time.perf_counter() - started
+
+    usage = budget.measure()
+    samples = daemon.sampler.sample_count
+    print(f"Benchmark: {samples} Samples in {elapsed:.1f} s ({samples / elapsed:.2f}/s)")
+    print(f"Ressourcen: {budget.format_report(usage)}")
+
+    problems = budget.check(usage)
+    if usage["loaded_modules"]:
+        problems.append(f"GUI-Module geladen: {', '.join(usage['loaded_modules'])}")
+    for problem in problems:
+        print(f"Budget überschritten: {problem}")
+    return 1 if problems else 0
+
+
+def run_metrics_load_test(daemon: CollectorDaemon, duration: float, concurrency: int) -> int:
+    """Lasttest gegen den Metrics-Endpoint, während der Collector weiter erfasst"""
+    from utils.metrics_server import run_load_test, format_load_test
+
+    if daemon.metrics_server is None and not daemon.start_metrics_server(port=0):
+        return 1
+    server = daemon.metrics_server
+    host = "127.0.0.1" if server.host in ("0.0.0.0", "::", "") else server.host
+
+    daemon.logger.start_logging()
+    try:
+        result = run_load_test(host, server.port, concurrency=concurrency, duration=duration)
+        stats = server.get_stats()
+    finally:
+        daemon.stop()
+
+    print(f"Lasttest: {format_load_test(result)}")
+    print(f"Endpoint: {stats['requests']} Anfragen, {stats['encodes']} Kodierungen "
+          f"bei {daemon.sampler.sample_count} Samples")
+    return 1 if result["errors"] else 0
+
+
+def parse_args(argv=None):
+    """Kommandozeilen-Argumente"""
+    parser = argparse.ArgumentParser(
+        description="SystemMonitorX - Headless Collector (Datenerfassung und Logging ohne GUI)"
+    )
+    parser.add_argument("--logs-dir", default="logs", help="Zielverzeichnis der Log-Dateien")
+    parser.add_argument("--interval", type=int, metavar="MS",
+                        help="Abtast-Intervall in ms (Standard: logging.log_interval)")
+    parser.add_argument("--benchmark", type=float, nargs="?", const=60.0, metavar="SEKUNDEN",
+                        help="Für eine feste Dauer (Standard 60 s) laufen, CPU/RSS messen "
+                             "und gegen das Budget prüfen")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="Metrics-Endpoint (Prometheus/JSON) auf diesem Port starten "
+                             "(Standard: metrics_server in der Konfiguration)")
+    parser.add_argument("--load-test", type=float, nargs="?", const=10.0, metavar="SEKUNDEN",
+                        help="Lasttest gegen den Metrics-Endpoint (Standard 10 s) und beenden")
+    parser.add_argument("--publish", nargs="?", const="", metavar="PFAD",
+                        help="Snapshots über einen Unix-Socket verteilen "
+                             "(Standard-Pfad: publisher.socket_path oder Temp-Verzeichnis)")
+    parser.add_argument("--shared-memory", nargs="?", const="", metavar="NAME",
+                        help="Letzten Snapshot und Ringpuffer ins Shared Memory schreiben "
+                             "(Standard-Name: shared_memory.name oder systemmonitorx-<uid>)")
+    parser.add_argument("--agent-port", type=int, nargs="?", const=9470, metavar="PORT",
+                        help="Agent-Modus: Snapshots per TCP für die Flotten-Ansicht verteilen "
+                             "(Standard-Port 9470)")
+    parser.add_argument("--agent-host", default="127.0.0.1",
+                        help="Adresse des Agent-Modus (Standard 127.0.0.1, 0.0.0.0 für alle)")
+    parser.add_argument("--scrapers", type=int, default=100,
+                        help="Parallele Scraper im Lasttest (Standard 100)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    args = parse_args(argv)
+
+    daemon = CollectorDaemon(ConfigManager(), logs_dir=args.logs_dir, interval_ms=args.interval)
+    daemon.install_signal_handlers()
+
+    if args.metrics_port is not None or daemon.config_manager.get_metrics_server_config().get("enabled", False):
+        daemon.start_metrics_server(port=args.metrics_port)
+
+    if args.publish is not None or daemon.config_manager.get_publisher_config().get("enabled", False):
+        daemon.start_publisher(args.publish or None)
+
+    if args.shared_memory is not None or daemon.config_manager.get_shared_memory_config().get("enabled", False):
+        daemon.start_shared_snapshot(args.shared_memory or None)
+
+    if args.agent_port is not None:
+        daemon.start_agent(args.agent_host, args.agent_port)
+
+    if args.load_test is not None:
+        return run_metrics_load_test(daemon, args.load_test, args.scrapers)
+
+    if args.benchmark is not None:
+        return run_benchmark(daemon, args.benchmark)
+
+    daemon.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
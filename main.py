@@ -10,6 +10,8 @@ Version: 1.0.0
 
 import sys
 import os
+import time
+import threading
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, 
     QHBoxLayout, QGridLayout, QLabel, QPushButton,
@@ -17,7 +19,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import (
     Qt, QTimer, QThread, pyqtSignal, QPropertyAnimation,
-    QEasingCurve, QRect
+    QEasingCurve, QRect, QEvent
 )
 from PyQt6.QtGui import (
     QPalette, QColor, QFont, QPixmap, QIcon,
@@ -27,122 +29,206 @@ import psutil
 import json
 from datetime import datetime
 
-# Theme-Farben (Dark Mode)
-THEME_COLORS = {
-    'background': '#141414',
-    'accent': '#4a307d',
-    'text': '#f2ecfa',
-    'text_secondary': '#a0a0a0',
-    'card_background': '#1e1e1e',
-    'progress_background': '#2a2a2a'
-}
-
 class SystemMonitorX(QMainWindow):
     """
     Hauptfenster der SystemMonitorX Anwendung
     Dashboard mit System-Monitoring in Echtzeit
     """
     
-    def __init__(self):
+    # Schwere Module (pystray, PIL) wurden im Hintergrund geladen
+    services_preloaded = pyqtSignal()
+    
+    def __init__(self, tray_only: bool = False, startup_metrics=None):
         super().__init__()
         self.setWindowTitle("SystemMonitorX")
+        
+        # Tray-Only: Dashboard wird erst beim ersten Anzeigen aufgebaut
+        self.tray_only = tray_only
+        self.ui_ready = False
         self.setMinimumSize(800, 600)
         
+        # Time-to-First-Frame und Dauer der Start-Phasen
+        from utils.startup import StartupMetrics
+        self.startup_metrics = startup_metrics or StartupMetrics("tray-only" if tray_only else "dashboard")
+        self.first_frame_shown = False
+        self.services_ready = False
+        
         # Konfigurations-System initialisieren
         from utils.config import ConfigManager
         self.config_manager = ConfigManager()
         
-        # Logging-System initialisieren
-        from utils.logging import SystemLogger
-        self.logger = SystemLogger()
-        self.logging_active = False
+        # Dirty-Check für Karten-Updates
+        from utils.bindings import ui_binder
+        self.binder = ui_binder
         
-        # System-Tray initialisieren
-        from utils.system_tray import SystemTrayIcon
-        self.tray_icon = SystemTrayIcon(self.config_manager)
+        # Gleitende Statistik für die Dashboard-Karten
+        from utils.statistics import RollingStatistics
+        self.card_statistics = {
+            'cpu': RollingStatistics(),
+            'ram': RollingStatistics(),
+            'disk': RollingStatistics()
+        }
+        
+        # Logger und System-Tray folgen nach dem ersten Frame (setup_services)
+        self.logger = None
+        self.logging_active = False
+        self.tray_icon = None
+        self.services_preloaded.connect(self.setup_services)
         
         # Theme und Styling
-        self.setup_theme()
-        self.setup_ui()
-        self.setup_monitoring()
-        self.setup_system_tray()
+        if not tray_only:
+            with self.startup_metrics.phase("setup_dashboard"):
+                self.setup_dashboard()
+        with self.startup_metrics.phase("setup_monitoring"):
+            self.setup_monitoring()
         
         # Fenster-Eigenschaften
         self.setWindowFlags(Qt.WindowType.Window)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, False)
         
-    def setup_theme(self):
-        """Dark Mode Theme konfigurieren"""
-        # Palette für Dark Mode
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(THEME_COLORS['background']))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Base, QColor(THEME_COLORS['card_background']))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(THEME_COLORS['background']))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Text, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Button, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Link, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(THEME_COLORS['text']))
-        
-        self.setPalette(palette)
-        
-        # Stylesheet für abgerundete Ecken und moderne Optik
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #141414;
-                border-radius: 10px;
-            }
-            
-            QFrame {
-                background-color: #1e1e1e;
-                border-radius: 8px;
-                border: 1px solid #2a2a2a;
-            }
-            
-            QLabel {
-                color: #f2ecfa;
-                font-family: 'Consolas', monospace;
-                font-size: 12px;
-            }
+        if tray_only:
+            # Der Tray ist hier die einzige Oberfläche: sofort einrichten
+            self.setup_services()
+            self.setup_tray_only()
             
-            QPushButton {
-                background-color: #4a307d;
-                color: #f2ecfa;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-family: 'Consolas', monospace;
-                font-size: 12px;
-                font-weight: bold;
-            }
+    def paintEvent(self, event):
+        """Erster Frame: Metrik festhalten und restliche Subsysteme nachladen"""
+        super().paintEvent(event)
+        if not self.first_frame_shown:
+            self.first_frame_shown = True
+            self.startup_metrics.mark_first_frame()
+            QTimer.singleShot(0, self.preload_services)
             
-            QPushButton:hover {
-                background-color: #5a408d;
-            }
+    def preload_services(self):
+        """pystray und PIL im Hintergrund importieren, Einrichtung danach im GUI-Thread"""
+        if self.services_ready:
+            return
+        self.services_started = time.perf_counter()
+        threading.Thread(target=self._import_service_modules, daemon=True).start()
+        
+    def _import_service_modules(self):
+        """Tray-Module importieren (Hintergrund-Thread)"""
+        try:
+            import utils.system_tray
+            import utils.logging
+        except Exception as e:
+            print(f"Fehler beim Laden der Tray-Module: {e}")
+        self.services_preloaded.emit()
+        
+    def setup_services(self):
+        """Logger und System-Tray einrichten (nach dem ersten Frame)"""
+        if self.services_ready:
+            return
+        self.services_ready = True
+        started = getattr(self, 'services_started', time.perf_counter())
+        
+        with self.startup_metrics.phase("setup_services"):
+            self.setup_logger()
+            self.setup_metrics_server()
+            self.setup_publisher()
+            self.setup_shared_snapshot()
+            try:
+                from utils.system_tray import SystemTrayIcon
+                self.tray_icon = SystemTrayIcon(self.config_manager)
+                self.setup_system_tray()
+            except Exception as e:
+                print(f"Fehler beim Einrichten des System-Trays: {e}")
+                
+        # Im Tray-Only-Modus ist das Tray-Icon der erste Frame
+        self.startup_metrics.mark_first_frame()
+        self.startup_metrics.mark_deferred_done(started)
+        print(f"Startup: {self.startup_metrics.format_summary()}")
+        self.startup_metrics.write_csv()
+        
+    def setup_metrics_server(self):
+        """Lokalen Metrics-Endpoint starten (falls in der Konfiguration aktiviert)"""
+        self.metrics_server = None
+        if not self.config_manager.get_metrics_server_config().get("enabled", False):
+            return
+        from utils.metrics_server import start_from_config
+        self.metrics_server = start_from_config(self.refresh_coordinator.sampler, self.config_manager)
+        
+    def setup_publisher(self):
+        """Snapshot-Publisher (Unix-Socket) starten (falls in der Konfiguration aktiviert)"""
+        self.publisher = None
+        if not self.config_manager.get_publisher_config().get("enabled", False):
+            return
+        from utils.publisher import start_from_config
+        self.publisher = start_from_config(self.refresh_coordinator.sampler, self.config_manager)
+        
+    def setup_shared_snapshot(self):
+        """Snapshots ins Shared Memory schreiben (falls in der Konfiguration aktiviert)"""
+        self.shared_snapshot = None
+        if not self.config_manager.get_shared_memory_config().get("enabled", False):
+            return
+        from utils.shared_snapshot import start_from_config
+        self.shared_snapshot = start_from_config(self.refresh_coordinator.sampler, self.config_manager)
+        
+    def setup_logger(self):
+        """Logging-System einrichten (einmalig)"""
+        if self.logger is not None:
+            return
+        from utils.logging import SystemLogger
+        # Gemeinsamer Sampler und Takt: Logging ohne eigenen Thread und psutil-Aufrufe
+        logging_config = self.config_manager.get_logging_config()
+        self.logger = SystemLogger(sampler=self.refresh_coordinator.sampler,
+                                   history_retention_days=logging_config.get("history_retention_days", 14))
+        self.rate_control.register("logging", self.set_log_interval)
+        
+    def set_log_interval(self, interval_ms: int):
+        """Log-Intervall setzen (bei aktivem Logging auch die Rate des Verbrauchers)"""
+        self.logger.set_interval(interval_ms)
+        if self.logging_active:
+            self.refresh_coordinator.add_consumer("logging", self.logger.log_snapshot,
+                                                  int(self.logger.interval * 1000))
             
-            QPushButton:pressed {
-                background-color: #3a206d;
-            }
+    def setup_dashboard(self):
+        """Theme und Dashboard-Oberfläche aufbauen"""
+        self.setup_theme()
+        self.setup_ui()
+        self.ui_ready = True
+        
+    def ensure_dashboard(self):
+        """Dashboard beim ersten Anzeigen aufbauen (Tray-Only-Modus)"""
+        if self.ui_ready:
+            return
+        started = time.perf_counter()
+        self.setup_dashboard()
+        
+        latest = self.refresh_coordinator.sampler.get_latest()
+        if latest:
+            self.update_system_data(latest)
+        print(f"Dashboard aufgebaut in {(time.perf_counter() - started) * 1000:.0f} ms")
+        
+    def setup_tray_only(self):
+        """Nur Collector, Tray und optional Logger; Ressourcen-Budget messen"""
+        if self.tray_icon is None or not self.tray_icon.is_tray_active():
+            # Ohne Tray wäre die App unerreichbar
+            print("Tray nicht verfügbar - Dashboard wird angezeigt")
+            self.show_main_window()
+            return
             
-            QProgressBar {
-                border: 2px solid #2a2a2a;
-                border-radius: 6px;
-                text-align: center;
-                background-color: #2a2a2a;
-                color: #f2ecfa;
-                font-family: 'Consolas', monospace;
-                font-size: 11px;
-            }
+        if self.config_manager.get_logging_config().get("enabled", False):
+            self.toggle_logging()
             
-            QProgressBar::chunk {
-                background-color: #4a307d;
-                border-radius: 4px;
-            }
-        """)
+        self.update_power_mode()
+        
+        # Verbrauch nach der Anlaufphase gegen das Budget prüfen
+        from utils.resources import ResourceBudget
+        self.resource_budget = ResourceBudget()
+        QTimer.singleShot(30000, self.report_resource_usage)
+        
+    def report_resource_usage(self):
+        """Ressourcen-Verbrauch ausgeben und Budget prüfen"""
+        usage = self.resource_budget.measure()
+        print(f"Ressourcen: {self.resource_budget.format_report(usage)}")
+        for violation in self.resource_budget.check(usage):
+            print(f"Ressourcen-Budget überschritten: {violation}")
+        
+    def setup_theme(self):
+        """Dark Mode Theme app-weit anwenden (einmalig)"""
+        from utils.theme import get_theme_service
+        self.theme = get_theme_service(self.config_manager)
         
     def setup_ui(self):
         """Benutzeroberfläche erstellen"""
@@ -269,11 +355,21 @@ class SystemMonitorX(QMainWindow):
         """)
         
         layout.addWidget(details_label)
+        
+        # Statistik (Ø, p95, p99 der letzten Minute)
+        stats_label = QLabel("")
+        stats_label.setStyleSheet("""
+            font-size: 11px;
+            color: #a0a0a0;
+        """)
+        
+        layout.addWidget(stats_label)
         layout.addStretch()
         
         # Speichere Referenzen für Updates
         card.progress_bar = progress_bar
         card.details_label = details_label
+        card.stats_label = stats_label
         
         return card
         
@@ -297,6 +393,10 @@ class SystemMonitorX(QMainWindow):
         graphs_button.setIcon(QIcon("assets/icons/buttons/graphs.png"))
         graphs_button.clicked.connect(self.open_graphs)
         
+        # Flotten-Button (Collector-Agents per TCP)
+        fleet_button = QPushButton("Flotte")
+        fleet_button.clicked.connect(lambda: self.open_fleet())
+        
         # Einstellungen-Button
         settings_button = QPushButton("Einstellungen")
         settings_button.setIcon(QIcon("assets/icons/buttons/settings.png"))
@@ -305,19 +405,38 @@ class SystemMonitorX(QMainWindow):
         button_layout.addWidget(widget_button)
         button_layout.addWidget(logging_button)
         button_layout.addWidget(graphs_button)
+        button_layout.addWidget(fleet_button)
         button_layout.addStretch()
         button_layout.addWidget(settings_button)
         
         parent_layout.addWidget(button_frame)
         
     def setup_monitoring(self):
-        """System-Monitoring Timer einrichten"""
-        self.monitoring_timer = QTimer()
-        self.monitoring_timer.timeout.connect(self.update_system_data)
-        self.monitoring_timer.start(1000)  # Jede Sekunde
+        """Gemeinsamen Refresh-Takt für Dashboard und Widgets einrichten"""
+        from utils.refresh import RefreshCoordinator
+        monitoring_config = self.config_manager.get_monitoring_config()
+        self.refresh_coordinator = RefreshCoordinator(
+            interval=1000,  # Jede Sekunde
+            low_power_interval=monitoring_config.get("low_power_interval", 5000)  # Nur im Tray
+        )
+        self.refresh_coordinator.register(self, self.update_system_data)
+        self.refresh_coordinator.start()
+        
+        # Konfigurierte Intervalle (Anzeige, Graphen, Logging) live anwenden
+        from utils.rate_control import RateController
+        self.rate_control = RateController(self.config_manager)
+        self.rate_control.register("display", self.refresh_coordinator.set_interval)
+        
+        # Desktop-Widgets: einmal erstellen, danach wiederverwenden
+        from widgets.registry import WidgetRegistry
+        self.widget_registry = WidgetRegistry(
+            self.refresh_coordinator, self.config_manager, on_closed=self.on_widget_closed
+        )
         
         # Initial Update
-        self.update_system_data()
+        snapshot = self.refresh_coordinator.sampler.sample()
+        if self.ui_ready:
+            self.update_system_data(snapshot)
         
     def setup_system_tray(self):
         """System-Tray einrichten"""
@@ -333,6 +452,9 @@ class SystemMonitorX(QMainWindow):
             self.tray_icon.toggle_logging.connect(self.toggle_logging)
             self.tray_icon.quit_app.connect(self.quit_application)
             
+            # Icon und Tooltip aus dem gemeinsamen Snapshot (kein eigener Thread)
+            self.refresh_coordinator.snapshot_ready.connect(self.tray_icon.on_snapshot)
+            
             print("System-Tray eingerichtet")
             
         except Exception as e:
@@ -340,6 +462,7 @@ class SystemMonitorX(QMainWindow):
             
     def show_main_window(self):
         """Hauptfenster anzeigen"""
+        self.ensure_dashboard()
         self.show()
         self.raise_()
         self.activateWindow()
@@ -348,88 +471,132 @@ class SystemMonitorX(QMainWindow):
         """Hauptfenster ausblenden"""
         self.hide()
         
+    def showEvent(self, event):
+        """Dashboard sichtbar: Low-Power-Modus prüfen"""
+        self.ensure_dashboard()
+        super().showEvent(event)
+        QTimer.singleShot(0, self.update_power_mode)
+        
+    def hideEvent(self, event):
+        """Dashboard versteckt: Low-Power-Modus prüfen"""
+        super().hideEvent(event)
+        QTimer.singleShot(0, self.update_power_mode)
+        
+    def changeEvent(self, event):
+        """Minimieren/Wiederherstellen: Low-Power-Modus prüfen"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            QTimer.singleShot(0, self.update_power_mode)
+            
+    def has_visible_views(self) -> bool:
+        """Ist irgendeine Ansicht (Dashboard, Widgets, Graphen) sichtbar?"""
+        if self.isVisible() and not self.isMinimized():
+            return True
+        for widget in self.widget_registry.widgets.values():
+            if widget.isVisible() and not widget.isMinimized():
+                return True
+        graph_window = getattr(self, 'graph_window', None)
+        return graph_window is not None and graph_window.isVisible() and not graph_window.isMinimized()
+        
+    def update_power_mode(self):
+        """Low-Power-Modus, solange nur der Tray läuft"""
+        if not hasattr(self, 'refresh_coordinator'):
+            return
+        low_power = not self.has_visible_views()
+        if low_power == self.refresh_coordinator.low_power:
+            return
+            
+        if low_power:
+            self.refresh_coordinator.set_low_power(True)
+            print(f"Low-Power-Modus aktiv (Takt: {self.refresh_coordinator.get_display_interval()} ms)")
+        else:
+            stats = self.refresh_coordinator.get_power_stats()
+            self.refresh_coordinator.set_low_power(False)
+            print(f"Low-Power-Modus beendet: {stats['wakeups']} Wakeups in "
+                  f"{stats['duration_s']:.0f} s ({stats['wakeups_per_second']:.2f}/s)")
+            # Sofort aktuelle Werte statt bis zum nächsten Takt zu warten
+            self.refresh_coordinator.tick(force=True)
+        
     def quit_application(self):
         """Anwendung beenden"""
-        if self.tray_icon.is_tray_active():
+        stats = self.binder.get_stats()
+        print(f"UI-Updates: {stats['applied']} angewendet, {stats['skipped']} übersprungen "
+              f"({stats['skipped_ratio']:.0%})")
+        self.widget_registry.close_all()
+        self.config_manager.flush()
+        if getattr(self, 'metrics_server', None) is not None:
+            self.metrics_server.stop()
+        if getattr(self, 'publisher', None) is not None:
+            self.publisher.stop()
+        if getattr(self, 'shared_snapshot', None) is not None:
+            self.shared_snapshot.stop()
+        if getattr(self, 'fleet_window', None) is not None:
+            self.fleet_window.close()
+        if self.tray_icon is not None and self.tray_icon.is_tray_active():
             self.tray_icon.hide_tray_icon()
         sys.exit(0)
         
-    def update_system_data(self):
-        """System-Daten aktualisieren"""
+    def update_system_data(self, snapshot):
+        """System-Daten aus dem Snapshot anzeigen"""
         try:
             # CPU-Daten
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            cpu_count = psutil.cpu_count()
-            cpu_freq = psutil.cpu_freq()
+            cpu_percent = snapshot["cpu_percent"]
+            cpu_freq_ghz = snapshot["cpu_freq_ghz"] or 0.0
             
-            self.cpu_card.progress_bar.setValue(int(cpu_percent))
-            self.cpu_card.details_label.setText(
-                f"Kerne: {cpu_count} | Frequenz: {cpu_freq.current:.1f} GHz"
+            self.binder.set_value(self.cpu_card.progress_bar, cpu_percent)
+            self.binder.set_text(
+                self.cpu_card.details_label,
+                f"Kerne: {snapshot['cpu_count']} | Frequenz: {cpu_freq_ghz:.1f} GHz"
             )
+            self.update_card_statistics(self.cpu_card, 'cpu', cpu_percent)
             
             # RAM-Daten
-            memory = psutil.virtual_memory()
-            ram_percent = memory.percent
-            ram_used_gb = memory.used / (1024**3)
-            ram_total_gb = memory.total / (1024**3)
+            ram_percent = snapshot["ram_percent"]
             
-            self.ram_card.progress_bar.setValue(int(ram_percent))
-            self.ram_card.details_label.setText(
-                f"Verwendet: {ram_used_gb:.1f} GB / {ram_total_gb:.1f} GB"
+            self.binder.set_value(self.ram_card.progress_bar, ram_percent)
+            self.binder.set_text(
+                self.ram_card.details_label,
+                f"Verwendet: {snapshot['ram_used_gb']:.1f} GB / {snapshot['ram_total_gb']:.1f} GB"
             )
+            self.update_card_statistics(self.ram_card, 'ram', ram_percent)
             
             # Disk-Daten
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
-            disk_used_gb = disk.used / (1024**3)
-            disk_total_gb = disk.total / (1024**3)
+            disk_percent = snapshot["disk_percent"]
             
-            self.disk_card.progress_bar.setValue(int(disk_percent))
-            self.disk_card.details_label.setText(
-                f"Verwendet: {disk_used_gb:.1f} GB / {disk_total_gb:.1f} GB"
+            self.binder.set_value(self.disk_card.progress_bar, disk_percent)
+            self.binder.set_text(
+                self.disk_card.details_label,
+                f"Verwendet: {snapshot['disk_used_gb']:.1f} GB / {snapshot['disk_total_gb']:.1f} GB"
             )
+            self.update_card_statistics(self.disk_card, 'disk', disk_percent)
             
             # System-Daten
-            platform = sys.platform
-            username = os.getlogin()
-            
-            self.system_card.progress_bar.setValue(100)  # System läuft
-            self.system_card.details_label.setText(
-                f"OS: {platform} | Benutzer: {username}"
+            self.binder.set_value(self.system_card.progress_bar, 100)  # System läuft
+            self.binder.set_text(
+                self.system_card.details_label,
+                f"OS: {snapshot['platform']} | Benutzer: {snapshot['username']}"
             )
             
         except Exception as e:
             print(f"Fehler beim Update der System-Daten: {e}")
             
+    def update_card_statistics(self, card, key: str, value: float):
+        """Gleitende Kennzahlen einer Karte fortschreiben und anzeigen"""
+        stats = self.card_statistics[key]
+        stats.add(value)
+        summary = stats.get_summary()
+        self.binder.set_text(
+            card.stats_label,
+            f"Ø {summary['mean']:.1f}% | p95 {summary['p95']:.0f}% | p99 {summary['p99']:.0f}%"
+        )
+            
     def open_widgets(self):
-        """Desktop-Widgets öffnen"""
+        """Desktop-Widgets öffnen (bestehende werden wiederverwendet)"""
         print("Desktop-Widgets werden geöffnet...")
         
-        # Widgets importieren
         try:
-            from widgets.cpu_widget import CPUWidget
-            from widgets.ram_widget import RAMWidget
-            from widgets.disk_widget import DiskWidget
-            from widgets.system_widget import SystemWidget
-            
-            # Widgets erstellen und anzeigen
-            self.cpu_widget = CPUWidget()
-            self.ram_widget = RAMWidget()
-            self.disk_widget = DiskWidget()
-            self.system_widget = SystemWidget()
-            
-            # Widgets anzeigen
-            self.cpu_widget.show()
-            self.ram_widget.show()
-            self.disk_widget.show()
-            self.system_widget.show()
-            
-            # Widget-Schließung behandeln
-            self.cpu_widget.widget_closed.connect(self.on_widget_closed)
-            self.ram_widget.widget_closed.connect(self.on_widget_closed)
-            self.disk_widget.widget_closed.connect(self.on_widget_closed)
-            self.system_widget.widget_closed.connect(self.on_widget_closed)
-            
+            self.widget_registry.show_all()
+            self.update_power_mode()
             print("Alle Desktop-Widgets wurden geöffnet!")
             
         except Exception as e:
@@ -438,16 +605,21 @@ class SystemMonitorX(QMainWindow):
     def on_widget_closed(self, widget_type):
         """Widget wurde geschlossen"""
         print(f"Widget {widget_type} wurde geschlossen")
+        QTimer.singleShot(0, self.update_power_mode)
         
     def toggle_logging(self):
         """Daten-Logging starten/stoppen"""
+        self.setup_logger()
         if not self.logging_active:
-            # Logging starten
-            self.logger.start_logging()
+            # Logging starten (Snapshots aus dem gemeinsamen Takt, in der Log-Rate)
+            self.logger.start_logging(threaded=False)
             self.logging_active = True
+            self.refresh_coordinator.add_consumer("logging", self.logger.log_snapshot,
+                                                  int(self.logger.interval * 1000))
             print("Daten-Logging gestartet")
         else:
             # Logging stoppen
+            self.refresh_coordinator.remove_consumer("logging")
             self.logger.stop_logging()
             self.logging_active = False
             print("Daten-Logging gestoppt")
@@ -456,42 +628,141 @@ class SystemMonitorX(QMainWindow):
         """Graphen öffnen"""
         print("Graphen werden geöffnet...")
         try:
-            from windows.graph_window import GraphWindow
-            self.graph_window = GraphWindow()
-            self.graph_window.show()
-            print("Graph-Fenster geöffnet!")
+            started = time.perf_counter()
+            if getattr(self, 'graph_window', None) is None:
+                from windows.graph_window import GraphWindow
+                self.graph_window = GraphWindow(self.config_manager, self.rate_control, self.refresh_coordinator)
+                # Beim Schließen werden die Figures freigegeben: danach neu aufbauen
+                self.graph_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+                self.graph_window.window_closed.connect(self.on_graphs_closed)
+                
+            # Offenes Fenster wiederverwenden und in den Vordergrund holen
+            if self.graph_window.isMinimized():
+                self.graph_window.showNormal()
+            else:
+                self.graph_window.show()
+            self.graph_window.raise_()
+            self.graph_window.activateWindow()
+            self.update_power_mode()
+            print(f"Graph-Fenster geöffnet! ({(time.perf_counter() - started) * 1000:.0f} ms)")
         except Exception as e:
             print(f"Fehler beim Öffnen der Graphen: {e}")
+            
+    def on_graphs_closed(self):
+        """Graph-Fenster wurde geschlossen"""
+        self.graph_window = None
+        QTimer.singleShot(0, self.update_power_mode)
+        
+    def open_fleet(self, agents=None):
+        """Flotten-Ansicht öffnen (Agents aus --fleet oder der Konfiguration)"""
+        print("Flotten-Ansicht wird geöffnet...")
+        try:
+            fleet_window = getattr(self, 'fleet_window', None)
+            if fleet_window is not None and agents is not None:
+                # Andere Agents: alte Verbindungen trennen und neu aufbauen
+                from utils.fleet import parse_agents
+                if parse_agents(agents) != fleet_window.agents:
+                    fleet_window.close()
+                    
+            if getattr(self, 'fleet_window', None) is None:
+                from windows.fleet_window import FleetWindow
+                self.fleet_window = FleetWindow(self.config_manager, agents)
+                self.fleet_window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+                self.fleet_window.window_closed.connect(self.on_fleet_closed)
+                if not self.fleet_window.agents:
+                    print("Keine Agents konfiguriert (fleet.agents oder --fleet HOST:PORT,...)")
+                    
+            # Offenes Fenster wiederverwenden und in den Vordergrund holen
+            if self.fleet_window.isMinimized():
+                self.fleet_window.showNormal()
+            else:
+                self.fleet_window.show()
+            self.fleet_window.raise_()
+            self.fleet_window.activateWindow()
+            print(f"Flotten-Ansicht geöffnet! ({len(self.fleet_window.agents)} Agents)")
+        except Exception as e:
+            print(f"Fehler beim Öffnen der Flotten-Ansicht: {e}")
+            
+    def on_fleet_closed(self):
+        """Flotten-Ansicht wurde geschlossen (Verbindungen sind getrennt)"""
+        self.fleet_window = None
         
     def open_settings(self):
         """Einstellungen öffnen"""
         print("Einstellungen werden geöffnet...")
         try:
+            started = time.perf_counter()
             from windows.settings_window import SettingsWindow
             self.settings_window = SettingsWindow(self.config_manager)
             self.settings_window.settings_changed.connect(self.on_settings_changed)
             self.settings_window.show()
-            print("Einstellungen-Fenster geöffnet!")
+            print(f"Einstellungen-Fenster geöffnet! ({(time.perf_counter() - started) * 1000:.0f} ms)")
         except Exception as e:
             print(f"Fehler beim Öffnen der Einstellungen: {e}")
             
     def on_settings_changed(self):
         """Einstellungen wurden geändert"""
         print("Einstellungen wurden geändert - Anwendung wird aktualisiert...")
-        # TODO: Theme und andere Einstellungen anwenden
+        self.rate_control.apply()
+        
+        # Theme app-weit neu setzen (ein Repolish, nur bei geänderten Farben)
+        from utils.theme import get_theme_service
+        theme = get_theme_service(self.config_manager)
+        if theme.apply():
+            print(f"Theme angewendet in {theme.last_apply_ms:.1f} ms")
+
+def parse_args(argv=None):
+    """Kommandozeilen-Argumente (Qt-Argumente werden durchgereicht)"""
+    import argparse
+    parser = argparse.ArgumentParser(description="SystemMonitorX - System-Monitoring")
+    parser.add_argument("--tray-only", action="store_true",
+                        help="Nur Tray (und Logger) starten, Dashboard erst bei Bedarf laden")
+    parser.add_argument("--profile", type=float, nargs="?", const=30.0, metavar="SEKUNDEN",
+                        help="Importe, Setup-Phasen und Timer-Slots profilieren "
+                             "(Fenster in Sekunden, Standard 30) und Report schreiben")
+    parser.add_argument("--fleet", metavar="HOST:PORT,...",
+                        help="Flotten-Ansicht für diese Collector-Agents beim Start öffnen")
+    return parser.parse_known_args(argv)
 
 def main():
     """Hauptfunktion"""
-    app = QApplication(sys.argv)
+    args, qt_args = parse_args()
+    
+    # Profiling vor allen weiteren Importen starten
+    profiler = None
+    if args.profile is not None:
+        from utils.profiling import ProfileSession
+        profiler = ProfileSession(window_seconds=args.profile)
+        profiler.instrument(SystemMonitorX)
+        
+    from utils.startup import StartupMetrics
+    startup_metrics = StartupMetrics()
+    
+    app = QApplication([sys.argv[0]] + qt_args)
     
     # App-Eigenschaften
     app.setApplicationName("SystemMonitorX")
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("SystemMonitorX Team")
     
-    # Hauptfenster erstellen und anzeigen
-    window = SystemMonitorX()
-    window.show()
+    # Hauptfenster erstellen und anzeigen (im Tray-Only-Modus nur den Tray)
+    if args.tray_only:
+        app.setQuitOnLastWindowClosed(False)
+    startup_metrics.mode = "tray-only" if args.tray_only else "dashboard"
+    window = SystemMonitorX(tray_only=args.tray_only, startup_metrics=startup_metrics)
+    if not args.tray_only:
+        window.show()
+    if args.fleet:
+        window.open_fleet(args.fleet)
+    
+    # Ausstehende Widget-Positionen beim Beenden schreiben
+    app.aboutToQuit.connect(window.config_manager.flush)
+    
+    # Timer-Slots über das gewählte Fenster profilieren
+    if profiler is not None:
+        QTimer.singleShot(0, profiler.start_window)
+        QTimer.singleShot(int(args.profile * 1000), lambda: profiler.finish(window.startup_metrics))
+        app.aboutToQuit.connect(lambda: profiler.finish(window.startup_metrics))
     
     # Event-Loop starten
     sys.exit(app.exec())
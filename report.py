@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Report-Generator
+Headless PNG/SVG-Reports aus den Log-Daten (ohne GUI)
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import argparse
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Dict, List, Any
+
+GRAPH_TYPES = ["overview", "cpu", "ram", "disk"]
+REPORT_FORMATS = ["png", "svg"]
+
+
+def _init_worker():
+    """Worker-Prozess auf das Agg-Backend festlegen"""
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def render_figure(graph_type: str, data_points: List[Dict[str, Any]], output_path: str) -> str:
+    """Eine Figure im Worker-Prozess rendern und speichern"""
+    _init_worker()
+    from utils.graphs import SystemGraphs
+
+    graphs = SystemGraphs()
+    fig = graphs.create_figure(graph_type)
+    graphs.bind_points(fig, data_points)
+    fig.savefig(output_path, facecolor=fig.get_facecolor())
+    fig.clear()
+    return output_path
+
+
+def load_report_data(logs_dir: str, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+    """Datenpunkte für den Zeitraum aus logs/ laden"""
+    from utils.history import LogHistoryStore, HISTORY_KEYS
+
+    store = LogHistoryStore(logs_dir=logs_dir)
+    tile_data = store.get_range(start.timestamp(), end.timestamp())
+
+    data_points = []
+    for i, timestamp in enumerate(tile_data["timestamps"]):
+        data_point = {"timestamp": datetime.fromtimestamp(timestamp)}
+        for key in HISTORY_KEYS:
+            data_point[key] = tile_data[key][i]
+        data_points.append(data_point)
+
+    return data_points
+
+
+def parse_args(argv=None):
+    """Kommandozeilen-Argumente"""
+    parser = argparse.ArgumentParser(
+        description="SystemMonitorX - Headless Reports aus logs/ rendern"
+    )
+    parser.add_argument("--date", help="Tag im Format YYYY-MM-DD (Standard: heute)")
+    parser.add_argument("--start", help="Beginn (ISO-Format), überschreibt --date")
+    parser.add_argument("--end", help="Ende (ISO-Format), überschreibt --date")
+    parser.add_argument("--logs-dir", default="logs", help="Verzeichnis mit Log-Dateien")
+    parser.add_argument("--output-dir", default="reports", help="Zielverzeichnis")
+    parser.add_argument("--host", default=platform.node() or "localhost",
+                        help="Hostname im Dateinamen")
+    parser.add_argument("--types", default=",".join(GRAPH_TYPES),
+                        help="Graph-Typen, kommagetrennt")
+    parser.add_argument("--formats", default="png",
+                        help="Ausgabeformate, kommagetrennt (png, svg)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Anzahl Worker-Prozesse")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Hauptfunktion"""
+    args = parse_args(argv)
+
+    # Zeitraum bestimmen
+    day = datetime.strptime(args.date, "%Y-%m-%d") if args.date else \
+        datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = datetime.fromisoformat(args.start) if args.start else day
+    end = datetime.fromisoformat(args.end) if args.end else start + timedelta(days=1)
+
+    graph_types = [t.strip() for t in args.types.split(",") if t.strip()]
+    formats = [f.strip().lower() for f in args.formats.split(",") if f.strip()]
+    for graph_type in graph_types:
+        if graph_type not in GRAPH_TYPES:
+            print(f"Unbekannter Graph-Typ: {graph_type}")
+            return 2
+    for fmt in formats:
+        if fmt not in REPORT_FORMATS:
+            print(f"Unbekanntes Format: {fmt}")
+            return 2
+
+    data_points = load_report_data(args.logs_dir, start, end)
+    if not data_points:
+        print(f"Keine Log-Daten zwischen {start.isoformat()} und {end.isoformat()} gefunden")
+        return 1
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    stamp = start.strftime("%Y%m%d")
+
+    jobs = []
+    for graph_type in graph_types:
+        for fmt in formats:
+            filename = f"{args.host}_{graph_type}_{stamp}.{fmt}"
+            jobs.append((graph_type, os.path.join(args.output_dir, filename)))
+
+    print(f"Rendere {len(jobs)} Figures aus {len(data_points)} Datenpunkten "
+          f"mit {args.workers} Worker-Prozessen...")
+
+    started = time.perf_counter()
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as executor:
+        futures = {
+            executor.submit(render_figure, graph_type, data_points, output_path): output_path
+            for graph_type, output_path in jobs
+        }
+        for future in as_completed(futures):
+            try:
+                print(f"Report gespeichert: {future.result()}")
+            except Exception as e:
+                failed += 1
+                print(f"Fehler beim Rendern von {futures[future]}: {e}")
+    elapsed = time.perf_counter() - started
+
+    rendered = len(jobs) - failed
+    throughput = rendered / elapsed if elapsed > 0 else 0.0
+    print(f"{rendered} Figures in {elapsed:.2f} s gerendert ({throughput:.2f} Figures/s)")
+
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
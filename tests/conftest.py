@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Test-Konfiguration
+Headless-Umgebung (Qt offscreen, Matplotlib Agg) und Projektpfad für pytest
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import os
+import sys
+import types
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Vor dem ersten Qt-/Matplotlib-/pystray-Import setzen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("MPLBACKEND", "Agg")
+# pystray ohne Desktop (der Tray selbst wird in den Tests ersetzt)
+os.environ.setdefault("PYSTRAY_BACKEND", "dummy")
+
+
+@pytest.fixture
+def qapp():
+    """Gemeinsame QApplication (offscreen)"""
+    pytest.importorskip("PyQt6")
+    from PyQt6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Eigenes Arbeitsverzeichnis, damit config/ und logs/ nicht im Repository landen"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class FakeClock:
+    """Monotone Uhr, die der Test selbst weiterstellt"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def run(self, coordinator, seconds: float) -> int:
+        """Timer-Ablauf nachstellen: Uhr bis zum gestellten Zeitpunkt vorstellen, dann tick()"""
+        end = self.now + seconds
+        wakeups = 0
+        while True:
+            step = coordinator.timer.interval() / 1000
+            if self.now + step > end + 1e-9:
+                return wakeups
+            self.now += step
+            coordinator.tick()
+            wakeups += 1
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Uhr des Refresh-Koordinators durch eine FakeClock ersetzen"""
+    import utils.refresh
+    clock = FakeClock()
+    monkeypatch.setattr(utils.refresh, "time", types.SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+@pytest.fixture
+def theme(qapp, workdir, monkeypatch):
+    """Eigener Theme-Service; App-Palette und -Stylesheet danach wiederherstellen"""
+    import utils.theme
+    from utils.config import ConfigManager
+    palette, stylesheet = qapp.palette(), qapp.styleSheet()
+    monkeypatch.setattr(utils.theme, "_theme_service", None)
+    yield utils.theme.get_theme_service(ConfigManager())
+    qapp.setPalette(palette)
+    qapp.setStyleSheet(stylesheet)
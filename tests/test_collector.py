@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Headless-Collector
+Benchmark im Budget ohne GUI-Module, SIGTERM schreibt den Buffer
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COLLECTOR = os.path.join(ROOT, "collector.py")
+
+# CPU-Zeit zählt in Ticks von 10 ms: bei 3 s wären das schon 0.33 % pro Tick (Budget 0.5 %)
+BENCHMARK_SECONDS = 8
+
+# Start des Collectors (Interpreter, Imports) bis "Collector läuft"
+START_TIMEOUT = 30.0
+
+
+def collector_env():
+    """Ungepufferte Ausgabe, damit der Test die Zeilen sofort sieht"""
+    return dict(os.environ, PYTHONUNBUFFERED="1")
+
+
+def test_benchmark_stays_within_budget(tmp_path):
+    completed = subprocess.run(
+        [sys.executable, COLLECTOR, "--benchmark", str(BENCHMARK_SECONDS), "--logs-dir", str(tmp_path / "logs")],
+        cwd=tmp_path, env=collector_env(), capture_output=True, text=True,
+        timeout=BENCHMARK_SECONDS + 60
+    )
+    output = completed.stdout
+
+    assert completed.returncode == 0, f"{output}\n{completed.stderr}"
+    assert "Budget überschritten" not in output
+    # Keine GUI-Module (PyQt6, matplotlib, pystray, PIL) im Collector-Prozess
+    assert "Geladen: keine" in output
+    assert "Benchmark:" in output
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGTERM") or os.name != "posix", reason="Signale nur unter POSIX")
+def test_sigterm_flushes_buffer(tmp_path):
+    logs_dir = tmp_path / "logs"
+    process = subprocess.Popen(
+        [sys.executable, COLLECTOR, "--interval", "200", "--logs-dir", str(logs_dir)],
+        cwd=tmp_path, env=collector_env(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    try:
+        deadline = time.monotonic() + START_TIMEOUT
+        lines = []
+        while time.monotonic() < deadline:
+            line = process.stdout.readline()
+            if not line:
+                break
+            lines.append(line)
+            if line.startswith("Collector läuft"):
+                break
+        assert lines and lines[-1].startswith("Collector läuft"), "".join(lines)
+
+        # Einige Samples, aber weit unter der Buffer-Größe (60): nur das Beenden schreibt sie
+        time.sleep(1.5)
+        assert not [name for name in os.listdir(logs_dir) if name.endswith(".json")]
+        process.send_signal(signal.SIGTERM)
+        output, _ = process.communicate(timeout=30)
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+    assert process.returncode == 0, output
+    assert "Signal SIGTERM empfangen" in output
+
+    json_files = [name for name in os.listdir(logs_dir) if name.endswith(".json")]
+    assert len(json_files) == 1
+    with open(logs_dir / json_files[0], encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["metadata"]["entries"] == len(data["data"]) >= 3
+    assert os.listdir(logs_dir / "history")
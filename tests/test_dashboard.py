@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Dashboard
+Dirty-Check der Karten-Updates, Low-Power-Modus im Tray
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+
+def count_qt_updates(monkeypatch, widgets):
+    """setText/setValue-Aufrufe auf Labels und Progress-Bars zählen"""
+    counts = {"calls": 0}
+    for widget in widgets:
+        for name in ("setText", "setValue"):
+            method = getattr(widget, name, None)
+            if method is None:
+                continue
+
+            def counting(*args, method=method):
+                counts["calls"] += 1
+                return method(*args)
+
+            monkeypatch.setattr(widget, name, counting)
+    return counts
+
+
+def test_binder_skips_unchanged_values(qapp, monkeypatch):
+    from PyQt6.QtWidgets import QLabel, QProgressBar
+    from utils.bindings import UIBinder
+
+    binder = UIBinder()
+    label, bar = QLabel(), QProgressBar()
+    counts = count_qt_updates(monkeypatch, [label, bar])
+
+    binder.set_text(label, "Kerne: 8")
+    binder.set_text(label, "Kerne: 8")
+    # Gleicher ganzzahliger Prozentwert: kein neues setValue
+    binder.set_value(bar, 42.2)
+    binder.set_value(bar, 42.7)
+    binder.set_value(bar, 43.0)
+
+    assert counts["calls"] == 3
+    assert label.text() == "Kerne: 8"
+    assert bar.value() == 43
+    assert binder.get_stats() == {"applied": 3, "skipped": 2, "skipped_ratio": pytest.approx(0.4)}
+
+
+def test_repeated_snapshot_touches_no_widgets(qapp, workdir, monkeypatch):
+    from PyQt6.QtWidgets import QLabel, QProgressBar
+    from main import SystemMonitorX
+
+    window = SystemMonitorX()
+    widget = window.widget_registry.get_or_create("cpu")
+    try:
+        snapshot = window.refresh_coordinator.sampler.sample()
+        # Gleitendes Fenster der Karten-Statistik ganz mit demselben Wert füllen
+        for _ in range(window.card_statistics["cpu"].window_size + 1):
+            window.update_system_data(snapshot)
+            widget.update_data(snapshot)
+
+        targets = [child for parent in (window, widget)
+                   for kind in (QLabel, QProgressBar) for child in parent.findChildren(kind)]
+        counts = count_qt_updates(monkeypatch, targets)
+        before = window.binder.get_stats()
+        window.update_system_data(snapshot)
+        widget.update_data(snapshot)
+        after = window.binder.get_stats()
+
+        assert counts["calls"] == 0
+        assert after["applied"] == before["applied"]
+        # Dashboard: 4 Bars, 4 Detail- und 3 Statistik-Labels; CPU-Widget: Bar und 2 Labels
+        assert after["skipped"] - before["skipped"] == 14
+
+        # Geänderter Wert: genau die betroffenen Elemente werden neu gesetzt
+        changed = dict(snapshot, cpu_count=snapshot["cpu_count"] + 1)
+        window.update_system_data(changed)
+        widget.update_data(changed)
+        assert counts["calls"] == 2
+    finally:
+        widget.close_widget()
+        window.refresh_coordinator.stop()
+        window.close()
+
+
+def test_hidden_dashboard_enters_low_power(qapp, workdir, clock):
+    from main import SystemMonitorX
+
+    window = SystemMonitorX()
+    coordinator = window.refresh_coordinator
+    tray_snapshots = []
+    coordinator.snapshot_ready.connect(tray_snapshots.append)
+    try:
+        window.show_main_window()
+        qapp.processEvents()
+        assert not coordinator.low_power
+
+        # Ins Tray: Low-Power-Takt aus der Konfiguration
+        window.hide_main_window()
+        qapp.processEvents()
+        assert coordinator.low_power
+        low_power_interval = window.config_manager.get_monitoring_config().get("low_power_interval", 5000)
+        assert coordinator.get_display_interval() == low_power_interval
+
+        dashboard_updates = window.card_statistics["cpu"].count
+        tray_snapshots.clear()
+        wakeups = clock.run(coordinator, 60.0)
+        stats = coordinator.get_power_stats()
+        assert wakeups == stats["wakeups"] == 60 * 1000 // low_power_interval
+        assert stats["wakeups_per_second"] == pytest.approx(1000 / low_power_interval)
+        # Kein Rendering, nur der Tray bekommt jeden Snapshot
+        assert window.card_statistics["cpu"].count == dashboard_updates
+        assert len(tray_snapshots) == wakeups
+
+        # Wieder sichtbar: sofort aktuelle Werte im normalen Takt
+        window.show_main_window()
+        qapp.processEvents()
+        assert not coordinator.low_power
+        assert coordinator.get_display_interval() == 1000
+        assert window.card_statistics["cpu"].count == dashboard_updates + 1
+    finally:
+        coordinator.stop()
+        window.close()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Figure-Pool
+Speicher bleibt über 1.000 Graph-Refreshes konstant
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import gc
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+REFRESHES = 1000
+# Jeder 50. Refresh wird sofort gezeichnet, die übrigen nur per draw_idle vorgemerkt
+DRAW_EVERY = 50
+# Erlaubtes Wachstum nach dem Aufwärmen (Matplotlib-Caches sind dann gefüllt)
+MAX_GROWTH_BYTES = 512 * 1024
+
+
+def make_data(i: int):
+    """Wechselnde Messwerte für einen Refresh"""
+    return {
+        'cpu_percent': float(i % 100),
+        'cpu_freq_ghz': 2.0 + (i % 10) / 10,
+        'ram_percent': 40.0 + i % 7,
+        'ram_used_gb': 4.0,
+        'disk_percent': 55.0,
+        'disk_used_gb': 120.0
+    }
+
+
+def count_artists(fig) -> int:
+    """Anzahl Artists aller Achsen einer Figure"""
+    return sum(len(ax.get_children()) for ax in fig.axes)
+
+
+@pytest.mark.parametrize("graph_type", ["cpu", "overview"])
+def test_memory_stays_flat_over_refreshes(qapp, graph_type):
+    import matplotlib.pyplot as plt
+    from matplotlib.backends import backend_qt
+    from utils.graphs import SystemGraphs
+
+    graphs = SystemGraphs()
+    canvas, toolbar, fig = graphs.create_graph_widget(graph_type)
+
+    # Schon vor dem Füllen der History messen, sonst zählen nur die neuen Punkte,
+    # nicht aber die verdrängten alten
+    tracemalloc.start()
+    try:
+        # History bis zur Obergrenze füllen und aufwärmen
+        for i in range(graphs.max_history):
+            graphs.update_graph_data(make_data(i))
+        for i in range(20):
+            graphs.refresh_graph(graph_type, immediate=True)
+        artists = count_artists(fig)
+
+        gc.collect()
+        baseline = tracemalloc.take_snapshot()
+        for i in range(REFRESHES):
+            graphs.update_graph_data(make_data(i))
+            graphs.refresh_graph(graph_type, immediate=(i % DRAW_EVERY == 0))
+        # Vorgemerkte draw_idle-Aufrufe ausführen
+        qapp.processEvents()
+        gc.collect()
+        current = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Puffer der Qt-Timer hinter draw_idle gehören zur Event-Loop, nicht zum Figure-Pool
+    ignore_qt_backend = [tracemalloc.Filter(False, backend_qt.__file__)]
+    current = current.filter_traces(ignore_qt_backend)
+    baseline = baseline.filter_traces(ignore_qt_backend)
+    growth = sum(stat.size_diff for stat in current.compare_to(baseline, "filename"))
+    assert growth < MAX_GROWTH_BYTES, f"Speicher um {growth / 1024:.0f} KB gewachsen"
+
+    # Dieselbe Figure, keine neuen Artists, keine pyplot-Figures
+    assert graphs.figure_pool[graph_type]['figure'] is fig
+    assert count_artists(fig) == artists
+    assert plt.get_fignums() == []
+
+    graphs.release_graph_widgets()
+    assert graphs.figure_pool == {}
+
+
+def test_create_graph_widget_reuses_pooled_figure(qapp):
+    from utils.graphs import SystemGraphs
+
+    graphs = SystemGraphs()
+    first = graphs.create_graph_widget("ram")
+    second = graphs.create_graph_widget("ram")
+    assert all(a is b for a, b in zip(first, second))
+    graphs.release_graph_widgets()
+
+
+def test_open_graphs_reuses_window(qapp, workdir):
+    from main import SystemMonitorX
+
+    window = SystemMonitorX()
+    window.open_graphs()
+    first = window.graph_window
+    # Der erste Tab wird im nächsten Event-Loop-Durchlauf aufgebaut
+    qapp.processEvents()
+    figures = dict(first.graphs.figure_pool)
+    assert figures
+    window.open_graphs()
+    assert window.graph_window is first
+    assert first.graphs.figure_pool == figures
+    assert window.has_visible_views()
+
+    # Geschlossen: Figures freigegeben, nächstes Öffnen baut neu auf
+    first.close()
+    assert window.graph_window is None
+    assert first.graphs.figure_pool == {}
+    window.open_graphs()
+    assert window.graph_window is not first
+    window.graph_window.close()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Flotten-Ansicht
+Mehrere Collector-Agents (eigene Prozesse) zusammenführen und zusammenfassen
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import math
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+from utils.fleet import FleetClient, FLEET_METRICS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+AGENT_COUNT = 4
+# Agents brauchen einige Sekunden bis zum ersten Snapshot (Import, Start, erste Messung)
+CONNECT_TIMEOUT = 30.0
+
+
+def free_port() -> int:
+    """Freien lokalen TCP-Port ermitteln"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(condition, timeout: float) -> bool:
+    """Bedingung abfragen, bis sie erfüllt ist oder die Zeit abläuft"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.1)
+    return condition()
+
+
+def expected_summary(values):
+    """Min/Ø/Max/p95 (Nearest-Rank) unabhängig von summarize_values berechnen"""
+    ordered = sorted(values)
+    return {
+        "min": ordered[0],
+        "avg": sum(ordered) / len(ordered),
+        "max": ordered[-1],
+        "p95": ordered[math.ceil(0.95 * len(ordered)) - 1],
+        "count": len(ordered)
+    }
+
+
+@pytest.fixture(scope="module")
+def agents(tmp_path_factory):
+    """AGENT_COUNT Collector im Agent-Modus auf localhost"""
+    workdir = tmp_path_factory.mktemp("agents")
+    ports = [free_port() for _ in range(AGENT_COUNT)]
+    processes = [
+        subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "collector.py"), "--agent-port", str(port),
+             "--interval", "500", "--logs-dir", str(workdir / f"logs-{port}")],
+            cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        for port in ports
+    ]
+    yield [("127.0.0.1", port) for port in ports], processes
+    for process in processes:
+        if process.poll() is None:
+            process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def test_fleet_merges_agents(agents):
+    addresses, processes = agents
+    client = FleetClient(addresses, reconnect_delay=0.2)
+    client.start()
+    try:
+        assert wait_for(lambda: all(row["fresh"] for row in client.get_rows()[0]), CONNECT_TIMEOUT), \
+            client.get_rows()
+
+        rows, _ = client.get_rows()
+        assert [row["address"] for row in rows] == [f"{host}:{port}" for host, port in addresses]
+        for row in rows:
+            assert row["status"] == "verbunden"
+            assert row["hostname"] == socket.gethostname()
+            for key, _ in FLEET_METRICS:
+                assert 0.0 <= row[key] <= 100.0
+
+        summary = client.get_summary(rows)
+        for key, _ in FLEET_METRICS:
+            assert summary[key] == pytest.approx(expected_summary([row[key] for row in rows]))
+
+        # Ein Agent fällt aus: getrennt und nicht mehr in den Kennzahlen
+        processes[0].terminate()
+        processes[0].wait(timeout=10)
+        assert wait_for(lambda: client.get_rows()[0][0]["status"] == "getrennt", 10.0)
+        rows, _ = client.get_rows()
+        summary = client.get_summary(rows)
+        assert summary["cpu_percent"]["count"] == AGENT_COUNT - 1
+        assert summary["cpu_percent"] == pytest.approx(
+            expected_summary([row["cpu_percent"] for row in rows[1:]]))
+    finally:
+        client.stop()
+
+
+def test_fleet_summary_over_many_hosts():
+    client = FleetClient([("host%d" % i, 9470) for i in range(20)])
+    for i, agent in enumerate(client.agents):
+        client._set_status(agent, "verbunden")
+        client._on_frame(agent, {"cpu_percent": float(i + 1), "ram_percent": 50.0, "disk_percent": None})
+
+    summary = client.get_summary()
+    assert summary["cpu_percent"] == {"min": 1.0, "avg": 10.5, "max": 20.0, "p95": 19.0, "count": 20}
+    assert summary["ram_percent"]["p95"] == 50.0
+    assert summary["disk_percent"]["count"] == 0
+
+
+def test_rows_and_version_are_read_together():
+    client = FleetClient([("host", 9470)])
+    rows, version = client.get_rows()
+    client._on_frame(client.agents[0], {"cpu_percent": 5.0})
+    rows, newer = client.get_rows()
+    assert newer == version + 1 == client.version
+    assert rows[0]["cpu_percent"] == 5.0
+
+
+def test_fleet_window_updates_when_hosts_go_stale(qapp, workdir):
+    from utils.fleet import STALE_AFTER
+    from windows.fleet_window import FleetWindow
+
+    window = FleetWindow(agents="127.0.0.1:1,127.0.0.1:2")
+    window.refresh_timer.stop()
+    window.client.stop()
+    for i, agent in enumerate(window.client.agents):
+        window.client._set_status(agent, "verbunden")
+        window.client._on_frame(agent, {"cpu_percent": 10.0 * (i + 1), "ram_percent": 50.0})
+    window.refresh()
+    assert window.status_label.text() == "2/2 Hosts verbunden"
+    assert window.summary_table.item(0, 2).text() == "15.0 %"
+
+    # Kein neuer Frame: nur das Alter des zweiten Hosts überschreitet STALE_AFTER
+    version = window.client.version
+    window.client.agents[1].last_seen -= STALE_AFTER + 1
+    window.refresh()
+    assert window.client.version == version
+    assert window.host_table.item(1, 2).text() == "veraltet"
+    assert window.status_label.text() == "1/2 Hosts verbunden"
+    assert window.summary_table.item(0, 2).text() == "10.0 %"
+    window.close()
+
+
+def test_open_fleet_reuses_window(qapp, workdir):
+    from main import SystemMonitorX
+
+    window = SystemMonitorX()
+    window.open_fleet("127.0.0.1:1")
+    first = window.fleet_window
+    window.open_fleet()
+    assert window.fleet_window is first
+    assert first.isVisible()
+
+    # Andere Agents: altes Fenster schließt seine Verbindungen
+    window.open_fleet("127.0.0.1:2")
+    second = window.fleet_window
+    assert second is not first
+    assert not first.client.thread.is_alive()
+    assert second.agents == [("127.0.0.1", 2)]
+
+    second.close()
+    assert window.fleet_window is None
+    assert not second.client.thread.is_alive()
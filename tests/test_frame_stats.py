@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Frame-Statistik
+Histogramm-Grenzen und live übernommenes Frame-Budget des Graph-Fensters
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import pytest
+
+from utils.frame_stats import FrameTimer, FRAME_BUCKETS_MS
+
+
+def bucket_of(timer: FrameTimer, tab: str, draw_ms: float):
+    """(from_ms, to_ms) des Buckets, in den ein einzelner Frame fällt"""
+    timer.histograms.pop(tab, None)
+    timer.frame_counts.pop(tab, None)
+    timer.total_draw_ms.pop(tab, None)
+    timer.record_frame(tab, draw_ms)
+    for bucket in timer.get_histogram(tab):
+        if bucket["count"]:
+            return bucket["from_ms"], bucket["to_ms"]
+
+
+def test_histogram_bucket_bounds():
+    timer = FrameTimer()
+    assert bucket_of(timer, "cpu", 0.5) == (0, 1)
+    # Untergrenze gehört zum Bucket, Obergrenze nicht
+    assert bucket_of(timer, "cpu", 1.0) == (1, 2)
+    assert bucket_of(timer, "cpu", 15.9) == (8, 16)
+    assert bucket_of(timer, "cpu", 16.0) == (16, 33)
+    assert bucket_of(timer, "cpu", 499.9) == (200, 500)
+    assert bucket_of(timer, "cpu", 500.0) == (500, None)
+
+    for limit in FRAME_BUCKETS_MS:
+        lower, upper = bucket_of(timer, "ram", limit)
+        assert lower == limit
+        assert upper is None or upper > limit
+
+
+def test_frame_budget_and_max_interval_apply_live(qapp, workdir):
+    pytest.importorskip("matplotlib")
+    from utils.config import ConfigManager
+    from utils.rate_control import RateController
+    from windows.graph_window import GraphWindow
+
+    config_manager = ConfigManager()
+    rate_control = RateController(config_manager)
+    window = GraphWindow(config_manager, rate_control)
+    try:
+        assert window.frame_budget_ms == 50
+        assert window.max_interval == 10000
+
+        # Stark gedrosselt, dann Budget und Obergrenze in den Einstellungen senken
+        window.update_timer.setInterval(8000)
+        config_manager.set_setting("graphs", "frame_budget_ms", 20)
+        config_manager.set_setting("graphs", "max_refresh_interval", 3000)
+        changed = rate_control.apply()
+
+        assert set(changed) == {"graphs_frame_budget", "graphs_max_interval"}
+        assert window.frame_budget_ms == 20
+        assert window.max_interval == 3000
+        assert window.update_timer.interval() == 3000
+
+        # Langsame Frames drosseln nur bis zur neuen Obergrenze
+        window.frame_timer.smoothed_draw_ms = 25.0
+        window.update_timer.setInterval(2500)
+        window.adjust_refresh_rate()
+        assert window.update_timer.interval() == 3000
+    finally:
+        window.close()
+
+    assert rate_control.targets["graphs_frame_budget"] == []
+    assert rate_control.targets["graphs_max_interval"] == []
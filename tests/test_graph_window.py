@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Graph-Fenster
+Tabs erst bei Auswahl, eine Datenquelle, gemessene Öffnungszeit
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import threading
+
+import pytest
+
+pytest.importorskip("PyQt6")
+pytest.importorskip("matplotlib")
+
+
+def built_tabs(window):
+    """Graph-Typen der bereits aufgebauten Tabs"""
+    tabs = [window.tab_widget.widget(index) for index in range(window.tab_widget.count())]
+    return [tab.graph_type for tab in tabs if tab.built]
+
+
+def test_tabs_built_on_first_selection_with_one_feed(qapp, workdir, clock, monkeypatch):
+    from utils.config import ConfigManager
+    from utils.refresh import RefreshCoordinator
+    from windows.graph_window import GraphWindow
+
+    coordinator = RefreshCoordinator()
+    samples = {"count": 0}
+    sample = coordinator.sampler.sample
+
+    def counting_sample():
+        samples["count"] += 1
+        return sample()
+
+    monkeypatch.setattr(coordinator.sampler, "sample", counting_sample)
+    coordinator.start()
+
+    threads = threading.active_count()
+    window = GraphWindow(ConfigManager(), coordinator=coordinator)
+    window.show()
+    try:
+        # Konstruktor baut keinen Tab und startet keinen eigenen Sampler-Thread
+        assert built_tabs(window) == []
+        assert window.graphs.figure_pool == {}
+        assert window.sampler is None
+        assert threading.active_count() == threads
+
+        # Erster Tab nach dem ersten Event-Loop-Durchlauf, Öffnungszeit als Zahl
+        qapp.processEvents()
+        assert built_tabs(window) == ["overview"]
+        assert set(window.graphs.figure_pool) == {"overview"}
+        assert window.open_time_ms is not None and window.open_time_ms > 0
+
+        # Weitere Tabs erst bei Auswahl, jeweils nur einmal
+        window.tab_widget.setCurrentIndex(2)
+        assert built_tabs(window) == ["overview", "ram"]
+        window.tab_widget.setCurrentIndex(0)
+        window.tab_widget.setCurrentIndex(2)
+        assert set(window.graphs.figure_pool) == {"overview", "ram"}
+
+        # Eine Datenquelle: Snapshots des Koordinators in der Graph-Rate, Redraw sampelt nicht
+        samples["count"] = 0
+        window.update_graphs()
+        assert samples["count"] == 0
+        history = len(window.graphs.data_history)
+        wakeups = clock.run(coordinator, 5.0)
+        assert samples["count"] == wakeups == 5
+        assert len(window.graphs.data_history) - history == wakeups
+    finally:
+        window.close()
+        coordinator.stop()
+
+    assert "graphs" not in coordinator.consumers
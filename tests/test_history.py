@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Verlaufs-Speicher
+Langzeit-Verlauf, Kachel-Cache, Level-of-Detail und LRU-Verdrängung
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.history import HistoryWriter, LogHistoryStore, HISTORY_DIR, HISTORY_KEYS
+
+# Volle Stunde als Startpunkt (Kachel- und Dateigrenzen fallen zusammen)
+BASE = 1_700_000_000 // 3600 * 3600
+
+
+def make_rows(start: float, count: int, step: float = 1.0):
+    """Datensätze wie vom SnapshotSampler (lokale ISO-Zeitstempel)"""
+    rows = []
+    for i in range(count):
+        timestamp = start + i * step
+        rows.append({
+            "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+            "cpu_percent": float(i % 100), "cpu_freq_ghz": 2.5,
+            "ram_percent": 50.0, "ram_used_gb": 8.0,
+            "disk_percent": 40.0, "disk_used_gb": 200.0
+        })
+    return rows
+
+
+@pytest.fixture
+def history_dir(tmp_path):
+    """logs/ mit drei Stunden Verlauf bei 1 Hz"""
+    logs_dir = tmp_path / "logs"
+    writer = HistoryWriter(str(logs_dir), retention_days=36500)
+    assert writer.append(make_rows(BASE, 3 * 3600)) == 3 * 3600
+    return logs_dir
+
+
+def test_writer_creates_hourly_files(history_dir):
+    files = sorted(os.listdir(history_dir / HISTORY_DIR))
+    assert len(files) == 3
+    assert all(name.startswith("system_history_") and name.endswith(".csv") for name in files)
+
+
+def test_choose_level():
+    store = LogHistoryStore()
+    assert store.choose_level(600) == 1
+    assert store.choose_level(1200) == 1
+    assert store.choose_level(1201) == 10
+    assert store.choose_level(3 * 3600) == 10
+    assert store.choose_level(7 * 86400) == 600
+    assert store.choose_level(30 * 86400) == 3600
+
+
+def test_range_matches_written_samples(history_dir):
+    store = LogHistoryStore(str(history_dir))
+    assert store.get_time_bounds() == (BASE, BASE + 3 * 3600 - 1)
+
+    # 10 Minuten: volle Auflösung, jedes Sample genau einmal
+    data = store.get_range(BASE + 3600, BASE + 3600 + 599)
+    assert len(data["timestamps"]) == 600
+    assert data["timestamps"][0] == BASE + 3600
+    assert data["cpu_percent"][:3] == [0.0, 1.0, 2.0]
+
+    # Drei Stunden: 10-s-Buckets mit Mittelwert
+    data = store.get_range(BASE, BASE + 3 * 3600)
+    assert len(data["timestamps"]) == 3 * 360
+    assert data["timestamps"][0] == BASE + 5
+    assert data["cpu_percent"][0] == pytest.approx(4.5)
+    assert data["ram_percent"][0] == 50.0
+
+
+def test_tile_cache_hits(history_dir):
+    store = LogHistoryStore(str(history_dir))
+    store.get_range(BASE, BASE + 1800)
+    misses = store.tile_misses
+    assert misses > 0 and store.tile_hits == 0
+
+    # Gleicher Ausschnitt: nur Treffer, keine Datei wird neu gelesen
+    store.file_cache.clear()
+    store.get_range(BASE, BASE + 1800)
+    assert store.tile_misses == misses
+    assert store.tile_hits == misses
+    assert store.get_cache_stats()["files_cached"] == 0
+
+
+def test_tile_lru_eviction(history_dir):
+    store = LogHistoryStore(str(history_dir), max_tiles=2)
+    # Drei Kacheln à 600 s in voller Auflösung
+    for tile in range(3):
+        store.get_range(BASE + tile * 600, BASE + tile * 600 + 599)
+    assert list(store.tile_cache) == [(1, (BASE + 600) // 600), (1, (BASE + 1200) // 600)]
+
+    # Älteste Kachel wurde verdrängt, die jüngste bleibt im Cache
+    store.get_range(BASE + 1200, BASE + 1799)
+    assert store.tile_hits == 1
+    misses = store.tile_misses
+    store.get_range(BASE, BASE + 599)
+    assert store.tile_misses == misses + 1
+    assert len(store.tile_cache) == 2
+
+
+def test_week_stays_under_visible_point_cap(tmp_path):
+    logs_dir = tmp_path / "logs"
+    writer = HistoryWriter(str(logs_dir), retention_days=36500)
+    writer.append(make_rows(BASE, 7 * 24 * 60, step=60.0))
+
+    store = LogHistoryStore(str(logs_dir))
+    start, end = store.get_time_bounds()
+    for span in (end - start, 86400, 3600 * 6, 3600, 600):
+        data = store.get_range(end - span, end)
+        assert 0 < len(data["timestamps"]) <= LogHistoryStore.MAX_VISIBLE_POINTS
+        for key in HISTORY_KEYS:
+            assert len(data[key]) == len(data["timestamps"])
+
+
+def test_appended_samples_invalidate_tail(tmp_path):
+    logs_dir = tmp_path / "logs"
+    writer = HistoryWriter(str(logs_dir), retention_days=36500)
+    writer.append(make_rows(BASE, 1800))
+    store = LogHistoryStore(str(logs_dir))
+    assert len(store.get_range(BASE + 1200, BASE + 2399)["timestamps"]) == 600
+
+    # Neue Samples in der laufenden Stunde: keine neue Datei, Verzeichnis-mtime bleibt gleich
+    writer.append(make_rows(BASE + 1800, 300))
+    assert len(os.listdir(logs_dir / HISTORY_DIR)) == 1
+    data = store.get_range(BASE + 1200, BASE + 2399)
+    assert len(data["timestamps"]) == 900
+    assert data["timestamps"] == sorted(set(data["timestamps"]))
+
+
+def test_retention_by_age(history_dir):
+    writer = HistoryWriter(str(history_dir), retention_days=1)
+    # Einen Tag nach der zweiten Stunde: nur die dritte Stunde ist jünger
+    assert writer.cleanup(now=BASE + 2 * 3600 + 86400 + 1) == 2
+    assert len(os.listdir(history_dir / HISTORY_DIR)) == 1
+
+
+def test_falls_back_to_rotating_logs(tmp_path):
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    stamp = datetime.fromtimestamp(BASE + 60).strftime("%Y%m%d_%H%M%S")
+    with open(logs_dir / f"system_monitor_{stamp}.json", "w", encoding="utf-8") as f:
+        json.dump({"data": make_rows(BASE, 60)}, f)
+
+    store = LogHistoryStore(str(logs_dir))
+    data = store.get_range(BASE, BASE + 59)
+    assert len(data["timestamps"]) == 60
+
+
+class SteppingClock:
+    """datetime-Ersatz: jeder now()-Aufruf liegt eine Sekunde später"""
+
+    def __init__(self, start: datetime):
+        self.current = start
+
+    def now(self):
+        self.current += timedelta(seconds=1)
+        return self.current
+
+    def __getattr__(self, name):
+        return getattr(datetime, name)
+
+
+def test_flush_writes_one_stamp_and_counts_samples_once(tmp_path, monkeypatch):
+    import utils.logging
+    from utils.logging import SystemLogger
+
+    logs_dir = tmp_path / "logs"
+    logger = SystemLogger(logs_dir=str(logs_dir), history_retention_days=36500)
+    for row in make_rows(BASE, 30):
+        logger._append(row)
+
+    monkeypatch.setattr(utils.logging, "datetime", SteppingClock(datetime.fromtimestamp(BASE + 30)))
+    logger.force_save()
+
+    names = sorted(name for name in os.listdir(logs_dir) if name.startswith("system_monitor_"))
+    assert len(names) == 2
+    assert names[0][:-len(".csv")] == names[1][:-len(".json")]
+
+    # Verlauf und Log-Paar liefern jedes Sample genau einmal
+    data = LogHistoryStore(str(logs_dir)).get_range(BASE, BASE + 29)
+    assert len(data["timestamps"]) == 30
+    os.rename(logs_dir / HISTORY_DIR, tmp_path / "moved")
+    data = LogHistoryStore(str(logs_dir)).get_range(BASE, BASE + 29)
+    assert len(data["timestamps"]) == 30
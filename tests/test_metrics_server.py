@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Metrics-Endpoint
+Start-Ergebnis und Lasttest mit 100 parallelen Scrapern
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import json
+import urllib.request
+
+import pytest
+
+from utils.metrics_server import MetricsServer, run_load_test
+from utils.snapshot import SnapshotSampler
+
+SCRAPERS = 100
+LOAD_SECONDS = 3.0
+
+
+@pytest.fixture
+def sampler():
+    """Sampler mit einem ersten Snapshot"""
+    sampler = SnapshotSampler()
+    sampler.sample()
+    return sampler
+
+
+@pytest.fixture
+def server(sampler):
+    """Laufender Endpoint auf einem freien Port"""
+    server = MetricsServer(sampler, port=0)
+    assert server.start()
+    yield server
+    server.stop()
+
+
+def test_start_fails_when_port_is_not_bound_in_time(sampler, capsys):
+    server = MetricsServer(sampler, port=0)
+    # Server-Thread, der nie bereit wird
+    server._run = lambda: None
+
+    assert not server.start(timeout=0.2)
+    assert not server.start()
+    output = capsys.readouterr().out
+    assert "nicht gebunden" in output
+    assert "http://" not in output
+
+
+def test_start_fails_when_port_is_taken(server, sampler):
+    second = MetricsServer(sampler, port=server.port)
+    assert not second.start()
+    assert not second.start()
+
+
+def test_load_test_with_100_scrapers(server, sampler):
+    result = run_load_test("127.0.0.1", server.port, concurrency=SCRAPERS, duration=LOAD_SECONDS)
+
+    assert result["errors"] == 0
+    assert result["requests"] >= SCRAPERS
+    stats = server.get_stats()
+    assert stats["requests"] >= result["requests"]
+    # Ein Sample, eine Kodierung - alle Scrapes kommen aus dem Cache
+    assert stats["encodes"] == 1
+
+
+def test_metrics_json_matches_latest_snapshot(server, sampler):
+    with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics.json", timeout=5) as response:
+        data = json.loads(response.read())
+    assert data["cpu_percent"] == pytest.approx(sampler.get_latest()["cpu_percent"])
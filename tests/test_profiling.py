@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Profiling-Modus
+Subsystem-Zuordnung, Import-Zeiten und Report einer kurzen Sitzung
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+from utils.profiling import (ImportTimer, ProfileSession, REPO_ROOT,
+                             classify_function, classify_module, classify_path)
+
+# Künstliche Import-Dauer der Test-Module (ms)
+PACKAGE_SLEEP_MS = 30
+CHILD_SLEEP_MS = 60
+
+
+@pytest.fixture
+def slow_package(tmp_path, monkeypatch):
+    """Paket mit Untermodul, deren Import messbar Zeit kostet"""
+    name = f"smx_slow_{os.getpid()}"
+    package = tmp_path / name
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        f"import time\ntime.sleep({PACKAGE_SLEEP_MS / 1000})\nfrom . import child\n", encoding="utf-8")
+    (package / "child.py").write_text(
+        f"import time\ntime.sleep({CHILD_SLEEP_MS / 1000})\n", encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield name
+    for module in [module for module in sys.modules if module.split(".")[0] == name]:
+        del sys.modules[module]
+
+
+def test_classify_path():
+    assert classify_path("/usr/lib/python3/site-packages/matplotlib/pyplot.py") == "Graphen"
+    assert classify_path(os.path.join(REPO_ROOT, "utils", "logging.py")) == "Logging"
+    assert classify_path(os.path.join(REPO_ROOT, "widgets", "cpu_widget.py")) == "Widgets"
+    assert classify_path(os.path.join(REPO_ROOT, "main.py")) == "Dashboard"
+    assert classify_path("/site-packages/psutil/_pslinux.py") == "Sampling"
+    # Nur ganze Pfadbestandteile: "domain.py" ist nicht main.py
+    assert classify_path("/opt/app/domain.py") == "Sonstiges"
+    assert classify_path("/opt/app/mymatplotlib/core.py") == "Sonstiges"
+
+
+def test_classify_module_and_function():
+    assert classify_module("utils.history") == "Graphen"
+    assert classify_module("utils.tray_atlas") == "Tray"
+    assert classify_module("PyQt6.QtWidgets") == "Qt"
+    assert classify_module("widgets.cpu_widget") == "Widgets"
+    assert classify_module("json") == "Sonstiges"
+
+    assert classify_function(("~", 0, "<built-in method time.sleep>")) == "Builtins"
+    assert classify_function(("~", 0, "<method 'exec' of 'QEventLoop' objects>")) == "Qt"
+    assert classify_function((os.path.join(REPO_ROOT, "utils", "snapshot.py"), 10, "sample")) == "Sampling"
+
+
+def test_import_timer_measures_own_and_cumulative_time(slow_package):
+    timer = ImportTimer()
+    timer.install()
+    try:
+        __import__(slow_package)
+    finally:
+        timer.uninstall()
+    assert timer not in sys.meta_path
+
+    total, own = timer.timings[slow_package]
+    child_total, child_own = timer.timings[f"{slow_package}.child"]
+    assert child_own >= CHILD_SLEEP_MS * 0.9
+    assert total >= (PACKAGE_SLEEP_MS + CHILD_SLEEP_MS) * 0.9
+    # Eigene Zeit ohne den Unter-Import
+    assert PACKAGE_SLEEP_MS * 0.9 <= own < total - CHILD_SLEEP_MS * 0.9
+
+    top = timer.get_top(2)
+    assert [name for name, _, _ in top] == [f"{slow_package}.child", slow_package]
+    ms, count = timer.get_by_subsystem()["Sonstiges"]
+    assert count == 2
+    assert ms == pytest.approx(own + child_own)
+
+
+class Demo:
+    """Klasse mit setup_*-Phasen für instrument()"""
+
+    def setup_ui(self):
+        time.sleep(0.02)
+        self.setup_header()
+
+    def setup_header(self):
+        time.sleep(0.01)
+
+    def refresh(self):
+        pass
+
+
+def test_short_session_writes_report(tmp_path, slow_package):
+    from utils.statistics import RollingStatistics
+
+    output_dir = tmp_path / "metrics"
+    session = ProfileSession(window_seconds=0.1, output_dir=str(output_dir))
+    try:
+        session.instrument(Demo)
+        Demo().setup_ui()
+        __import__(slow_package)
+
+        session.start_window()
+        statistics = RollingStatistics(window_size=60)
+        for value in range(2000):
+            statistics.add(value)
+        report_path = session.finish()
+    finally:
+        session.import_timer.uninstall()
+
+    assert report_path and os.path.exists(report_path)
+    assert os.path.exists(report_path[:-len(".txt")] + ".prof")
+    assert session.finish() == report_path
+    assert session.import_timer not in sys.meta_path
+
+    # Setup-Phasen inklusive Unterphase, Instrumentierung nur für setup_*
+    assert sum(session.setup_timings["setup_ui"]) >= 30 * 0.9
+    assert len(session.setup_timings["setup_header"]) == 1
+    assert "refresh" not in session.setup_timings
+
+    with open(report_path, encoding="utf-8") as f:
+        report = f.read()
+    for heading in ("Setup-Phasen", "Importe nach Subsystem", "Langsamste Importe",
+                    "Hot Spots nach Subsystem", "Eigene Funktionen nach kumulierter Zeit"):
+        assert heading in report
+    assert "setup_ui" in report
+    assert f"{slow_package}.child" in report
+    # Die Statistik-Engine zählt zum Dashboard und erscheint unter den eigenen Funktionen
+    assert "Dashboard:" in report
+    assert "utils/statistics.py" in report
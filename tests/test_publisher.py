@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Snapshot-Publisher
+Start-Ergebnis, langsame Abnehmer trennen, publish() blockiert nie
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import json
+import socket
+import time
+
+import pytest
+
+from utils.publisher import SnapshotPublisher
+from utils.snapshot import SnapshotSampler
+
+EMITS = 5000
+MAX_QUEUE = 8
+
+# Großer Snapshot: die Socket-Puffer des langsamen Abnehmers laufen nach wenigen Frames voll
+PADDING = "x" * 16384
+
+
+def wait_for(condition, timeout: float) -> bool:
+    """Bedingung abfragen, bis sie erfüllt ist oder die Zeit abläuft"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def publisher():
+    """Publisher im TCP-Modus auf einem freien Port"""
+    publisher = SnapshotPublisher(SnapshotSampler(), max_queue=MAX_QUEUE, port=0)
+    assert publisher.start()
+    yield publisher
+    publisher.stop()
+
+
+def subscribe(publisher: SnapshotPublisher, receive_buffer: int = 0) -> socket.socket:
+    """Abnehmer verbinden und JSONL wählen (receive_buffer: kleiner Empfangspuffer)"""
+    client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if receive_buffer:
+        client.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, receive_buffer)
+    client.connect(("127.0.0.1", publisher.port))
+    client.sendall(b"jsonl\n")
+    return client
+
+
+def test_start_fails_when_not_ready_in_time(capsys):
+    publisher = SnapshotPublisher(SnapshotSampler(), port=0)
+    # Publisher-Thread, der nie bereit wird
+    publisher._run = lambda: None
+
+    assert not publisher.start(timeout=0.2)
+    assert not publisher.start()
+    output = capsys.readouterr().out
+    assert "nicht bereit" in output
+    assert "Queue" not in output
+
+
+def test_frames_reach_subscriber(publisher):
+    client = subscribe(publisher)
+    try:
+        assert wait_for(lambda: publisher.get_stats()["subscribers"] == 1, 5.0)
+        publisher.publish({"cpu_percent": 12.5, "timestamp": "2026-01-01T00:00:00"}, 1)
+        stream = client.makefile("rb")
+        frame = json.loads(stream.readline())
+        assert frame["cpu_percent"] == 12.5
+        assert frame["sample_count"] == 1
+    finally:
+        client.close()
+
+
+def test_slow_subscriber_is_disconnected_without_blocking(publisher):
+    slow = subscribe(publisher, receive_buffer=4096)
+    try:
+        assert wait_for(lambda: publisher.get_stats()["subscribers"] == 1, 5.0)
+
+        # Der Abnehmer liest nie: publish() muss trotzdem sofort zurückkehren
+        snapshot = {"cpu_percent": 1.0, "padding": PADDING}
+        started = time.perf_counter()
+        for sample_count in range(EMITS):
+            publisher.publish(snapshot, sample_count)
+        elapsed = time.perf_counter() - started
+
+        assert wait_for(lambda: publisher.get_stats()["disconnected_slow"] == 1, 10.0)
+        stats = publisher.get_stats()
+        assert stats["subscribers"] == 0
+        assert stats["frames_sent"] < EMITS
+        # Nur ein call_soon_threadsafe pro Aufruf, kein Warten auf den Socket
+        assert elapsed < 1.0, f"{EMITS} publish() in {elapsed * 1000:.0f} ms"
+        assert stats["max_publish_ms"] < 50
+    finally:
+        slow.close()
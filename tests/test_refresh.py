@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Refresh-Koordinator
+Eigene Rate pro Verbraucher, Low-Power-Wakeups
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+
+class CountingSampler:
+    """Sampler-Ersatz: zählt Messungen, keine Systemaufrufe"""
+
+    def __init__(self):
+        self.sample_count = 0
+
+    def sample(self):
+        self.sample_count += 1
+        return {"cpu_percent": 1.0, "sample": self.sample_count}
+
+
+def make_coordinator(qapp, interval=5000, low_power_interval=5000):
+    from utils.refresh import RefreshCoordinator
+    return RefreshCoordinator(CountingSampler(), interval=interval, low_power_interval=low_power_interval)
+
+
+def make_widget(counts, key):
+    from PyQt6.QtWidgets import QWidget
+    widget = QWidget()
+    widget.show()
+    return widget, lambda snapshot: counts.__setitem__(key, counts[key] + 1)
+
+
+def test_each_consumer_gets_its_own_rate(qapp, clock):
+    coordinator = make_coordinator(qapp, interval=5000)
+    counts = {"dashboard": 0, "widget": 0, "logging": 0, "graphs": 0, "signal": 0}
+    dashboard, on_dashboard = make_widget(counts, "dashboard")
+    widget, on_widget = make_widget(counts, "widget")
+    coordinator.register(dashboard, on_dashboard)
+    coordinator.register(widget, on_widget, interval=2500)
+    coordinator.snapshot_ready.connect(lambda snapshot: counts.__setitem__("signal", counts["signal"] + 1))
+    coordinator.start()
+    coordinator.add_consumer("logging", lambda s: counts.__setitem__("logging", counts["logging"] + 1), 1000)
+    coordinator.add_consumer("graphs", lambda s: counts.__setitem__("graphs", counts["graphs"] + 1), 1500)
+
+    # Neue Verbraucher sofort, danach jeweils in ihrer Rate
+    coordinator.tick()
+    clock.run(coordinator, 30.0)
+
+    assert counts["dashboard"] == 1 + 6
+    assert counts["signal"] == 6
+    assert counts["widget"] == 1 + 12
+    assert counts["logging"] == 31
+    assert counts["graphs"] == 21
+    # Ein Snapshot pro Takt, geteilt von allen fälligen Verbrauchern
+    assert coordinator.sampler.sample_count < counts["logging"] + counts["graphs"]
+
+
+def test_consumer_interval_change_and_removal(qapp, clock):
+    coordinator = make_coordinator(qapp, interval=5000)
+    calls = []
+    coordinator.start()
+    coordinator.add_consumer("logging", calls.append, 1000)
+    coordinator.tick()
+    clock.run(coordinator, 10.0)
+    assert len(calls) == 11
+
+    coordinator.add_consumer("logging", calls.append, 2000)
+    clock.run(coordinator, 10.0)
+    assert len(calls) == 16
+
+    coordinator.remove_consumer("logging")
+    clock.run(coordinator, 10.0)
+    assert len(calls) == 16
+    assert coordinator.timer.interval() == 5000
+
+
+def test_hidden_widgets_are_skipped(qapp, clock):
+    coordinator = make_coordinator(qapp, interval=1000)
+    counts = {"hidden": 0}
+    widget, callback = make_widget(counts, "hidden")
+    widget.hide()
+    coordinator.register(widget, callback)
+    coordinator.start()
+    assert clock.run(coordinator, 10.0) == 10
+    assert counts["hidden"] == 0
+
+
+def test_low_power_wakeups(qapp, clock):
+    coordinator = make_coordinator(qapp, interval=1000, low_power_interval=5000)
+    counts = {"dashboard": 0}
+    dashboard, callback = make_widget(counts, "dashboard")
+    coordinator.register(dashboard, callback)
+    coordinator.start()
+    coordinator.set_low_power(True)
+
+    wakeups = clock.run(coordinator, 60.0)
+    stats = coordinator.get_power_stats()
+    assert wakeups == stats["wakeups"] == 12
+    assert stats["wakeups_per_second"] == pytest.approx(0.2)
+    # Kein Rendering im Low-Power-Modus
+    assert counts["dashboard"] == 0
+
+    # Mit aktivem Logging (1 s) weckt nur der Logger öfter, die Anzeige bleibt aus
+    logged = []
+    coordinator.add_consumer("logging", logged.append, 1000)
+    coordinator.tick()
+    clock.run(coordinator, 10.0)
+    assert len(logged) == 11
+    assert counts["dashboard"] == 0
+
+    coordinator.set_low_power(False)
+    coordinator.tick(force=True)
+    assert counts["dashboard"] == 1
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Shared-Memory-Snapshots
+Ringpuffer nach dem Umlauf, Leser gegen Schreiber-Thread, belegte Segmente
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import os
+import struct
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+
+from utils.publisher import BINARY_FIELDS
+from utils.shared_snapshot import SharedSnapshotReader, SharedSnapshotWriter
+from utils.snapshot import SnapshotSampler
+
+SLOTS = 8
+
+# Position der Schreiber-PID im Header
+PID_OFFSET = struct.calcsize("<4sHHI")
+
+
+def make_snapshot(number: int):
+    """Snapshot, dessen Messwerte alle der Sample-Nr. entsprechen (halbe Frames fallen auf)"""
+    snapshot = {key: float(number) for key in BINARY_FIELDS}
+    snapshot["timestamp"] = datetime.fromtimestamp(1_700_000_000 + number).isoformat()
+    snapshot["cpu_count"] = 4
+    return snapshot
+
+
+def assert_consistent(frame):
+    """Alle Werte eines Frames gehören zum selben Sample"""
+    for key in BINARY_FIELDS:
+        assert frame[key] == float(frame["sample_count"]), frame
+
+
+@pytest.fixture
+def writer():
+    """Gestarteter Schreiber auf einem eindeutigen Segment"""
+    writer = SharedSnapshotWriter(SnapshotSampler(), f"smx-test-{uuid.uuid4().hex[:12]}", SLOTS)
+    assert writer.start()
+    yield writer
+    writer.stop()
+
+
+def test_history_after_ring_wraps(writer):
+    reader = SharedSnapshotReader(writer.name)
+    try:
+        assert reader.read_latest() is None
+        assert reader.read_history() == []
+
+        # Mehr als zwei Umläufe: nur die letzten SLOTS Samples bleiben
+        for number in range(1, 2 * SLOTS + 5):
+            writer.publish(make_snapshot(number), number)
+
+        history = reader.read_history()
+        last = 2 * SLOTS + 4
+        assert [frame["sample_count"] for frame in history] == list(range(last - SLOTS + 1, last + 1))
+        for frame in history:
+            assert_consistent(frame)
+        assert [frame["sample_count"] for frame in reader.read_history(3)] == [last - 2, last - 1, last]
+        assert reader.read_latest()["sample_count"] == last
+        assert reader.get_sample_count() == last
+
+        # Verspätete Snapshots überschreiben keine neueren Slots
+        writer.publish(make_snapshot(last - 1), last - 1)
+        assert reader.read_latest()["sample_count"] == last
+    finally:
+        reader.close()
+
+
+def test_reader_races_writer_thread(writer):
+    # Häufige Thread-Wechsel, damit der Leser den Schreiber mitten im Update erwischt
+    previous_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    stop = threading.Event()
+
+    def write_loop():
+        number = 0
+        while not stop.is_set():
+            number += 1
+            writer.publish(make_snapshot(number), number)
+
+    thread = threading.Thread(target=write_loop, daemon=True)
+    reader = SharedSnapshotReader(writer.name)
+    reads = 0
+    thread.start()
+    try:
+        deadline = time.monotonic() + 10.0
+        while time.monotonic() < deadline and (reads < 2000 or reader.retries == 0):
+            history = reader.read_history()
+            reads += 1
+            numbers = [frame["sample_count"] for frame in history]
+            # Ein konsistenter Ring: lückenlos aufsteigend, kein Frame halb geschrieben
+            if numbers:
+                assert numbers == list(range(numbers[0], numbers[0] + len(numbers)))
+            for frame in history:
+                assert_consistent(frame)
+    finally:
+        stop.set()
+        thread.join(timeout=5)
+        sys.setswitchinterval(previous_interval)
+        reader.close()
+
+    assert reads >= 2000
+    assert writer.get_stats()["writes"] > SLOTS
+    # Der Leser hat laufende Updates erkannt und neu gelesen
+    assert reader.retries > 0
+
+
+def test_refuses_segment_of_live_writer(writer, capsys):
+    # Anderer, noch laufender Prozess als Schreiber im Header
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    try:
+        struct.pack_into("<Q", writer.buffer, PID_OFFSET, child.pid)
+        second = SharedSnapshotWriter(SnapshotSampler(), writer.name, SLOTS)
+        assert not second.start()
+        assert f"Prozess {child.pid}" in capsys.readouterr().out
+
+        # Das aktive Segment bleibt unangetastet
+        writer.publish(make_snapshot(1), 1)
+        reader = SharedSnapshotReader(writer.name)
+        try:
+            assert reader.writer_pid == child.pid
+            assert reader.is_writer_alive()
+            assert reader.read_latest()["sample_count"] == 1
+        finally:
+            reader.close()
+    finally:
+        child.kill()
+        child.wait(timeout=10)
+
+    # Prozess beendet: verwaistes Segment wird ersetzt
+    reader = SharedSnapshotReader(writer.name)
+    try:
+        assert not reader.is_writer_alive()
+    finally:
+        reader.close()
+    replacement = SharedSnapshotWriter(SnapshotSampler(), writer.name, SLOTS)
+    assert replacement.start()
+    try:
+        reader = SharedSnapshotReader(writer.name)
+        try:
+            assert reader.writer_pid == os.getpid()
+            assert reader.read_latest() is None
+        finally:
+            reader.close()
+    finally:
+        replacement.stop()
+        # Das alte Segment ist bereits entfernt
+        writer.buffer = None
+        writer.segment.close()
+        writer.segment = None
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Kaltstart
+Schwere Module erst nach dem ersten Frame, Time-to-First-Frame pro Start
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import csv
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt6")
+pytest.importorskip("matplotlib")
+pytest.importorskip("pystray")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Eigener Prozess: sys.modules zeigt, was bis zu welchem Zeitpunkt geladen wurde
+CHILD_SCRIPT = r"""
+import json
+import sys
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+HEAVY_MODULES = {"matplotlib", "PIL", "pystray"}
+
+def loaded():
+    return sorted(HEAVY_MODULES & {name.split(".")[0] for name in sys.modules})
+
+from main import SystemMonitorX
+from utils.startup import StartupMetrics
+
+def setup_system_tray(self):
+    # Stand-in für den Tray: offscreen gibt es keinen Infobereich (Module werden trotzdem geladen)
+    self.tray_icon.tray_active = True
+
+SystemMonitorX.setup_system_tray = setup_system_tray
+
+result = {"after_import": loaded()}
+app = QApplication([sys.argv[0]])
+metrics = StartupMetrics()
+
+# Geladene Module genau beim ersten Frame (vor dem Nachladen im Hintergrund)
+mark_first_frame = metrics.mark_first_frame
+def record_first_frame():
+    result.setdefault("first_frame", loaded())
+    mark_first_frame()
+metrics.mark_first_frame = record_first_frame
+
+window = SystemMonitorX(startup_metrics=metrics)
+window.show()
+
+def poll():
+    if not window.services_ready:
+        return
+    timer.stop()
+    result["after_services"] = loaded()
+    result["first_frame_ms"] = metrics.main_to_first_frame_ms
+    window.open_graphs()
+    result["after_graphs"] = loaded()
+    window.graph_window.close()
+    app.quit()
+
+timer = QTimer()
+timer.timeout.connect(poll)
+timer.start(50)
+QTimer.singleShot(30000, app.quit)
+app.exec()
+print("RESULT " + json.dumps(result))
+"""
+
+
+def run_launch(workdir):
+    """Ein Dashboard-Start im Arbeitsverzeichnis, Ergebnis des Kind-Prozesses"""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=ROOT)
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=workdir, env=env, capture_output=True, text=True, timeout=90
+    )
+    lines = [line for line in completed.stdout.splitlines() if line.startswith("RESULT ")]
+    assert lines, f"Kein Ergebnis (Exit {completed.returncode}):\n{completed.stdout}\n{completed.stderr}"
+    return json.loads(lines[-1][len("RESULT "):])
+
+
+def test_heavy_modules_load_after_first_frame(tmp_path):
+    result = run_launch(tmp_path)
+
+    assert result["after_import"] == []
+    # Dashboard malt ohne Matplotlib, PIL und pystray
+    assert result["first_frame"] == []
+    assert result["first_frame_ms"] > 0
+    # Tray-Module im Hintergrund nach dem ersten Frame, Matplotlib erst mit dem Graph-Fenster
+    assert result["after_services"] == ["PIL", "pystray"]
+    assert result["after_graphs"] == ["PIL", "matplotlib", "pystray"]
+
+    # Jeder Start hängt eine Zeile mit Time-to-First-Frame an
+    run_launch(tmp_path)
+    with open(tmp_path / "logs" / "metrics" / "startup.csv", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2
+    for row in rows:
+        assert row["mode"] == "dashboard"
+        assert float(row["main_to_first_frame_ms"]) > 0
+        assert float(row["process_to_first_frame_ms"]) >= float(row["main_to_first_frame_ms"])
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Statistik-Engine
+Gleitende Kennzahlen gegen eine direkte Berechnung und konsistente Zusammenfassung
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import math
+import random
+import statistics
+import threading
+
+import pytest
+
+from utils.statistics import IndexableSkiplist, RollingStatistics, summarize_values
+
+
+def nearest_rank(values, percent):
+    """Perzentil (Nearest-Rank) direkt über die sortierten Werte"""
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(percent / 100 * len(ordered))) - 1]
+
+
+def test_window_matches_direct_calculation():
+    rng = random.Random(7)
+    stats = RollingStatistics(window_size=60, ewma_alpha=0.2)
+    values = []
+    ewma = None
+    for _ in range(500):
+        value = rng.uniform(0, 100)
+        values.append(value)
+        ewma = value if ewma is None else ewma + 0.2 * (value - ewma)
+        stats.add(value)
+
+        window = values[-60:]
+        summary = stats.get_summary()
+        assert summary["mean"] == pytest.approx(statistics.fmean(window))
+        assert summary["std"] == pytest.approx(statistics.pstdev(window), abs=1e-6)
+        assert summary["p95"] == nearest_rank(window, 95)
+        assert summary["p99"] == nearest_rank(window, 99)
+        assert summary["ewma"] == pytest.approx(ewma)
+        assert summary["count"] == len(values)
+
+
+def test_large_values_with_small_spread():
+    # Laufende Summen von x und x² verlieren hier alle Stellen (x² ~ 1e24)
+    rng = random.Random(3)
+    stats = RollingStatistics(window_size=60)
+    values = [1e12 + rng.uniform(-0.5, 0.5) for _ in range(5000)]
+    for value in values:
+        stats.add(value)
+
+    window = values[-60:]
+    assert stats.mean() == pytest.approx(statistics.fmean(window), rel=0, abs=1e-3)
+    assert stats.std() == pytest.approx(statistics.pstdev(window), rel=1e-6)
+
+
+def test_skiplist_matches_sorted_list():
+    rng = random.Random(11)
+    skiplist = IndexableSkiplist(64)
+    reference = []
+    for _ in range(3000):
+        if reference and rng.random() < 0.45:
+            value = rng.choice(reference)
+            reference.remove(value)
+            skiplist.remove(value)
+        else:
+            # Viele gleiche Werte (ganzzahlige Prozent)
+            value = float(rng.randint(0, 20))
+            reference.append(value)
+            skiplist.insert(value)
+        reference.sort()
+        assert len(skiplist) == len(reference)
+        if reference:
+            index = rng.randrange(len(reference))
+            assert skiplist[index] == reference[index]
+    assert [skiplist[i] for i in range(len(skiplist))] == reference
+
+    with pytest.raises(KeyError):
+        skiplist.remove(99.0)
+    with pytest.raises(IndexError):
+        skiplist[len(skiplist)]
+
+
+def test_summary_is_consistent_while_adding():
+    # Fortlaufende Werte 0, 1, 2, ...: Mittelwert und Anzahl gehören zum selben Fenster
+    stats = RollingStatistics(window_size=10)
+    for value in range(10):
+        stats.add(value)
+    stop = threading.Event()
+
+    def writer():
+        value = 10
+        while not stop.is_set():
+            stats.add(value)
+            value += 1
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(20000):
+            summary = stats.get_summary()
+            assert summary["mean"] == summary["count"] - 5.5
+            assert summary["p99"] == summary["count"] - 1
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_empty_and_reset():
+    stats = RollingStatistics()
+    assert stats.get_summary() == {"ewma": None, "mean": None, "std": None,
+                                   "p95": None, "p99": None, "count": 0}
+    stats.add(5)
+    stats.reset()
+    assert stats.get_summary()["count"] == 0
+
+
+def test_summarize_values():
+    assert summarize_values([3, None, 1, 2]) == {"min": 1.0, "avg": 2.0, "max": 3.0, "p95": 3.0, "count": 3}
+    assert summarize_values([])["count"] == 0
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Theme-Service
+Palette und Stylesheet einmal gebaut, ein Repolish pro Theme-Wechsel
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import re
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+
+def count_theme_work(monkeypatch, qapp, theme):
+    """Bauen von Palette/Stylesheet und Setzen auf der App zählen"""
+    calls = {"build_palette": 0, "build_stylesheet": 0, "setPalette": 0, "setStyleSheet": 0}
+    for target, names in ((theme, ("build_palette", "build_stylesheet")), (qapp, ("setPalette", "setStyleSheet"))):
+        for name in names:
+            method = getattr(target, name)
+
+            def counting(*args, name=name, method=method):
+                calls[name] += 1
+                return method(*args)
+
+            monkeypatch.setattr(target, name, counting)
+    return calls
+
+
+def test_windows_reuse_the_app_theme(qapp, theme, monkeypatch, capsys):
+    from main import SystemMonitorX
+    from widgets.cpu_widget import CPUWidget
+
+    assert theme.get_stats()["applied"] == 1
+    assert qapp.styleSheet() == theme.stylesheet
+    calls = count_theme_work(monkeypatch, qapp, theme)
+
+    window = SystemMonitorX()
+    widget = CPUWidget(window.refresh_coordinator, window.config_manager)
+    try:
+        window.open_settings()
+        # Kein eigenes Fenster-Stylesheet, keine eigene Palette
+        for view in (window, window.settings_window, widget):
+            assert view.theme is theme
+            assert view.styleSheet() == ""
+        assert calls == {"build_palette": 0, "build_stylesheet": 0, "setPalette": 0, "setStyleSheet": 0}
+
+        # Öffnungszeit wird gemessen und ausgegeben
+        output = capsys.readouterr().out
+        assert re.search(r"Einstellungen-Fenster geöffnet! \(\d+ ms\)", output)
+    finally:
+        widget.close_widget()
+        window.settings_window.close()
+        window.refresh_coordinator.stop()
+        window.close()
+
+
+def test_theme_change_repolishes_once(qapp, theme, monkeypatch):
+    calls = count_theme_work(monkeypatch, qapp, theme)
+
+    # Unveränderte Farben: nichts neu bauen oder setzen
+    assert not theme.apply()
+    assert calls == {"build_palette": 0, "build_stylesheet": 0, "setPalette": 0, "setStyleSheet": 0}
+
+    colors = dict(theme.config_manager.get_theme_colors(), accent="#2d6a7d")
+    theme.config_manager.set_theme_colors(colors)
+    assert theme.apply()
+    assert calls == {"build_palette": 1, "build_stylesheet": 1, "setPalette": 1, "setStyleSheet": 1}
+    assert "#2d6a7d" in qapp.styleSheet()
+    assert theme.get_widget_background(False)["border"][:3] == (0x2d, 0x6a, 0x7d)
+
+    stats = theme.get_stats()
+    assert stats["applied"] == 2
+    assert stats["last_apply_ms"] > 0
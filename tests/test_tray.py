@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests System-Tray
+Icon-Atlas rendert nur angefragte Zustände, Updates aus den Snapshots der App
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("PIL")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def count_calls(monkeypatch, target, name, counts):
+    """Aufrufe einer Funktion zählen"""
+    function = getattr(target, name)
+
+    def counting(*args, **kwargs):
+        counts[name] += 1
+        return function(*args, **kwargs)
+
+    monkeypatch.setattr(target, name, counting)
+
+
+def test_atlas_renders_only_requested_states(monkeypatch):
+    from PIL import Image, ImageFont
+    from utils.tray_atlas import BASE_ICON_PATH, TrayIconAtlas, band_color
+
+    counts = {"open": 0, "load_default": 0}
+    count_calls(monkeypatch, Image, "open", counts)
+    count_calls(monkeypatch, ImageFont, "load_default", counts)
+
+    atlas = TrayIconAtlas(base_icon_path=os.path.join(ROOT, BASE_ICON_PATH))
+    assert atlas.get_stats() == {"rendered": 0, "lookups": 0}
+
+    # Gleicher angezeigter Prozentwert: derselbe Eintrag, kein neues Rendering
+    icon = atlas.get(42)
+    assert atlas.get(42.9) is icon
+    assert atlas.get(5) is not icon
+    assert atlas.get(-3) is atlas.get(0)
+    assert atlas.get(250) is atlas.get(100)
+    assert atlas.get_stats() == {"rendered": 4, "lookups": 7}
+    assert [percent for percent, icon in enumerate(atlas.icons) if icon is not None] == [0, 5, 42, 100]
+
+    # Basis-Icon und Schrift nur einmal geladen
+    assert counts == {"open": 1, "load_default": 1}
+    assert icon.size == (atlas.size, atlas.size)
+
+    # Balken in der Farbe des Bands (Grün / Gelb / Rot)
+    bar_y = atlas.size // 2 + 10
+    for percent in (10, 50, 90):
+        assert atlas.get(percent).getpixel((11, bar_y + 1)) == band_color(percent)
+    assert len({band_color(percent) for percent in (10, 50, 90)}) == 3
+
+    # Alle 101 Zustände vorab, danach nur noch Zugriffe
+    atlas.build_all()
+    rendered = atlas.get_stats()["rendered"]
+    assert rendered == 101
+    for percent in range(101):
+        atlas.get(percent)
+    assert atlas.get_stats()["rendered"] == rendered
+    assert counts == {"open": 1, "load_default": 1}
+
+
+class RecordingIcon:
+    """pystray-Icon-Ersatz: merkt sich Zuweisungen an icon und title"""
+
+    def __init__(self):
+        self.assignments = []
+
+    def __setattr__(self, name, value):
+        if name != "assignments":
+            self.assignments.append(name)
+        super().__setattr__(name, value)
+
+
+def snapshot(cpu, ram=40.0, disk=55.0):
+    """Minimaler Snapshot für den Tray"""
+    return {"cpu_percent": cpu, "ram_percent": ram, "disk_percent": disk}
+
+
+def test_tray_repaints_only_on_bucket_change(workdir, monkeypatch):
+    pytest.importorskip("PyQt6")
+    pytest.importorskip("pystray")
+    import psutil
+    from utils.config import ConfigManager
+    from utils.system_tray import SystemTrayIcon
+
+    def no_sampling(*args, **kwargs):
+        raise AssertionError("Tray darf nicht selbst sampeln")
+
+    monkeypatch.setattr(psutil, "cpu_percent", no_sampling)
+
+    threads = threading.active_count()
+    tray = SystemTrayIcon(ConfigManager())
+    tray.icon = RecordingIcon()
+    tray.tray_active = True
+
+    for cpu in (10.2, 10.8, 10.0, 11.4, 11.9):
+        tray.on_snapshot(snapshot(cpu))
+
+    # Zwei angezeigte Prozentwerte: zwei Icons über die öffentliche API, nie icon._icon
+    assert tray.icon_updates == 2
+    assert tray.icon.assignments.count("icon") == 2
+    assert "_icon" not in tray.icon.assignments
+    assert tray.icon.icon is tray.icon_atlas.get(11)
+    assert tray.get_cpu_usage() == 11.0
+
+    # Tooltip mit allen Kennzahlen, nur bei geänderten gerundeten Werten
+    assert tray.icon.title == "SystemMonitorX\nCPU: 12% | RAM: 40% | Disk: 55%"
+    tooltips = tray.tooltip_updates
+    tray.on_snapshot(snapshot(11.9, ram=40.2))
+    assert tray.tooltip_updates == tooltips
+    tray.on_snapshot(snapshot(11.9, ram=43.0))
+    assert tray.tooltip_updates == tooltips + 1
+    assert "RAM: 43%" in tray.icon.title
+
+    # Fehler-Snapshots werden ignoriert; kein zusätzlicher Thread
+    tray.on_snapshot({"error": "psutil"})
+    assert tray.icon_updates == 2
+    assert threading.active_count() == threads
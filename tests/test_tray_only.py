@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Tray-Only-Modus
+Ohne Dashboard, Graphen und Widgets starten und im Ressourcen-Budget bleiben
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("PyQt6")
+pytest.importorskip("pystray")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Anlaufphase vor der Messung und Messfenster (Sekunden)
+SETTLE_SECONDS = 2
+MEASURE_SECONDS = 5
+
+# Eigener Prozess: sys.modules enthält nur, was der Tray-Only-Start wirklich lädt
+CHILD_SCRIPT = r"""
+import json
+import sys
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+import utils.system_tray
+
+def create_tray_icon(self):
+    # Stand-in für den Tray: offscreen gibt es keinen Infobereich
+    self.tray_active = True
+
+utils.system_tray.SystemTrayIcon.create_tray_icon = create_tray_icon
+
+from main import SystemMonitorX
+from utils.resources import ResourceBudget, TRAY_ONLY_BUDGET, LAZY_MODULES
+from widgets.registry import WIDGET_CLASSES
+
+# Dashboard (Theme, Graphen) und Widget-Klassen werden erst beim Öffnen geladen
+DASHBOARD_MODULES = set(LAZY_MODULES) | {"utils.graphs", "utils.theme"}
+DASHBOARD_MODULES |= {module for module, _ in WIDGET_CLASSES.values()}
+
+settle_ms, measure_ms = int(sys.argv[1]), int(sys.argv[2])
+app = QApplication([sys.argv[0]])
+app.setQuitOnLastWindowClosed(False)
+window = SystemMonitorX(tray_only=True)
+result = {}
+
+def start_budget():
+    result["budget"] = ResourceBudget(TRAY_ONLY_BUDGET)
+
+def finish():
+    budget = result.pop("budget")
+    usage = budget.measure()
+    result.update({
+        "usage": usage,
+        "violations": budget.check(usage),
+        "ui_ready": window.ui_ready,
+        "visible": window.isVisible(),
+        "tray_active": window.tray_icon.is_tray_active(),
+        "modules": sorted(name for name in sys.modules
+                          if name.split(".")[0] in ("matplotlib", "numpy", "windows")
+                          or name in DASHBOARD_MODULES)
+    })
+    app.quit()
+
+QTimer.singleShot(settle_ms, start_budget)
+QTimer.singleShot(settle_ms + measure_ms, finish)
+app.exec()
+print("RESULT " + json.dumps(result))
+"""
+
+
+@pytest.fixture(scope="module")
+def tray_only_run(tmp_path_factory):
+    """Tray-Only-Start in einem eigenen Prozess (offscreen, eigenes Arbeitsverzeichnis)"""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=ROOT)
+    completed = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, str(SETTLE_SECONDS * 1000), str(MEASURE_SECONDS * 1000)],
+        cwd=tmp_path_factory.mktemp("tray_only"), env=env, capture_output=True, text=True,
+        timeout=SETTLE_SECONDS + MEASURE_SECONDS + 60
+    )
+    lines = [line for line in completed.stdout.splitlines() if line.startswith("RESULT ")]
+    assert lines, f"Kein Ergebnis (Exit {completed.returncode}):\n{completed.stdout}\n{completed.stderr}"
+    return json.loads(lines[-1][len("RESULT "):])
+
+
+def test_tray_only_starts_without_dashboard(tray_only_run):
+    assert tray_only_run["tray_active"]
+    assert not tray_only_run["ui_ready"]
+    assert not tray_only_run["visible"]
+
+
+def test_tray_only_does_not_load_dashboard_modules(tray_only_run):
+    assert tray_only_run["modules"] == []
+    assert tray_only_run["usage"]["loaded_modules"] == []
+
+
+def test_tray_only_stays_within_budget(tray_only_run):
+    assert tray_only_run["violations"] == [], tray_only_run["usage"]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tests Desktop-Widgets
+Gemeinsamer Takt mit dem Dashboard, Hover aus dem Pixmap-Cache, Sparkline-Kosten
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+
+@pytest.fixture
+def app_window(qapp, workdir, clock):
+    """Dashboard mit allen Desktop-Widgets an einem gemeinsamen Koordinator"""
+    from main import SystemMonitorX
+
+    window = SystemMonitorX()
+    window.show()
+    window.open_widgets()
+    qapp.processEvents()
+    yield window
+    window.widget_registry.close_all()
+    window.refresh_coordinator.stop()
+    window.close()
+
+
+def count_samples(window, monkeypatch):
+    """Messungen des gemeinsamen Samplers zählen"""
+    sampler = window.refresh_coordinator.sampler
+    counts = {"samples": 0}
+    sample = sampler.sample
+
+    def counting_sample():
+        counts["samples"] += 1
+        return sample()
+
+    monkeypatch.setattr(sampler, "sample", counting_sample)
+    return counts
+
+
+def test_one_snapshot_per_wakeup_for_dashboard_and_widgets(app_window, clock, monkeypatch):
+    coordinator = app_window.refresh_coordinator
+    widgets = dict(app_window.widget_registry.widgets)
+    assert set(widgets) == {"cpu", "ram", "disk", "system"}
+    # Kein Widget mit eigenem Timer
+    assert not any(widget.owns_coordinator for widget in widgets.values())
+    assert {entry[0] for entry in coordinator.subscribers} == {app_window, *widgets.values()}
+
+    counts = count_samples(app_window, monkeypatch)
+    dashboard_updates = app_window.card_statistics["cpu"].count
+    sparkline_lengths = {name: len(widget.sparkline.values) for name, widget in widgets.items()
+                         if widget.sparkline is not None}
+    assert sparkline_lengths
+
+    wakeups = clock.run(coordinator, 10.0)
+    assert wakeups == 10
+    assert counts["samples"] == wakeups
+    assert app_window.card_statistics["cpu"].count - dashboard_updates == wakeups
+    for name, length in sparkline_lengths.items():
+        assert len(widgets[name].sparkline.values) - length == wakeups
+
+    # Verstecktes Widget wird übersprungen, geschlossenes abgemeldet
+    hidden, closed = widgets["cpu"], widgets["ram"]
+    hidden.hide()
+    closed.close_widget()
+    assert closed not in {entry[0] for entry in coordinator.subscribers}
+    assert app_window.widget_registry.get_stats()["released"] == 1
+
+    hidden_length = len(hidden.sparkline.values)
+    disk_length = len(widgets["disk"].sparkline.values)
+    counts["samples"] = 0
+    wakeups = clock.run(coordinator, 5.0)
+    assert counts["samples"] == wakeups == 5
+    assert len(hidden.sparkline.values) == hidden_length
+    assert len(widgets["disk"].sparkline.values) - disk_length == wakeups
+
+
+def test_hover_repaints_from_cached_background(qapp, theme, monkeypatch):
+    from PyQt6.QtCore import QEvent, QPointF
+    from PyQt6.QtGui import QEnterEvent
+    from PyQt6.QtWidgets import QWidget
+    from widgets.base_widget import BaseWidget
+    from widgets.cpu_widget import CPUWidget
+
+    monkeypatch.setattr(BaseWidget, "_background_cache", {})
+    widget = CPUWidget(config_manager=theme.config_manager)
+    widget.show()
+    try:
+        style_calls = []
+        for target in [widget, *widget.findChildren(QWidget)]:
+            monkeypatch.setattr(target, "setStyleSheet", style_calls.append)
+        stylesheet = widget.styleSheet()
+
+        position = QPointF(10, 10)
+        for _ in range(50):
+            widget.enterEvent(QEnterEvent(position, position, position))
+            widget.grab()
+            widget.leaveEvent(QEvent(QEvent.Type.Leave))
+            widget.grab()
+
+        # Kein Stylesheet-Wechsel, nur zwei gerenderte Hintergründe (normal / Hover)
+        assert style_calls == []
+        assert widget.styleSheet() == stylesheet
+        assert len(BaseWidget._background_cache) == 2
+        assert widget.get_background_pixmap() is widget.get_background_pixmap()
+
+        # Anderes Theme: einmal neu rendern, danach wieder aus dem Cache
+        colors = dict(theme.config_manager.get_theme_colors(), card_background="#202830")
+        theme.config_manager.set_theme_colors(colors)
+        assert theme.apply()
+        widget.grab()
+        widget.grab()
+        assert len(BaseWidget._background_cache) == 3
+    finally:
+        widget.close_widget()
+
+
+@pytest.mark.parametrize("history_size", [10, 10000])
+def test_sparkline_cost_is_independent_of_history(qapp, monkeypatch, history_size):
+    from widgets.sparkline import SparklineWidget
+
+    sparkline = SparklineWidget(history_size=history_size)
+    sparkline.resize(300, sparkline.height())
+    sparkline.show()
+    for i in range(history_size):
+        sparkline.add_value(i % 100)
+    assert len(sparkline.values) == history_size
+
+    calls = {"draw_column": 0, "rebuild_pixmap": 0}
+    for name in calls:
+        method = getattr(sparkline, name)
+
+        def counting(*args, name=name, method=method):
+            calls[name] += 1
+            return method(*args)
+
+        monkeypatch.setattr(sparkline, name, counting)
+
+    # Pro Wert genau eine neue Spalte, unabhängig von der Länge des Verlaufs
+    for i in range(100):
+        sparkline.add_value(i)
+    assert calls == {"draw_column": 100, "rebuild_pixmap": 0}
+
+    # Neuzeichnen kopiert nur das Pixmap
+    for _ in range(10):
+        sparkline.grab()
+    assert calls == {"draw_column": 100, "rebuild_pixmap": 0}
+    sparkline.close()
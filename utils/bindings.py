@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - UI-Bindings
+Dirty-Check für Labels und Progress-Bars gegen unnötige Repaints
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import weakref
+from typing import Dict, Any
+
+
+class UIBinder:
+    """
+    Binding-Schicht für SystemMonitorX
+    - Merkt sich den zuletzt angezeigten Wert pro Label/Bar
+    - Ruft setText/setValue/setStyleSheet nur bei echten Änderungen auf
+    - Zählt angewendete und übersprungene Updates
+    """
+
+    def __init__(self):
+        # Zuletzt gerenderte Werte pro Qt-Widget und Eigenschaft
+        self.last_values = weakref.WeakKeyDictionary()
+
+        # Statistik
+        self.applied = 0
+        self.skipped = 0
+
+    def _is_dirty(self, widget, prop: str, value) -> bool:
+        """Prüfen, ob sich der angezeigte Wert geändert hat, und merken"""
+        values = self.last_values.get(widget)
+        if values is None:
+            values = {}
+            self.last_values[widget] = values
+        elif values.get(prop) == value:
+            self.skipped += 1
+            return False
+
+        values[prop] = value
+        self.applied += 1
+        return True
+
+    def set_text(self, label, text: str):
+        """Label-Text setzen, falls geändert"""
+        if self._is_dirty(label, "text", text):
+            label.setText(text)
+
+    def set_value(self, progress_bar, value: float):
+        """Progress-Bar auf ganzzahligen Prozentwert setzen, falls geändert"""
+        value = int(value)
+        if self._is_dirty(progress_bar, "value", value):
+            progress_bar.setValue(value)
+
+    def set_style(self, widget, stylesheet: str):
+        """Stylesheet setzen, falls geändert"""
+        if self._is_dirty(widget, "style", stylesheet):
+            widget.setStyleSheet(stylesheet)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Anzahl angewendeter und übersprungener Updates"""
+        total = self.applied + self.skipped
+        return {
+            "applied": self.applied,
+            "skipped": self.skipped,
+            "skipped_ratio": self.skipped / total if total else 0.0
+        }
+
+
+# Gemeinsame Instanz für Dashboard und Desktop-Widgets
+ui_binder = UIBinder()
@@ -10,6 +10,8 @@ Version: 1.0.0
 
 import json
 import os
+import tempfile
+import threading
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -17,11 +19,11 @@ class ConfigManager:
     """
     Konfigurations-Manager für SystemMonitorX
     - JSON-basierte Einstellungen
-    - Widget-Positionen speichern
+    - Widget-Positionen speichern (gebündelt, atomar)
     - App-Settings verwalten
     """
     
-    def __init__(self):
+    def __init__(self, widgets_save_delay: float = 1.0):
         self.config_dir = "config"
         self.settings_file = os.path.join(self.config_dir, "settings.json")
         self.widgets_file = os.path.join(self.config_dir, "widgets.json")
@@ -38,15 +40,43 @@ class ConfigManager:
             },
             "logging": {
                 "enabled": False,
+                "log_interval": 1000,
                 "buffer_size": 60,
                 "max_files": 10,
-                "auto_save_interval": 60
+                "auto_save_interval": 60,
+                "history_retention_days": 14
             },
             "monitoring": {
                 "update_interval": 1000,
+                "low_power_interval": 5000,
                 "widgets_enabled": True,
                 "graphs_enabled": True
             },
+            "graphs": {
+                "refresh_interval": 1000,
+                "max_refresh_interval": 10000,
+                "frame_budget_ms": 50,
+                "show_frame_overlay": False
+            },
+            "metrics_server": {
+                "enabled": False,
+                "host": "127.0.0.1",
+                "port": 9464
+            },
+            "publisher": {
+                "enabled": False,
+                "socket_path": "",
+                "max_queue": 64
+            },
+            "shared_memory": {
+                "enabled": False,
+                "name": "",
+                "slots": 120
+            },
+            "fleet": {
+                "agents": [],
+                "refresh_interval": 1000
+            },
             "system_tray": {
                 "enabled": True,
                 "minimize_to_tray": True,
@@ -69,6 +99,11 @@ class ConfigManager:
             "system": {"x": 400, "y": 200, "visible": True}
         }
         
+        # Gebündeltes Speichern der Widget-Positionen
+        self.widgets_save_delay = widgets_save_delay
+        self.widgets_save_timer = None
+        self.lock = threading.RLock()
+        
         # Erstelle Config-Verzeichnis
         os.makedirs(self.config_dir, exist_ok=True)
         
@@ -94,11 +129,29 @@ class ConfigManager:
             print(f"Fehler beim Laden der Einstellungen: {e}")
             return self.default_settings.copy()
             
+    def _write_json_atomic(self, filepath: str, data: Dict[str, Any]):
+        """JSON über Temp-Datei und Umbenennen schreiben (nie halb geschrieben)"""
+        with self.lock:
+            content = json.dumps(data, indent=2, ensure_ascii=False)
+            
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(filepath) or ".", prefix=".tmp_", suffix=".json"
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, filepath)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+            
     def save_settings(self, settings: Dict[str, Any]):
         """Einstellungen speichern"""
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            self._write_json_atomic(self.settings_file, settings)
         except Exception as e:
             print(f"Fehler beim Speichern der Einstellungen: {e}")
             
@@ -123,11 +176,28 @@ class ConfigManager:
     def save_widgets(self, widgets: Dict[str, Any]):
         """Widget-Positionen speichern"""
         try:
-            with open(self.widgets_file, 'w', encoding='utf-8') as f:
-                json.dump(widgets, f, indent=2, ensure_ascii=False)
+            self._write_json_atomic(self.widgets_file, widgets)
         except Exception as e:
             print(f"Fehler beim Speichern der Widget-Positionen: {e}")
             
+    def schedule_widgets_save(self):
+        """Widget-Positionen verzögert speichern (mehrere Änderungen = ein Schreibvorgang)"""
+        with self.lock:
+            if self.widgets_save_timer is not None:
+                self.widgets_save_timer.cancel()
+            self.widgets_save_timer = threading.Timer(self.widgets_save_delay, self.flush)
+            self.widgets_save_timer.daemon = True
+            self.widgets_save_timer.start()
+            
+    def flush(self):
+        """Ausstehende Widget-Positionen sofort speichern"""
+        with self.lock:
+            if self.widgets_save_timer is None:
+                return
+            self.widgets_save_timer.cancel()
+            self.widgets_save_timer = None
+        self.save_widgets(self.widgets)
+            
     def _merge_defaults(self, current: Dict[str, Any], defaults: Dict[str, Any]):
         """Standard-Werte mit bestehenden Einstellungen zusammenführen"""
         for key, value in defaults.items():
@@ -158,14 +228,19 @@ class ConfigManager:
             return {"x": 50, "y": 50, "visible": True}
             
     def set_widget_position(self, widget_type: str, x: int, y: int, visible: bool = True):
-        """Widget-Position setzen und speichern"""
-        self.widgets[widget_type] = {
-            "x": x,
-            "y": y,
-            "visible": visible,
-            "last_updated": datetime.now().isoformat()
-        }
-        self.save_widgets(self.widgets)
+        """Widget-Position im Speicher setzen und verzögert speichern"""
+        current = self.widgets.get(widget_type, {})
+        if current.get("x") == x and current.get("y") == y and current.get("visible") == visible:
+            return
+            
+        with self.lock:
+            self.widgets[widget_type] = {
+                "x": x,
+                "y": y,
+                "visible": visible,
+                "last_updated": datetime.now().isoformat()
+            }
+        self.schedule_widgets_save()
         
     def get_theme_colors(self) -> Dict[str, str]:
         """Theme-Farben abrufen"""
@@ -194,6 +269,51 @@ class ConfigManager:
         self.settings["monitoring"] = config
         self.save_settings(self.settings)
         
+    def get_graphs_config(self) -> Dict[str, Any]:
+        """Graph-Konfiguration abrufen"""
+        return self.settings.get("graphs", self.default_settings["graphs"])
+        
+    def set_graphs_config(self, config: Dict[str, Any]):
+        """Graph-Konfiguration setzen"""
+        self.settings["graphs"] = config
+        self.save_settings(self.settings)
+        
+    def get_metrics_server_config(self) -> Dict[str, Any]:
+        """Metrics-Endpoint-Konfiguration abrufen"""
+        return self.settings.get("metrics_server", self.default_settings["metrics_server"])
+        
+    def set_metrics_server_config(self, config: Dict[str, Any]):
+        """Metrics-Endpoint-Konfiguration setzen"""
+        self.settings["metrics_server"] = config
+        self.save_settings(self.settings)
+        
+    def get_publisher_config(self) -> Dict[str, Any]:
+        """Snapshot-Publisher-Konfiguration abrufen"""
+        return self.settings.get("publisher", self.default_settings["publisher"])
+        
+    def set_publisher_config(self, config: Dict[str, Any]):
+        """Snapshot-Publisher-Konfiguration setzen"""
+        self.settings["publisher"] = config
+        self.save_settings(self.settings)
+        
+    def get_shared_memory_config(self) -> Dict[str, Any]:
+        """Shared-Memory-Konfiguration abrufen"""
+        return self.settings.get("shared_memory", self.default_settings["shared_memory"])
+        
+    def set_shared_memory_config(self, config: Dict[str, Any]):
+        """Shared-Memory-Konfiguration setzen"""
+        self.settings["shared_memory"] = config
+        self.save_settings(self.settings)
+        
+    def get_fleet_config(self) -> Dict[str, Any]:
+        """Flotten-Konfiguration abrufen"""
+        return self.settings.get("fleet", self.default_settings["fleet"])
+        
+    def set_fleet_config(self, config: Dict[str, Any]):
+        """Flotten-Konfiguration setzen"""
+        self.settings["fleet"] = config
+        self.save_settings(self.settings)
+        
     def get_system_tray_config(self) -> Dict[str, Any]:
         """System-Tray-Konfiguration abrufen"""
         return self.settings.get("system_tray", self.default_settings["system_tray"])
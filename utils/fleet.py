@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Flotten-Client
+Snapshots mehrerer Collector-Agents per TCP empfangen und zusammenfassen
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
+
+from utils.publisher import DEFAULT_AGENT_PORT
+from utils.statistics import summarize_values
+
+# Kennzahlen der Flotten-Übersicht: (Snapshot-Schlüssel, Anzeige)
+FLEET_METRICS = [
+    ("cpu_percent", "CPU"),
+    ("ram_percent", "RAM"),
+    ("disk_percent", "Festplatte")
+]
+
+# Ohne neuen Frame gilt ein Host nach dieser Zeit als veraltet (s)
+STALE_AFTER = 5.0
+
+
+def parse_agents(spec) -> List[Tuple[str, int]]:
+    """Agent-Liste aus "host:port,host2" bzw. einer Liste lesen (Port optional)"""
+    entries = spec.split(",") if isinstance(spec, str) else list(spec or [])
+    agents = []
+    for entry in entries:
+        entry = entry.strip()
+        if not entry:
+            continue
+        host, _, port = entry.rpartition(":")
+        if not host:
+            host, port = port, ""
+        agents.append((host, int(port) if port else DEFAULT_AGENT_PORT))
+    return agents
+
+
+class AgentState:
+    """Verbindungszustand und letzter Snapshot eines Agents"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.status = "verbinde"
+        self.error = None
+        self.snapshot = None
+        self.last_seen = None
+        self.frames = 0
+        self.reconnects = 0
+
+    def get_address(self) -> str:
+        """Adresse als host:port"""
+        return f"{self.host}:{self.port}"
+
+
+class FleetClient:
+    """
+    Flotten-Client für SystemMonitorX
+    - Eine asyncio-Verbindung pro Agent (eigener Thread mit Event-Loop)
+    - Liest den JSONL-Feed der Agents, hält nur den letzten Snapshot pro Host
+    - Automatischer Reconnect mit wachsender Wartezeit
+    - get_rows()/get_summary() für den GUI-Thread (eine Abfrage pro Refresh)
+    """
+
+    def __init__(self, agents: List[Tuple[str, int]], reconnect_delay: float = 1.0,
+                 max_reconnect_delay: float = 10.0):
+        self.agents = [AgentState(host, port) for host, port in agents]
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        # Zähler für neue Frames: unverändert = nichts neu zu zeichnen
+        self.version = 0
+        self.lock = threading.Lock()
+
+        self.thread = None
+        self.loop = None
+        self.stopping = None
+        self.ready = threading.Event()
+
+    def start(self, timeout: float = 5.0):
+        """Client-Thread starten (wartet, bis stop() ihn erreichen kann)"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+            self.ready.wait(timeout)
+
+    def stop(self):
+        """Alle Verbindungen schließen (mehrfacher Aufruf ist unschädlich)"""
+        if self.loop is not None and self.stopping is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.stopping.set)
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+
+    def _run(self):
+        """Event-Loop des Client-Threads"""
+        try:
+            asyncio.run(self._main())
+        except Exception as e:
+            print(f"Fehler im Flotten-Client: {e}")
+        finally:
+            self.ready.set()
+
+    async def _main(self):
+        """Eine Task pro Agent bis stop()"""
+        self.loop = asyncio.get_running_loop()
+        self.stopping = asyncio.Event()
+        self.ready.set()
+        tasks = [asyncio.create_task(self._follow_agent(agent)) for agent in self.agents]
+        await self.stopping.wait()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _follow_agent(self, agent: AgentState):
+        """Verbindung zu einem Agent halten und Frames übernehmen"""
+        delay = self.reconnect_delay
+        while True:
+            writer = None
+            try:
+                reader, writer = await asyncio.open_connection(agent.host, agent.port)
+                writer.write(b"jsonl\n")
+                await writer.drain()
+                self._set_status(agent, "verbunden")
+                delay = self.reconnect_delay
+
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    self._on_frame(agent, json.loads(line))
+                self._set_status(agent, "getrennt", "Verbindung vom Agent geschlossen")
+
+            except (OSError, ValueError) as e:
+                self._set_status(agent, "getrennt", str(e))
+            finally:
+                if writer is not None:
+                    writer.close()
+
+            agent.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    def _on_frame(self, agent: AgentState, snapshot: Dict[str, Any]):
+        """Neuen Snapshot eines Agents übernehmen"""
+        with self.lock:
+            agent.snapshot = snapshot
+            agent.last_seen = time.monotonic()
+            agent.frames += 1
+            self.version += 1
+
+    def _set_status(self, agent: AgentState, status: str, error: Optional[str] = None):
+        """Verbindungsstatus eines Agents setzen"""
+        with self.lock:
+            agent.status = status
+            agent.error = error
+            self.version += 1
+
+    def get_rows(self) -> Tuple[List[Dict[str, Any]], int]:
+        """Eine Zeile pro Agent (Kopie, thread-sicher) und die Version dieses Stands"""
+        now = time.monotonic()
+        rows = []
+        with self.lock:
+            for agent in self.agents:
+                snapshot = agent.snapshot or {}
+                age = None if agent.last_seen is None else now - agent.last_seen
+                fresh = agent.status == "verbunden" and age is not None and age <= STALE_AFTER
+                status = agent.status
+                if status == "verbunden" and age is not None and not fresh:
+                    status = "veraltet"
+                row = {
+                    "address": agent.get_address(),
+                    "hostname": snapshot.get("hostname") or agent.host,
+                    "status": status,
+                    "error": agent.error,
+                    "age_s": age,
+                    "fresh": fresh
+                }
+                for key, _ in FLEET_METRICS:
+                    row[key] = snapshot.get(key)
+                rows.append(row)
+            # Im selben Lock-Abschnitt: Zeilen und Version passen zusammen
+            version = self.version
+        return rows, version
+
+    def get_summary(self, rows: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+        """Flottenweite Min/Ø/Max/p95 pro Kennzahl (nur aktuelle Hosts)"""
+        rows = self.get_rows()[0] if rows is None else rows
+        fresh = [row for row in rows if row["fresh"]]
+        return {key: summarize_values(row[key] for row in fresh) for key, _ in FLEET_METRICS}
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Frame-Statistik
+Zeitmessung von Redraws und Daten-Updates mit Histogramm pro Tab
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import bisect
+import time
+from collections import deque
+from typing import Dict, Any, List
+
+# Histogramm-Grenzen in Millisekunden (letzter Bucket: alles darüber)
+FRAME_BUCKETS_MS = [1, 2, 4, 8, 16, 33, 50, 100, 200, 500]
+
+
+class FrameTimer:
+    """
+    Frame-Zeitmessung für das Graph-Fenster
+    - Histogramm der Draw-Zeiten pro Tab
+    - Zeitmessung der Daten-Updates
+    - FPS über die letzte Sekunde
+    - Geglättete Draw-Zeit (EWMA) für Auto-Throttling
+    """
+
+    def __init__(self, smoothing: float = 0.2):
+        self.smoothing = smoothing
+
+        # Histogramme pro Tab: Liste von Zählern je Bucket
+        self.histograms = {}
+        self.frame_counts = {}
+        self.total_draw_ms = {}
+
+        # Daten-Updates
+        self.update_count = 0
+        self.total_update_ms = 0.0
+        self.last_update_ms = 0.0
+
+        # Letzte Frames für FPS und geglättete Draw-Zeit
+        self.frame_times = deque()
+        self.last_draw_ms = 0.0
+        self.smoothed_draw_ms = None
+
+    def record_frame(self, tab: str, draw_ms: float):
+        """Draw-Zeit eines Frames erfassen"""
+        if tab not in self.histograms:
+            self.histograms[tab] = [0] * (len(FRAME_BUCKETS_MS) + 1)
+            self.frame_counts[tab] = 0
+            self.total_draw_ms[tab] = 0.0
+
+        # Bucket i: [Grenze i-1, Grenze i) - ein Frame von genau 16 ms zählt nicht als "<16"
+        self.histograms[tab][bisect.bisect_right(FRAME_BUCKETS_MS, draw_ms)] += 1
+        self.frame_counts[tab] += 1
+        self.total_draw_ms[tab] += draw_ms
+
+        self.last_draw_ms = draw_ms
+        if self.smoothed_draw_ms is None:
+            self.smoothed_draw_ms = draw_ms
+        else:
+            self.smoothed_draw_ms += self.smoothing * (draw_ms - self.smoothed_draw_ms)
+
+        now = time.perf_counter()
+        self.frame_times.append(now)
+        while self.frame_times and now - self.frame_times[0] > 1.0:
+            self.frame_times.popleft()
+
+    def record_update(self, update_ms: float):
+        """Dauer eines Daten-Updates erfassen"""
+        self.update_count += 1
+        self.total_update_ms += update_ms
+        self.last_update_ms = update_ms
+
+    def get_fps(self) -> float:
+        """Frames in der letzten Sekunde"""
+        now = time.perf_counter()
+        while self.frame_times and now - self.frame_times[0] > 1.0:
+            self.frame_times.popleft()
+        return float(len(self.frame_times))
+
+    def get_histogram(self, tab: str) -> List[Dict[str, Any]]:
+        """Histogramm eines Tabs als Liste von Buckets"""
+        counts = self.histograms.get(tab, [0] * (len(FRAME_BUCKETS_MS) + 1))
+        buckets = []
+        lower = 0
+        for i, count in enumerate(counts):
+            upper = FRAME_BUCKETS_MS[i] if i < len(FRAME_BUCKETS_MS) else None
+            buckets.append({"from_ms": lower, "to_ms": upper, "count": count})
+            lower = upper
+        return buckets
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Zusammenfassung aller Messungen"""
+        tabs = {}
+        for tab, count in self.frame_counts.items():
+            tabs[tab] = {
+                "frames": count,
+                "avg_draw_ms": self.total_draw_ms[tab] / count if count else 0.0,
+                "histogram": self.get_histogram(tab)
+            }
+        return {
+            "tabs": tabs,
+            "updates": self.update_count,
+            "avg_update_ms": self.total_update_ms / self.update_count if self.update_count else 0.0,
+            "fps": self.get_fps(),
+            "smoothed_draw_ms": self.smoothed_draw_ms or 0.0
+        }
+
+    def format_summary(self) -> str:
+        """Zusammenfassung als lesbarer Text"""
+        summary = self.get_summary()
+        lines = [f"Daten-Updates: {summary['updates']} (Ø {summary['avg_update_ms']:.1f} ms)"]
+        for tab, stats in summary["tabs"].items():
+            histogram = " ".join(
+                f"<{b['to_ms']}:{b['count']}" if b['to_ms'] is not None else f">={b['from_ms']}:{b['count']}"
+                for b in stats["histogram"] if b["count"]
+            )
+            lines.append(f"{tab}: {stats['frames']} Frames, Ø {stats['avg_draw_ms']:.1f} ms [{histogram}]")
+        return "\n".join(lines)
@@ -8,20 +8,22 @@ Autor: SystemMonitorX Team
 Version: 1.0.0
 """
 
-import matplotlib.pyplot as plt
+import matplotlib.style
 import matplotlib.dates as mdates
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import psutil
-import threading
 import time
 
-# Dark Mode Matplotlib Styling
-plt.style.use('dark_background')
+from utils.statistics import RollingStatistics
+
+# Werte mit Statistik-Overlay (CPU-, RAM- und Disk-Tab)
+STATISTIC_KEYS = ['cpu_percent', 'ram_percent', 'disk_percent']
+
+# Dark Mode Matplotlib Styling (pro Figure statt global, ohne pyplot)
+DARK_STYLE = 'dark_background'
 
 class SystemGraphs:
     """
@@ -49,81 +51,253 @@ class SystemGraphs:
         self.data_history = []
         self.max_history = 300  # 5 Minuten bei 1s Updates
         
-        # Threading
-        self.graphing_active = False
-        self.graphing_thread = None
+        # Figure-Pool: pro Graph-Typ ein wiederverwendbarer Eintrag
+        # mit Figure, Canvas und Toolbar
+        self.figure_pool = {}
+        
+        # Streaming-Statistik pro Wert, optional als Overlay gezeichnet
+        self.statistics = {key: RollingStatistics() for key in STATISTIC_KEYS}
+        self.show_overlays = False
+        
+        # Verlaufs-Modus (Daten aus logs/ statt Live-History)
+        self.history_mode = False
+        self.history_span = None  # (start, end) als Unix-Zeit, auch für später aufgebaute Tabs
+        self.history_store = None
+        self.on_view_changed = None
         
     def create_system_overview_graph(self) -> Figure:
         """System-Übersicht Graph erstellen"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
+        fig = Figure(figsize=(12, 8))
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         fig.patch.set_facecolor(self.colors['background'])
+        fig.graph_lines = []
         
         # CPU Graph
         self._setup_axis(ax1, "CPU Auslastung", "%", self.colors['cpu'])
         ax1.set_title("CPU", color=self.colors['text'], fontsize=14, fontweight='bold')
+        self._add_data_line(fig, ax1, 'cpu_percent', self.colors['cpu'])
         
         # RAM Graph
         self._setup_axis(ax2, "RAM Auslastung", "%", self.colors['ram'])
         ax2.set_title("RAM", color=self.colors['text'], fontsize=14, fontweight='bold')
+        self._add_data_line(fig, ax2, 'ram_percent', self.colors['ram'])
         
         # Disk Graph
         self._setup_axis(ax3, "Festplatten Auslastung", "%", self.colors['disk'])
         ax3.set_title("Festplatte", color=self.colors['text'], fontsize=14, fontweight='bold')
+        self._add_data_line(fig, ax3, 'disk_percent', self.colors['disk'])
         
         # System Info
         self._setup_system_info(ax4)
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
         
     def create_cpu_graph(self) -> Figure:
         """CPU-spezifischer Graph"""
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+        fig = Figure(figsize=(12, 8))
+        ax1, ax2 = fig.subplots(2, 1)
         fig.patch.set_facecolor(self.colors['background'])
+        fig.graph_lines = []
         
         # CPU Auslastung
         self._setup_axis(ax1, "CPU Auslastung", "%", self.colors['cpu'])
         ax1.set_title("CPU Auslastung", color=self.colors['text'], fontsize=16, fontweight='bold')
+        self._add_data_line(fig, ax1, 'cpu_percent', self.colors['cpu'])
+        self._add_overlay_lines(fig, ax1, 'cpu_percent', self.colors['cpu'])
         
         # CPU Frequenz
         self._setup_axis(ax2, "CPU Frequenz", "GHz", self.colors['accent'])
         ax2.set_title("CPU Frequenz", color=self.colors['text'], fontsize=16, fontweight='bold')
+        self._add_data_line(fig, ax2, 'cpu_freq_ghz', self.colors['accent'])
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
         
     def create_ram_graph(self) -> Figure:
         """RAM-spezifischer Graph"""
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+        fig = Figure(figsize=(12, 8))
+        ax1, ax2 = fig.subplots(2, 1)
         fig.patch.set_facecolor(self.colors['background'])
+        fig.graph_lines = []
         
         # RAM Auslastung
         self._setup_axis(ax1, "RAM Auslastung", "%", self.colors['ram'])
         ax1.set_title("RAM Auslastung", color=self.colors['text'], fontsize=16, fontweight='bold')
+        self._add_data_line(fig, ax1, 'ram_percent', self.colors['ram'])
+        self._add_overlay_lines(fig, ax1, 'ram_percent', self.colors['ram'])
         
         # RAM Verwendung
         self._setup_axis(ax2, "RAM Verwendung", "GB", self.colors['accent'])
         ax2.set_title("RAM Verwendung", color=self.colors['text'], fontsize=16, fontweight='bold')
+        self._add_data_line(fig, ax2, 'ram_used_gb', self.colors['accent'])
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
         
     def create_disk_graph(self) -> Figure:
         """Disk-spezifischer Graph"""
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
+        fig = Figure(figsize=(12, 8))
+        ax1, ax2 = fig.subplots(2, 1)
         fig.patch.set_facecolor(self.colors['background'])
+        fig.graph_lines = []
         
         # Disk Auslastung
         self._setup_axis(ax1, "Festplatten Auslastung", "%", self.colors['disk'])
         ax1.set_title("Festplatten Auslastung", color=self.colors['text'], fontsize=16, fontweight='bold')
+        self._add_data_line(fig, ax1, 'disk_percent', self.colors['disk'])
+        self._add_overlay_lines(fig, ax1, 'disk_percent', self.colors['disk'])
         
         # Disk Verwendung
         self._setup_axis(ax2, "Festplatten Verwendung", "GB", self.colors['accent'])
         ax2.set_title("Festplatten Verwendung", color=self.colors['text'], fontsize=16, fontweight='bold')
+        self._add_data_line(fig, ax2, 'disk_used_gb', self.colors['accent'])
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
         
+    def _add_data_line(self, fig, ax, data_key: str, color: str):
+        """Leere Datenlinie anlegen, die später nur neu gebunden wird"""
+        line, = ax.plot([], [], color=color, linewidth=2, marker='o', markersize=3)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
+        ax.tick_params(axis='x', labelrotation=45)
+        fig.graph_lines.append((ax, line, data_key))
+        return line
+        
+    def _add_overlay_lines(self, fig, ax, data_key: str, color: str):
+        """Statistik-Overlays (EWMA, Mittelwert ± Std, p95/p99) anlegen"""
+        if not hasattr(fig, 'overlay_lines'):
+            fig.overlay_lines = []
+            
+        overlay = {
+            'ewma': ax.plot([], [], color=self.colors['text'], linewidth=1.5,
+                            linestyle='--', label='EWMA')[0],
+            'mean': ax.plot([], [], color=self.colors['system'], linewidth=1.2,
+                            label='Ø gleitend')[0],
+            'std_upper': ax.plot([], [], color=self.colors['system'], linewidth=0.8,
+                                 linestyle=':', label='Ø ± σ')[0],
+            'std_lower': ax.plot([], [], color=self.colors['system'], linewidth=0.8,
+                                 linestyle=':')[0],
+            'p95': ax.plot([], [], color='#ffc107', linewidth=1, linestyle='-.', label='p95')[0],
+            'p99': ax.plot([], [], color='#f44336', linewidth=1, linestyle='-.', label='p99')[0]
+        }
+        legend = ax.legend(loc='upper left', fontsize=8, facecolor=self.colors['background'],
+                           labelcolor=self.colors['text'])
+        overlay['legend'] = legend
+        
+        fig.overlay_lines.append((ax, data_key, overlay))
+        self._set_overlay_visible(overlay, False)
+        
+    def _set_overlay_visible(self, overlay: Dict[str, Any], visible: bool):
+        """Overlay-Linien und Legende ein-/ausblenden"""
+        for artist in overlay.values():
+            artist.set_visible(visible)
+            
+    def bind_overlays(self, fig: Figure, recent_data: List[Dict[str, Any]]):
+        """Statistik-Overlays an die aktuelle History binden"""
+        visible = self.show_overlays and not self.history_mode and len(recent_data) > 1
+        
+        for ax, data_key, overlay in getattr(fig, 'overlay_lines', []):
+            self._set_overlay_visible(overlay, visible)
+            if not visible:
+                continue
+                
+            timestamps = [d['timestamp'] for d in recent_data]
+            means = [d.get(f'{data_key}_mean', 0) for d in recent_data]
+            stds = [d.get(f'{data_key}_std', 0) for d in recent_data]
+            
+            overlay['ewma'].set_data(timestamps, [d.get(f'{data_key}_ewma', 0) for d in recent_data])
+            overlay['mean'].set_data(timestamps, means)
+            overlay['std_upper'].set_data(timestamps, [m + sd for m, sd in zip(means, stds)])
+            overlay['std_lower'].set_data(timestamps, [m - sd for m, sd in zip(means, stds)])
+            
+            # Perzentile des aktuellen Fensters als horizontale Linien
+            summary = self.statistics[data_key].get_summary()
+            span = [timestamps[0], timestamps[-1]]
+            overlay['p95'].set_data(span, [summary['p95']] * 2)
+            overlay['p99'].set_data(span, [summary['p99']] * 2)
+            
+    def get_statistics_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Aktuelle Kennzahlen aller Statistik-Werte"""
+        return {key: stats.get_summary() for key, stats in self.statistics.items()}
+        
+    def set_history_mode(self, enabled: bool, span_hours: float = 1.0):
+        """Zwischen Live-Daten und Verlauf aus logs/ umschalten"""
+        self.history_mode = enabled
+        if not enabled:
+            self.history_span = None
+            return
+            
+        if self.history_store is None:
+            from utils.history import LogHistoryStore
+            self.history_store = LogHistoryStore()
+            
+        # Startansicht: die letzte Stunde der vorhandenen Logs
+        bounds = self.history_store.get_time_bounds()
+        end = bounds[1] if bounds else time.time()
+        self.history_span = (end - span_hours * 3600, end)
+        for pooled in self.figure_pool.values():
+            self.apply_history_span(pooled['figure'])
+                
+    def apply_history_span(self, fig: Figure):
+        """Gespeicherte Verlaufs-Spanne auf die Achsen einer Figure setzen"""
+        if self.history_span is None:
+            return
+        start, end = self.history_span
+        for ax, line, data_key in getattr(fig, 'graph_lines', []):
+            ax.set_xlim(datetime.fromtimestamp(start), datetime.fromtimestamp(end))
+                
+    def bind_history(self, fig: Figure):
+        """Verlaufsdaten für den sichtbaren Bereich jeder Achse binden"""
+        for ax, line, data_key in getattr(fig, 'graph_lines', []):
+            x_min, x_max = ax.get_xlim()
+            start = mdates.num2date(x_min).replace(tzinfo=None).timestamp()
+            end = mdates.num2date(x_max).replace(tzinfo=None).timestamp()
+            
+            tile_data = self.history_store.get_range(start, end)
+            timestamps = [datetime.fromtimestamp(t) for t in tile_data['timestamps']]
+            line.set_data(timestamps, tile_data[data_key])
+            
+            # Marker nur bei wenigen Punkten (Performance bei langen Spannen)
+            line.set_marker('o' if len(timestamps) <= 300 else '')
+            
+            # Datumsformat an Spanne anpassen
+            date_format = '%H:%M:%S' if end - start <= 86400 else '%d.%m. %H:%M'
+            ax.xaxis.set_major_formatter(mdates.DateFormatter(date_format))
+            
+    def _on_xlim_changed(self, graph_type: str):
+        """Achse wurde verschoben oder gezoomt"""
+        if self.history_mode and self.on_view_changed:
+            self.on_view_changed(graph_type)
+        
+    def bind_data(self, fig: Figure):
+        """Aktuelle History an die bestehenden Linien einer Figure binden"""
+        if self.history_mode and self.history_store:
+            self.bind_history(fig)
+            self.bind_overlays(fig, [])
+            return
+            
+        recent_data = self.get_recent_data()
+        self.bind_points(fig, recent_data)
+        self.bind_overlays(fig, recent_data)
+        
+    def bind_points(self, fig: Figure, data_points: List[Dict[str, Any]]):
+        """Datenpunkte an die Linien einer Figure binden und X-Achse anpassen"""
+        timestamps = [d['timestamp'] for d in data_points]
+        
+        # Datumsformat und Marker an Spanne/Punktzahl anpassen
+        long_span = len(timestamps) > 1 and (timestamps[-1] - timestamps[0]).total_seconds() > 86400
+        date_format = '%d.%m. %H:%M' if long_span else '%H:%M:%S'
+        
+        for ax, line, data_key in getattr(fig, 'graph_lines', []):
+            line.set_data(timestamps, [d[data_key] for d in data_points])
+            line.set_marker('o' if len(timestamps) <= 300 else '')
+            ax.xaxis.set_major_formatter(mdates.DateFormatter(date_format))
+            
+            # X-Achse an sichtbares Zeitfenster anpassen
+            if len(timestamps) > 1:
+                ax.set_xlim(timestamps[0], timestamps[-1])
+                
     def _setup_axis(self, ax, ylabel, unit, color):
         """Axis für Dark Mode konfigurieren"""
         ax.set_facecolor(self.colors['background'])
@@ -186,6 +360,14 @@ OS: {platform}
             'disk_used_gb': data.get('disk_used_gb', 0)
         }
         
+        # Streaming-Statistik fortschreiben und Verlauf für Overlays merken
+        for key, stats in self.statistics.items():
+            stats.add(data_point[key])
+            summary = stats.get_summary()
+            data_point[f'{key}_ewma'] = summary['ewma']
+            data_point[f'{key}_mean'] = summary['mean']
+            data_point[f'{key}_std'] = summary['std']
+        
         self.data_history.append(data_point)
         
         # History begrenzen
@@ -216,78 +398,70 @@ OS: {platform}
         
         # X-Achse Format
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-        plt.setp(ax.xaxis.get_majorticklabels(), rotation=45)
-        
-    def start_live_updates(self):
-        """Live-Updates starten"""
-        if not self.graphing_active:
-            self.graphing_active = True
-            self.graphing_thread = threading.Thread(target=self._live_update_loop, daemon=True)
-            self.graphing_thread.start()
-            
-    def stop_live_updates(self):
-        """Live-Updates stoppen"""
-        self.graphing_active = False
-        
-    def _live_update_loop(self):
-        """Live-Update-Schleife"""
-        while self.graphing_active:
-            try:
-                # System-Daten sammeln
-                data = self._collect_system_data()
-                self.update_graph_data(data)
-                
-            except Exception as e:
-                print(f"Fehler im Live-Update-Loop: {e}")
-                
-            time.sleep(1)  # 1 Sekunde warten
-            
-    def _collect_system_data(self) -> Dict[str, Any]:
-        """System-Daten für Graphen sammeln"""
-        try:
-            # CPU-Daten
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            cpu_freq = psutil.cpu_freq()
-            cpu_freq_ghz = cpu_freq.current / 1000 if cpu_freq else 0
-            
-            # RAM-Daten
-            memory = psutil.virtual_memory()
-            ram_percent = memory.percent
-            ram_used_gb = memory.used / (1024**3)
-            
-            # Disk-Daten
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
-            disk_used_gb = disk.used / (1024**3)
+        ax.tick_params(axis='x', labelrotation=45)
+        
+    def create_figure(self, graph_type: str) -> Figure:
+        """Figure für einen Graph-Typ erstellen (ohne Qt)"""
+        builders = {
+            "overview": self.create_system_overview_graph,
+            "cpu": self.create_cpu_graph,
+            "ram": self.create_ram_graph,
+            "disk": self.create_disk_graph
+        }
+        if graph_type not in builders:
+            raise ValueError(f"Unbekannter Graph-Typ: {graph_type}")
             
-            return {
-                'cpu_percent': cpu_percent,
-                'cpu_freq_ghz': cpu_freq_ghz,
-                'ram_percent': ram_percent,
-                'ram_used_gb': ram_used_gb,
-                'disk_percent': disk_percent,
-                'disk_used_gb': disk_used_gb
-            }
-            
-        except Exception as e:
-            print(f"Fehler beim Sammeln der Graph-Daten: {e}")
-            return {}
+        # Dark Mode nur für diese Figure (globale rcParams bleiben unberührt)
+        with matplotlib.style.context(DARK_STYLE):
+            return builders[graph_type]()
             
     def create_graph_widget(self, graph_type: str):
-        """Graph-Widget mit Navigation erstellen"""
-        if graph_type == "overview":
-            fig = self.create_system_overview_graph()
-        elif graph_type == "cpu":
-            fig = self.create_cpu_graph()
-        elif graph_type == "ram":
-            fig = self.create_ram_graph()
-        elif graph_type == "disk":
-            fig = self.create_disk_graph()
-        else:
-            raise ValueError(f"Unbekannter Graph-Typ: {graph_type}")
+        """Graph-Widget mit Navigation erstellen (aus dem Pool, falls vorhanden)"""
+        pooled = self.figure_pool.get(graph_type)
+        if pooled:
+            return pooled['canvas'], pooled['toolbar'], pooled['figure']
             
+        # Qt-Backend erst hier laden, damit Figures auch headless (Agg) gehen
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+        
+        fig = self.create_figure(graph_type)
+        
         # Canvas erstellen
         canvas = FigureCanvas(fig)
         toolbar = NavigationToolbar(canvas, None)
         
-        return canvas, toolbar, fig 
\ No newline at end of file
+        # Im Verlaufs-Modus neu aufgebaute Tabs auf die aktuelle Spanne setzen
+        if self.history_mode:
+            self.apply_history_span(fig)
+            
+        # Pan/Zoom melden (für Nachladen im Verlaufs-Modus)
+        for ax, line, data_key in getattr(fig, 'graph_lines', []):
+            ax.callbacks.connect('xlim_changed', lambda ax, gt=graph_type: self._on_xlim_changed(gt))
+            
+        # Im Pool ablegen, damit Refreshes nur noch Daten neu binden
+        self.figure_pool[graph_type] = {
+            'figure': fig,
+            'canvas': canvas,
+            'toolbar': toolbar
+        }
+        
+        return canvas, toolbar, fig
+        
+    def refresh_graph(self, graph_type: str, immediate: bool = False):
+        """Gepoolten Graph mit aktuellen Daten neu zeichnen"""
+        pooled = self.figure_pool.get(graph_type)
+        if not pooled:
+            return
+            
+        self.bind_data(pooled['figure'])
+        if immediate:
+            pooled['canvas'].draw()
+        else:
+            pooled['canvas'].draw_idle()
+        
+    def release_graph_widgets(self):
+        """Alle gepoolten Figures freigeben"""
+        for pooled in self.figure_pool.values():
+            pooled['figure'].clear()
+        self.figure_pool.clear() 
\ No newline at end of file
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Verlaufs-Speicher
+Langzeit-Verlauf schreiben und lazy in Zeit-Kacheln mit Level-of-Detail laden
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import csv
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
+
+# Werte, die aus den Logs für Graphen geladen werden
+HISTORY_KEYS = [
+    "cpu_percent", "cpu_freq_ghz",
+    "ram_percent", "ram_used_gb",
+    "disk_percent", "disk_used_gb"
+]
+
+# Dateiname des SystemLoggers: system_monitor_YYYYmmdd_HHMMSS.(json|csv)
+LOG_FILE_PATTERN = re.compile(r"^system_monitor_(\d{8}_\d{6})\.(json|csv)$")
+
+# Langzeit-Verlauf: eine CSV-Datei pro Stunde (UTC) in logs/history/
+HISTORY_DIR = "history"
+HISTORY_FILE_PATTERN = re.compile(r"^system_history_(\d{8}_\d{2})\.csv$")
+HISTORY_FILE_SPAN = 3600
+DEFAULT_RETENTION_DAYS = 14
+
+
+def history_file_start(stamp: str) -> float:
+    """Beginn (Epoch-Sekunden) einer Stundendatei aus ihrem Zeitstempel"""
+    return datetime.strptime(stamp, "%Y%m%d_%H").replace(tzinfo=timezone.utc).timestamp()
+
+
+class HistoryWriter:
+    """
+    Langzeit-Verlauf für SystemMonitorX
+    - Hängt jeden gespeicherten Log-Buffer an Stundendateien in logs/history/ an
+    - Nur Zeitstempel und Graph-Werte (kompakt, einige MB pro Tag bei 1 Hz)
+    - Löscht Dateien nach Alter (Aufbewahrung in Tagen) statt nach Anzahl
+    """
+
+    def __init__(self, logs_dir: str = "logs", retention_days: float = DEFAULT_RETENTION_DAYS):
+        self.history_dir = os.path.join(logs_dir, HISTORY_DIR)
+        self.retention_days = retention_days
+
+    def append(self, rows: List[Dict[str, Any]]) -> int:
+        """Datensätze an die passenden Stundendateien anhängen (Fehler-Einträge auslassen)"""
+        groups = OrderedDict()
+        for row in rows:
+            if row.get("error"):
+                continue
+            try:
+                timestamp = datetime.fromisoformat(row["timestamp"]).timestamp()
+                values = [round(float(row.get(key) or 0), 3) for key in HISTORY_KEYS]
+            except (KeyError, TypeError, ValueError):
+                continue
+            stamp = datetime.fromtimestamp(timestamp, timezone.utc).strftime("%Y%m%d_%H")
+            groups.setdefault(stamp, []).append([round(timestamp, 3)] + values)
+
+        if not groups:
+            return 0
+        os.makedirs(self.history_dir, exist_ok=True)
+        created = False
+        for stamp, lines in groups.items():
+            filepath = os.path.join(self.history_dir, f"system_history_{stamp}.csv")
+            new_file = not os.path.exists(filepath)
+            with open(filepath, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(["timestamp"] + HISTORY_KEYS)
+                writer.writerows(lines)
+            created |= new_file
+
+        # Aufräumen nur, wenn eine neue Stunde begonnen hat
+        if created:
+            self.cleanup()
+        return sum(len(lines) for lines in groups.values())
+
+    def cleanup(self, now: Optional[float] = None) -> int:
+        """Stundendateien löschen, die älter als die Aufbewahrungsdauer sind"""
+        cutoff = (time.time() if now is None else now) - self.retention_days * 86400
+        removed = 0
+        try:
+            for filename in os.listdir(self.history_dir):
+                match = HISTORY_FILE_PATTERN.match(filename)
+                if match and history_file_start(match.group(1)) + HISTORY_FILE_SPAN < cutoff:
+                    os.remove(os.path.join(self.history_dir, filename))
+                    removed += 1
+        except Exception as e:
+            print(f"Fehler beim Aufräumen des Verlaufs: {e}")
+        return removed
+
+
+class LogHistoryStore:
+    """
+    Verlaufs-Speicher für SystemMonitorX
+    - Liest den Langzeit-Verlauf (logs/history/, sonst die Log-Dateien in logs/)
+      erst, wenn ein Zeitraum sichtbar wird
+    - Teilt die Zeitachse in Kacheln fester Punktzahl
+    - Wählt die Auflösung (Sekunden pro Punkt) nach sichtbarer Spanne
+    - Dekodierte Dateien und Kacheln liegen in LRU-Caches
+    """
+
+    # Auflösungsstufen in Sekunden pro Datenpunkt
+    LEVELS = [1, 10, 60, 600, 3600]
+
+    # Datenpunkte pro Kachel und maximal sichtbare Punkte pro Achse
+    TILE_POINTS = 600
+    MAX_VISIBLE_POINTS = 1200
+
+    def __init__(self, logs_dir: str = "logs", max_tiles: int = 64, max_files: int = 16,
+                 max_summaries: int = 4096):
+        self.logs_dir = logs_dir
+        self.max_tiles = max_tiles
+        self.max_files = max_files
+        self.max_summaries = max_summaries
+
+        # LRU-Caches (Kacheln, dekodierte Dateien, Datei-Aggregate)
+        self.tile_cache = OrderedDict()
+        self.file_cache = OrderedDict()
+        self.summary_cache = OrderedDict()
+
+        # Datei-Index: sortierte Liste (Ende-Zeitstempel, Pfad)
+        self.file_index = []
+        self._index_mtime = None
+        self.file_sizes = {}
+
+        # Statistik
+        self.tile_hits = 0
+        self.tile_misses = 0
+
+    def refresh_index(self):
+        """Datei-Index aktualisieren und Caches geänderter Dateien verwerfen"""
+        history_dir = os.path.join(self.logs_dir, HISTORY_DIR)
+        try:
+            signature = (os.path.getmtime(self.logs_dir),
+                         os.path.getmtime(history_dir) if os.path.isdir(history_dir) else None)
+        except OSError:
+            self.file_index = []
+            return
+
+        previous_sizes = self.file_sizes
+        if signature != self._index_mtime:
+            # Langzeit-Verlauf bevorzugen, sonst die rotierenden Log-Dateien
+            index = self._scan_history(history_dir) if signature[1] is not None else []
+            if not index:
+                index = self._scan_logs()
+            self.file_index = index
+            self._index_mtime = signature
+            self.file_sizes = {filepath: self._file_size(filepath) for _, filepath in index}
+        elif self.file_index:
+            # Die laufende Stundendatei wächst, ohne die Verzeichnis-mtime zu ändern
+            tail = self.file_index[-1][1]
+            size = self._file_size(tail)
+            if size == previous_sizes.get(tail):
+                return
+            self.file_sizes = dict(previous_sizes)
+            self.file_sizes[tail] = size
+
+        if not previous_sizes:
+            return
+
+        # Caches nur für neue, gewachsene oder gelöschte Dateien verwerfen
+        changed_from = None
+        previous_end = None
+        for end_time, filepath in self.file_index:
+            if previous_sizes.get(filepath) != self.file_sizes[filepath]:
+                file_start = self._file_start(filepath, end_time, previous_end)
+                changed_from = file_start if changed_from is None else min(changed_from, file_start)
+                self._drop_file_caches(filepath)
+            previous_end = end_time
+        for filepath in set(previous_sizes) - set(self.file_sizes):
+            self._drop_file_caches(filepath)
+
+        if changed_from is not None:
+            for level, tile_index in list(self.tile_cache):
+                tile_end = (tile_index + 1) * level * self.TILE_POINTS
+                if tile_end > changed_from:
+                    del self.tile_cache[(level, tile_index)]
+
+    def _scan_history(self, history_dir: str) -> List[Tuple[float, str]]:
+        """Stundendateien des Langzeit-Verlaufs als (Ende, Pfad) auflisten"""
+        index = []
+        for filename in os.listdir(history_dir):
+            match = HISTORY_FILE_PATTERN.match(filename)
+            if not match:
+                continue
+            try:
+                end_time = history_file_start(match.group(1)) + HISTORY_FILE_SPAN
+                index.append((end_time, os.path.join(history_dir, filename)))
+            except ValueError:
+                continue
+        index.sort()
+        return index
+
+    def _scan_logs(self) -> List[Tuple[float, str]]:
+        """Log-Dateien des SystemLoggers als (Speicherzeitpunkt, Pfad) auflisten"""
+        # Pro Speicherzeitpunkt JSON bevorzugen, CSV als Fallback
+        files = {}
+        for filename in os.listdir(self.logs_dir):
+            match = LOG_FILE_PATTERN.match(filename)
+            if not match:
+                continue
+            stamp, ext = match.groups()
+            if ext == "json" or stamp not in files:
+                files[stamp] = os.path.join(self.logs_dir, filename)
+
+        index = []
+        for stamp, filepath in files.items():
+            try:
+                end_time = datetime.strptime(stamp, "%Y%m%d_%H%M%S").timestamp()
+                index.append((end_time, filepath))
+            except ValueError:
+                continue
+        index.sort()
+        return index
+
+    def _file_start(self, filepath: str, end_time: float, previous_end: Optional[float]) -> float:
+        """Frühester Zeitstempel, den eine Datei enthalten kann"""
+        if HISTORY_FILE_PATTERN.match(os.path.basename(filepath)):
+            return end_time - HISTORY_FILE_SPAN
+        # Log-Dateien decken (Ende der Vorgängerdatei, eigenes Ende] ab
+        return previous_end if previous_end is not None else float("-inf")
+
+    def _file_size(self, filepath: str) -> int:
+        """Dateigröße (-1, falls die Datei inzwischen fehlt)"""
+        try:
+            return os.path.getsize(filepath)
+        except OSError:
+            return -1
+
+    def _drop_file_caches(self, filepath: str):
+        """Dekodierte Datei und ihre Aggregate aus den Caches entfernen"""
+        self.file_cache.pop(filepath, None)
+        for cache_key in [key for key in self.summary_cache if key[0] == filepath]:
+            del self.summary_cache[cache_key]
+
+    def get_time_bounds(self) -> Optional[Tuple[float, float]]:
+        """Ältesten und neuesten Zeitstempel (Epoch-Sekunden) zurückgeben"""
+        self.refresh_index()
+        if not self.file_index:
+            return None
+
+        first_samples = self._load_file(self.file_index[0][1])
+        last_samples = self._load_file(self.file_index[-1][1])
+        start = first_samples[0][0] if first_samples else self.file_index[0][0]
+        end = last_samples[-1][0] if last_samples else self.file_index[-1][0]
+        return start, end
+
+    def choose_level(self, span_seconds: float) -> int:
+        """Auflösung für die sichtbare Spanne wählen"""
+        for level in self.LEVELS:
+            if span_seconds / level <= self.MAX_VISIBLE_POINTS:
+                return level
+        return self.LEVELS[-1]
+
+    def get_range(self, start: float, end: float) -> Dict[str, List[Any]]:
+        """Daten für den Bereich [start, end] in passender Auflösung liefern"""
+        self.refresh_index()
+        result = {"timestamps": []}
+        for key in HISTORY_KEYS:
+            result[key] = []
+
+        if end <= start or not self.file_index:
+            return result
+
+        level = self.choose_level(end - start)
+        tile_span = level * self.TILE_POINTS
+
+        first_tile = int(start // tile_span)
+        last_tile = int(end // tile_span)
+
+        for tile_index in range(first_tile, last_tile + 1):
+            tile = self._get_tile(level, tile_index)
+            for i, timestamp in enumerate(tile["timestamps"]):
+                if start <= timestamp <= end:
+                    result["timestamps"].append(timestamp)
+                    for key in HISTORY_KEYS:
+                        result[key].append(tile[key][i])
+
+        return result
+
+    def _get_tile(self, level: int, tile_index: int) -> Dict[str, List[Any]]:
+        """Kachel aus dem LRU-Cache holen oder dekodieren"""
+        cache_key = (level, tile_index)
+        tile = self.tile_cache.get(cache_key)
+        if tile is not None:
+            self.tile_cache.move_to_end(cache_key)
+            self.tile_hits += 1
+            return tile
+
+        self.tile_misses += 1
+        tile = self._build_tile(level, tile_index)
+
+        self.tile_cache[cache_key] = tile
+        if len(self.tile_cache) > self.max_tiles:
+            self.tile_cache.popitem(last=False)
+
+        return tile
+
+    def _build_tile(self, level: int, tile_index: int) -> Dict[str, List[Any]]:
+        """Kachel aus Datei-Aggregaten aufbauen (Mittelwert pro Zeit-Bucket)"""
+        tile_span = level * self.TILE_POINTS
+        tile_start = tile_index * tile_span
+        tile_end = tile_start + tile_span
+
+        buckets = {}
+        for filepath in self._files_for_range(tile_start, tile_end):
+            for bucket_index, (count, sums) in self._get_file_buckets(filepath, level).items():
+                if not (tile_start <= bucket_index * level < tile_end):
+                    continue
+                bucket = buckets.setdefault(bucket_index, [0, [0.0] * len(HISTORY_KEYS)])
+                bucket[0] += count
+                for i, value in enumerate(sums):
+                    bucket[1][i] += value
+
+        tile = {"timestamps": []}
+        for key in HISTORY_KEYS:
+            tile[key] = []
+
+        # Bucket-Mitte als Zeitstempel (Rohdaten unverändert lassen)
+        offset = level / 2 if level > 1 else 0
+        for bucket_index in sorted(buckets):
+            count, sums = buckets[bucket_index]
+            tile["timestamps"].append(bucket_index * level + offset)
+            for i, key in enumerate(HISTORY_KEYS):
+                tile[key].append(sums[i] / count)
+
+        return tile
+
+    def _get_file_buckets(self, filepath: str, level: int) -> Dict[int, list]:
+        """Summen pro Zeit-Bucket einer Datei (grobe Stufen bleiben gecacht)"""
+        cache_key = (filepath, level)
+        buckets = self.summary_cache.get(cache_key)
+        if buckets is not None:
+            self.summary_cache.move_to_end(cache_key)
+            return buckets
+
+        buckets = {}
+        for timestamp, values in self._load_file(filepath):
+            bucket = buckets.setdefault(int(timestamp // level), [0, [0.0] * len(HISTORY_KEYS)])
+            bucket[0] += 1
+            for i, value in enumerate(values):
+                bucket[1][i] += value
+
+        # Feine Stufen sind kaum kleiner als die Rohdaten und werden nicht gehalten
+        if level >= 60:
+            self.summary_cache[cache_key] = buckets
+            if len(self.summary_cache) > self.max_summaries:
+                self.summary_cache.popitem(last=False)
+
+        return buckets
+
+    def _files_for_range(self, start: float, end: float) -> List[str]:
+        """Log-Dateien finden, die den Bereich überdecken"""
+        # Eine Datei deckt (Ende der Vorgängerdatei, eigenes Ende] ab
+        files = []
+        for end_time, filepath in self.file_index:
+            if end_time < start:
+                continue
+            files.append(filepath)
+            if end_time >= end:
+                break
+        return files
+
+    def _load_file(self, filepath: str) -> List[Tuple[float, List[float]]]:
+        """Log-Datei dekodieren (LRU-gecacht)"""
+        samples = self.file_cache.get(filepath)
+        if samples is not None:
+            self.file_cache.move_to_end(filepath)
+            return samples
+
+        if HISTORY_FILE_PATTERN.match(os.path.basename(filepath)):
+            samples = self._load_history_file(filepath)
+        else:
+            samples = self._load_log_file(filepath)
+
+        self.file_cache[filepath] = samples
+        if len(self.file_cache) > self.max_files:
+            self.file_cache.popitem(last=False)
+
+        return samples
+
+    def _load_history_file(self, filepath: str) -> List[Tuple[float, List[float]]]:
+        """Stundendatei des Langzeit-Verlaufs dekodieren (Epoch-Zeitstempel, Werte)"""
+        samples = []
+        try:
+            with open(filepath, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                columns = [header.index(key) if key in header else None for key in HISTORY_KEYS]
+                for row in reader:
+                    try:
+                        values = [float(row[i]) if i is not None else 0.0 for i in columns]
+                        samples.append((float(row[0]), values))
+                    except (IndexError, ValueError):
+                        # Unvollständige letzte Zeile, während der Logger schreibt
+                        continue
+        except Exception as e:
+            print(f"Fehler beim Laden der Verlaufsdatei {filepath}: {e}")
+
+        samples.sort(key=lambda s: s[0])
+        return samples
+
+    def _load_log_file(self, filepath: str) -> List[Tuple[float, List[float]]]:
+        """Log-Datei des SystemLoggers dekodieren (JSON oder CSV)"""
+        try:
+            if filepath.endswith(".json"):
+                with open(filepath, 'r', encoding='utf-8') as f:
+                    rows = json.load(f).get("data", [])
+            else:
+                with open(filepath, 'r', newline='', encoding='utf-8') as f:
+                    rows = list(csv.DictReader(f))
+        except Exception as e:
+            print(f"Fehler beim Laden der Log-Datei {filepath}: {e}")
+            rows = []
+
+        samples = []
+        for row in rows:
+            if "error" in row and row.get("error"):
+                continue
+            try:
+                timestamp = datetime.fromisoformat(row["timestamp"]).timestamp()
+                values = [float(row.get(key) or 0) for key in HISTORY_KEYS]
+                samples.append((timestamp, values))
+            except (KeyError, ValueError, TypeError):
+                continue
+
+        samples.sort(key=lambda s: s[0])
+        return samples
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Cache-Statistik zurückgeben"""
+        return {
+            "tiles_cached": len(self.tile_cache),
+            "files_cached": len(self.file_cache),
+            "summaries_cached": len(self.summary_cache),
+            "tile_hits": self.tile_hits,
+            "tile_misses": self.tile_misses,
+            "indexed_files": len(self.file_index)
+        }
@@ -17,71 +17,128 @@ from datetime import datetime
 from typing import Dict, List, Any
 import psutil
 
+from utils.history import HistoryWriter, DEFAULT_RETENTION_DAYS
+
+# Spalten der Log-Dateien
+LOG_FIELDS = [
+    "timestamp", "cpu_percent", "cpu_count", "cpu_freq_ghz",
+    "ram_percent", "ram_used_gb", "ram_total_gb",
+    "disk_percent", "disk_used_gb", "disk_total_gb",
+    "platform", "username"
+]
+
 class SystemLogger:
     """
     System-Logging für CSV/JSON-Export
     - Automatisches Speichern alle 60 Sekunden
     - Buffer-System für effiziente Speicherung
     - Maximal 10 Log-Dateien
+    - Langzeit-Verlauf in logs/history/ (Aufbewahrung nach Alter, für den Verlaufs-Browser)
     - Thread-sicher
     """
     
-    def __init__(self):
-        self.logs_dir = "logs"
+    def __init__(self, logs_dir: str = "logs", sampler=None,
+                 history_retention_days: float = DEFAULT_RETENTION_DAYS):
+        self.logs_dir = logs_dir
         self.buffer_size = 60  # 60 Sekunden = 1 Minute
         self.max_files = 10
         
+        # Rotierende Log-Dateien decken nur wenige Minuten ab, der Verlauf Tage
+        self.history = HistoryWriter(logs_dir, history_retention_days)
+        
+        # Optional gemeinsamer SnapshotSampler (nicht-blockierende CPU-Messung)
+        self.sampler = sampler
+        
         # Buffer für Daten
         self.csv_buffer = []
         self.json_buffer = []
         
+        # Abtast-Intervall (Sekunden), live änderbar
+        self.interval = 1.0
+        self.last_sample = 0.0
+        
         # Threading
         self.logging_active = False
         self.logging_thread = None
         self.lock = threading.Lock()
+        self.wakeup = threading.Event()
         
         # Erstelle Logs-Verzeichnis
         os.makedirs(self.logs_dir, exist_ok=True)
         
-    def start_logging(self):
-        """Logging starten"""
+    def start_logging(self, threaded: bool = True):
+        """Logging starten (threaded=False: Snapshots kommen über log_snapshot)"""
         if not self.logging_active:
             self.logging_active = True
-            self.logging_thread = threading.Thread(target=self._logging_loop, daemon=True)
-            self.logging_thread.start()
+            self.wakeup.clear()
+            if threaded:
+                self.logging_thread = threading.Thread(target=self._logging_loop, daemon=True)
+                self.logging_thread.start()
             print("System-Logging gestartet")
             
     def stop_logging(self):
         """Logging stoppen"""
         self.logging_active = False
+        self.wakeup.set()
         if self.logging_thread:
             self.logging_thread.join(timeout=5)
+            self.logging_thread = None
         print("System-Logging gestoppt")
         
+    def log_snapshot(self, snapshot: Dict[str, Any]):
+        """Fremden Snapshot loggen (gemeinsamer Takt statt eigenem Thread)"""
+        if not self.logging_active:
+            return
+        # Takt-Schwankungen tolerieren, sonst fiele jeder zweite Snapshot weg
+        now = time.monotonic()
+        if now - self.last_sample < self.interval * 0.9:
+            return
+        self.last_sample = now
+        
+        if "error" not in snapshot:
+            snapshot = {key: snapshot.get(key) for key in LOG_FIELDS}
+        self._append(snapshot)
+        
+    def set_interval(self, interval_ms: int):
+        """Abtast-Intervall ändern (wirkt sofort, auch während des Wartens)"""
+        self.interval = max(interval_ms, 100) / 1000
+        self.wakeup.set()
+        
     def _logging_loop(self):
         """Haupt-Logging-Schleife"""
         while self.logging_active:
+            # Bis zum nächsten Abtast-Zeitpunkt warten (unterbrechbar)
+            remaining = self.last_sample + self.interval - time.monotonic()
+            if remaining > 0:
+                self.wakeup.wait(remaining)
+                self.wakeup.clear()
+                continue
+            self.last_sample = time.monotonic()
+            
             try:
                 # System-Daten sammeln
-                data = self._collect_system_data()
-                
-                # Daten zum Buffer hinzufügen
-                with self.lock:
-                    self.csv_buffer.append(data)
-                    self.json_buffer.append(data)
-                    
-                    # Wenn Buffer voll, speichern
-                    if len(self.csv_buffer) >= self.buffer_size:
-                        self._save_data()
-                        
+                self._append(self._collect_system_data())
             except Exception as e:
                 print(f"Fehler im Logging-Loop: {e}")
                 
-            # 1 Sekunde warten
-            time.sleep(1)
+    def _append(self, data: Dict[str, Any]):
+        """Datensatz zum Buffer hinzufügen (voller Buffer wird gespeichert)"""
+        with self.lock:
+            self.csv_buffer.append(data)
+            self.json_buffer.append(data)
+            
+            # Wenn Buffer voll, speichern
+            if len(self.csv_buffer) >= self.buffer_size:
+                self._save_data()
             
     def _collect_system_data(self) -> Dict[str, Any]:
         """System-Daten sammeln"""
+        if self.sampler is not None:
+            snapshot = self.sampler.sample()
+            if "error" in snapshot:
+                return snapshot
+            return {key: snapshot.get(key) for key in LOG_FIELDS}
+            
         try:
             # CPU-Daten
             cpu_percent = psutil.cpu_percent(interval=0.1)
@@ -133,46 +190,44 @@ class SystemLogger:
     def _save_data(self):
         """Daten in CSV und JSON speichern"""
         try:
+            count = len(self.csv_buffer)
+            
+            # Ein Zeitstempel pro Speichervorgang: CSV und JSON bilden ein Paar
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            
             # CSV speichern
-            self._save_csv()
+            self._save_csv(timestamp)
             
             # JSON speichern
-            self._save_json()
+            self._save_json(timestamp)
+            
+            # Langzeit-Verlauf fortschreiben
+            self.history.append(self.csv_buffer)
             
             # Buffer leeren
             self.csv_buffer.clear()
             self.json_buffer.clear()
             
-            print(f"Daten gespeichert: {len(self.csv_buffer)} Einträge")
+            print(f"Daten gespeichert: {count} Einträge")
             
         except Exception as e:
             print(f"Fehler beim Speichern der Daten: {e}")
             
-    def _save_csv(self):
+    def _save_csv(self, timestamp: str):
         """CSV-Datei speichern"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"system_monitor_{timestamp}.csv"
         filepath = os.path.join(self.logs_dir, filename)
         
-        # CSV-Header
-        fieldnames = [
-            "timestamp", "cpu_percent", "cpu_count", "cpu_freq_ghz",
-            "ram_percent", "ram_used_gb", "ram_total_gb",
-            "disk_percent", "disk_used_gb", "disk_total_gb",
-            "platform", "username"
-        ]
-        
         with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=LOG_FIELDS, extrasaction='ignore')
             writer.writeheader()
             writer.writerows(self.csv_buffer)
             
         # Alte Dateien löschen
         self._cleanup_old_files("csv")
         
-    def _save_json(self):
+    def _save_json(self, timestamp: str):
         """JSON-Datei speichern"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"system_monitor_{timestamp}.json"
         filepath = os.path.join(self.logs_dir, filename)
         
@@ -224,7 +279,8 @@ class SystemLogger:
                 "buffer_size": len(self.csv_buffer),
                 "max_buffer_size": self.buffer_size,
                 "logs_directory": self.logs_dir,
-                "max_files": self.max_files
+                "max_files": self.max_files,
+                "history_retention_days": self.history.retention_days
             }
             
     def force_save(self):
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Metrics-Endpoint
+Lokaler asyncio-HTTP-Server für den letzten Snapshot (Prometheus-Text und JSON)
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import asyncio
+import json
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+# Snapshot-Schlüssel -> (Metrik-Name, Hilfetext, Faktor)
+METRICS = [
+    ("cpu_percent", "systemmonitorx_cpu_percent", "CPU-Auslastung in Prozent", 1),
+    ("cpu_count", "systemmonitorx_cpu_count", "Anzahl logischer CPU-Kerne", 1),
+    ("cpu_freq_ghz", "systemmonitorx_cpu_frequency_hertz", "Aktuelle CPU-Frequenz", 1e9),
+    ("ram_percent", "systemmonitorx_ram_percent", "RAM-Auslastung in Prozent", 1),
+    ("ram_used_gb", "systemmonitorx_ram_used_bytes", "Belegter Arbeitsspeicher", 1024**3),
+    ("ram_total_gb", "systemmonitorx_ram_total_bytes", "Gesamter Arbeitsspeicher", 1024**3),
+    ("disk_percent", "systemmonitorx_disk_percent", "Festplatten-Auslastung in Prozent", 1),
+    ("disk_used_gb", "systemmonitorx_disk_used_bytes", "Belegter Festplattenspeicher", 1024**3),
+    ("disk_total_gb", "systemmonitorx_disk_total_bytes", "Gesamter Festplattenspeicher", 1024**3),
+    ("online", "systemmonitorx_online", "Netzwerk verfügbar (1/0)", 1)
+]
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+JSON_CONTENT_TYPE = "application/json"
+
+DEFAULT_PORT = 9464
+
+
+def build_response(status: str, content_type: str, body: bytes) -> bytes:
+    """Vollständige HTTP-Antwort (Header und Body) als Bytes"""
+    header = (f"HTTP/1.1 {status}\r\n"
+              f"Content-Type: {content_type}\r\n"
+              f"Content-Length: {len(body)}\r\n"
+              f"\r\n")
+    return header.encode("ascii") + body
+
+
+NOT_FOUND = build_response("404 Not Found", "text/plain; charset=utf-8", b"not found\n")
+NOT_ALLOWED = build_response("405 Method Not Allowed", "text/plain; charset=utf-8", b"method not allowed\n")
+NO_DATA = build_response("503 Service Unavailable", "text/plain; charset=utf-8", b"no snapshot yet\n")
+
+
+def encode_prometheus(snapshot: Dict[str, Any], sample_count: int) -> bytes:
+    """Snapshot im Prometheus-Textformat"""
+    lines = []
+    for key, name, help_text, factor in METRICS:
+        value = snapshot.get(key)
+        if value is None:
+            continue
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {float(value) * factor!r}")
+
+    lines.append("# HELP systemmonitorx_samples_total Erfasste Snapshots seit dem Start")
+    lines.append("# TYPE systemmonitorx_samples_total counter")
+    lines.append(f"systemmonitorx_samples_total {sample_count}")
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def encode_json(snapshot: Dict[str, Any], sample_count: int) -> bytes:
+    """Snapshot als kompaktes JSON"""
+    data = dict(snapshot, sample_count=sample_count)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class SnapshotCache:
+    """
+    Antwort-Cache für den Metrics-Endpoint
+    - Liest nur sampler.get_latest() (nie psutil)
+    - Kodiert Prometheus- und JSON-Antwort einmal pro neuem Sample
+    - Jeder weitere Scrape desselben Samples ist ein reiner Dict-Zugriff
+    """
+
+    def __init__(self, sampler):
+        self.sampler = sampler
+        self.sample_count = -1
+        self.responses = {}
+        self.encode_count = 0
+        self.lock = threading.Lock()
+
+    def get_response(self, path: str) -> bytes:
+        """Fertige HTTP-Antwort für einen Pfad"""
+        sample_count = self.sampler.sample_count
+        if sample_count != self.sample_count:
+            self._encode(sample_count)
+        return self.responses.get(path, NOT_FOUND)
+
+    def _encode(self, sample_count: int):
+        """Antworten für das aktuelle Sample einmalig kodieren"""
+        with self.lock:
+            if sample_count == self.sample_count:
+                return
+            snapshot = self.sampler.get_latest()
+            if snapshot is None:
+                self.responses = {"/metrics": NO_DATA, "/metrics.json": NO_DATA}
+            else:
+                prometheus = build_response("200 OK", PROMETHEUS_CONTENT_TYPE,
+                                            encode_prometheus(snapshot, sample_count))
+                self.responses = {
+                    "/metrics": prometheus,
+                    "/metrics.json": build_response("200 OK", JSON_CONTENT_TYPE,
+                                                    encode_json(snapshot, sample_count))
+                }
+                self.encode_count += 1
+            self.sample_count = sample_count
+
+
+class MetricsServer:
+    """
+    Metrics-Endpoint für SystemMonitorX
+    - asyncio-Server in einem eigenen Thread (unabhängig von Qt oder dem Collector)
+    - GET /metrics (Prometheus) und GET /metrics.json, HTTP/1.1 Keep-Alive
+    - Antworten kommen aus dem SnapshotCache
+    """
+
+    def __init__(self, sampler, host: str = "127.0.0.1", port: int = DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.cache = SnapshotCache(sampler)
+
+        self.thread = None
+        self.loop = None
+        self.stopping = None
+        self.ready = threading.Event()
+        self.error = None
+
+        self.writers = set()
+        self.request_count = 0
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """Server-Thread starten und auf das Binden des Ports warten"""
+        if self.thread is not None:
+            return self.ready.is_set() and self.error is None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+        if not self.ready.wait(timeout):
+            print(f"Fehler beim Starten des Metrics-Endpoints: Port {self.port} nach {timeout:.0f} s nicht gebunden")
+            return False
+        if self.error is not None:
+            print(f"Fehler beim Starten des Metrics-Endpoints: {self.error}")
+            return False
+        print(f"Metrics-Endpoint: http://{self.host}:{self.port}/metrics (JSON: /metrics.json)")
+        return True
+
+    def stop(self):
+        """Server beenden und offene Verbindungen schließen"""
+        if self.loop is not None and self.stopping is not None:
+            self.loop.call_soon_threadsafe(self.stopping.set)
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+
+    def _run(self):
+        """Event-Loop des Server-Threads"""
+        try:
+            asyncio.run(self._serve())
+        except Exception as e:
+            self.error = e
+            self.ready.set()
+
+    async def _serve(self):
+        """Server starten und bis stop() laufen lassen"""
+        self.loop = asyncio.get_running_loop()
+        self.stopping = asyncio.Event()
+        server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        self.ready.set()
+
+        await self.stopping.wait()
+        server.close()
+        # Keep-Alive-Verbindungen schließen, sonst wartet wait_closed() auf die Clients
+        for writer in list(self.writers):
+            writer.close()
+        await server.wait_closed()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Anfragen einer Verbindung beantworten (Keep-Alive)"""
+        self.writers.add(writer)
+        try:
+            while True:
+                try:
+                    request = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                lines = request.decode("latin-1").split("\r\n")
+                parts = lines[0].split()
+                if len(parts) != 3:
+                    break
+                method, path, version = parts
+                path = path.split("?", 1)[0]
+                self.request_count += 1
+
+                if method != "GET":
+                    writer.write(NOT_ALLOWED)
+                else:
+                    writer.write(self.cache.get_response(path))
+                await writer.drain()
+
+                # HTTP/1.0 oder "Connection: close" beendet die Verbindung
+                headers = "\r\n".join(lines[1:]).lower()
+                if version == "HTTP/1.0" or "connection: close" in headers:
+                    break
+
+        except Exception as e:
+            print(f"Fehler im Metrics-Endpoint: {e}")
+        finally:
+            self.writers.discard(writer)
+            writer.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Anfragen und Kodierungen seit dem Start"""
+        return {
+            "requests": self.request_count,
+            "encodes": self.cache.encode_count,
+            "connections": len(self.writers)
+        }
+
+
+async def _scrape_worker(host: str, port: int, path: str, deadline: float,
+                         latencies: List[float], errors: List[str]):
+    """Ein Scraper: Keep-Alive-Verbindung, Anfragen bis zur Deadline"""
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except Exception as e:
+        errors.append(str(e))
+        return
+
+    request = f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("ascii")
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            writer.write(request)
+            header = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in header.decode("latin-1").split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            await reader.readexactly(length)
+            if not header.startswith(b"HTTP/1.1 200"):
+                errors.append(header.split(b"\r\n", 1)[0].decode("latin-1"))
+            latencies.append((time.perf_counter() - started) * 1000)
+    except Exception as e:
+        errors.append(str(e))
+    finally:
+        writer.close()
+
+
+async def _load_test(host: str, port: int, concurrency: int, duration: float,
+                     path: str) -> Dict[str, Any]:
+    """Lasttest mit parallelen Scrapern ausführen"""
+    latencies = []
+    errors = []
+    started = time.perf_counter()
+    deadline = started + duration
+    await asyncio.gather(*[
+        _scrape_worker(host, port, path, deadline, latencies, errors)
+        for _ in range(concurrency)
+    ])
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))]
+
+    return {
+        "concurrency": concurrency,
+        "duration_s": elapsed,
+        "requests": len(latencies),
+        "requests_per_second": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "max_ms": latencies[-1] if latencies else 0.0,
+        "errors": len(errors)
+    }
+
+
+def run_load_test(host: str, port: int, concurrency: int = 100, duration: float = 10.0,
+                  path: str = "/metrics") -> Dict[str, Any]:
+    """Lasttest gegen einen laufenden Endpoint (Requests/s und Latenz)"""
+    return asyncio.run(_load_test(host, port, concurrency, duration, path))
+
+
+def format_load_test(result: Dict[str, Any]) -> str:
+    """Lasttest-Ergebnis als lesbare Zeile"""
+    return (f"{result['concurrency']} Scraper, {result['duration_s']:.1f} s: "
+            f"{result['requests']} Anfragen ({result['requests_per_second']:.0f}/s) | "
+            f"Latenz p50 {result['p50_ms']:.2f} ms, p95 {result['p95_ms']:.2f} ms, "
+            f"p99 {result['p99_ms']:.2f} ms, max {result['max_ms']:.2f} ms | "
+            f"Fehler: {result['errors']}")
+
+
+def start_from_config(sampler, config_manager) -> Optional[MetricsServer]:
+    """Endpoint starten, falls in der Konfiguration aktiviert"""
+    config = config_manager.get_metrics_server_config()
+    if not config.get("enabled", False):
+        return None
+    server = MetricsServer(sampler, config.get("host", "127.0.0.1"), int(config.get("port", DEFAULT_PORT)))
+    return server if server.start() else None
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Profiling-Modus
+Import-Zeiten, Setup-Phasen und Timer-Slots messen und als Report nach Subsystem ausgeben
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import cProfile
+import functools
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+import psutil
+
+PROFILE_DIR = os.path.join("logs", "metrics")
+
+# Subsystem -> Pfad-Muster ("x/" = Verzeichnis, sonst Dateiende)
+SUBSYSTEMS = [
+    ("Graphen", ["matplotlib/", "numpy/", "windows/graph_window.py", "utils/graphs.py",
+                 "utils/history.py", "utils/frame_stats.py"]),
+    ("Tray", ["pystray/", "PIL/", "utils/system_tray.py", "utils/tray_atlas.py"]),
+    ("Sampling", ["psutil/", "utils/refresh.py", "utils/snapshot.py"]),
+    ("Widgets", ["widgets/"]),
+    ("Logging", ["utils/logging.py"]),
+    ("Konfiguration/Theme", ["utils/config.py", "utils/theme.py", "utils/rate_control.py",
+                             "windows/settings_window.py"]),
+    ("Dashboard", ["main.py", "utils/bindings.py", "utils/statistics.py"]),
+    ("Qt", ["PyQt6/"])
+]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def classify_path(path: str) -> str:
+    """Subsystem für einen Dateipfad"""
+    path = "/" + path.replace(os.sep, "/").lstrip("/")
+    for subsystem, patterns in SUBSYSTEMS:
+        for pattern in patterns:
+            if pattern.endswith("/"):
+                if "/" + pattern in path:
+                    return subsystem
+            elif path.endswith("/" + pattern):
+                return subsystem
+    return "Sonstiges"
+
+
+def classify_module(name: str) -> str:
+    """Subsystem für einen Modulnamen"""
+    return classify_path(name.replace(".", "/") + ".py")
+
+
+def classify_function(key: Tuple[str, int, str]) -> str:
+    """Subsystem für einen cProfile-Eintrag (Builtins über den Namen)"""
+    filename, _, funcname = key
+    if filename == "~":
+        return "Qt" if "PyQt6" in funcname or "'Q" in funcname else "Builtins"
+    return classify_path(filename)
+
+
+def format_function(key: Tuple[str, int, str]) -> str:
+    """cProfile-Eintrag als kurze Zeile"""
+    filename, lineno, funcname = key
+    if filename == "~":
+        return funcname
+    if filename.startswith(REPO_ROOT):
+        filename = os.path.relpath(filename, REPO_ROOT)
+    else:
+        filename = os.path.basename(filename)
+    return f"{filename}:{lineno} {funcname}"
+
+
+class ImportTimer:
+    """
+    Import-Timer für den Profiling-Modus
+    - Sitzt vorne in sys.meta_path und umhüllt exec_module der gefundenen Loader
+    - Misst pro Modul die kumulierte und die eigene Zeit (ohne Unter-Importe)
+    - Import-Stack pro Thread (Tray-Module werden im Hintergrund geladen)
+    """
+
+    def __init__(self):
+        self.timings = {}
+        self.local = threading.local()
+        self.installed = False
+
+    def install(self):
+        """Vorne in sys.meta_path einhängen"""
+        if not self.installed:
+            sys.meta_path.insert(0, self)
+            self.installed = True
+
+    def uninstall(self):
+        """Aus sys.meta_path entfernen"""
+        if self.installed:
+            sys.meta_path.remove(self)
+            self.installed = False
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Spec bei den übrigen Findern suchen und den Loader umhüllen"""
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                self._wrap_loader(spec.loader)
+                return spec
+        return None
+
+    def _wrap_loader(self, loader):
+        """exec_module einer Loader-Instanz mit Zeitmessung umhüllen"""
+        # Builtin-/Frozen-Importer sind Klassen - dort nichts verändern
+        if loader is None or isinstance(loader, type) or getattr(loader, "_import_timed", False):
+            return
+        original = getattr(loader, "exec_module", None)
+        if original is None:
+            return
+
+        def exec_module(module):
+            stack = self._get_stack()
+            stack.append(0.0)
+            started = time.perf_counter()
+            try:
+                original(module)
+            finally:
+                elapsed = (time.perf_counter() - started) * 1000
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                self.timings[module.__name__] = (elapsed, elapsed - children)
+
+        try:
+            loader.exec_module = exec_module
+            loader._import_timed = True
+        except (AttributeError, TypeError):
+            pass
+
+    def _get_stack(self) -> List[float]:
+        """Import-Stack des aktuellen Threads"""
+        if not hasattr(self.local, "stack"):
+            self.local.stack = []
+        return self.local.stack
+
+    def get_top(self, limit: int = 15) -> List[Tuple[str, float, float]]:
+        """Langsamste Importe nach eigener Zeit"""
+        items = [(name, total, own) for name, (total, own) in self.timings.items()]
+        items.sort(key=lambda item: item[2], reverse=True)
+        return items[:limit]
+
+    def get_by_subsystem(self) -> Dict[str, Tuple[float, int]]:
+        """Eigene Import-Zeit und Anzahl Module pro Subsystem"""
+        totals = defaultdict(lambda: [0.0, 0])
+        for name, (_, own) in self.timings.items():
+            entry = totals[classify_module(name)]
+            entry[0] += own
+            entry[1] += 1
+        return {subsystem: (ms, count) for subsystem, (ms, count) in totals.items()}
+
+
+class ProfileSession:
+    """
+    Profiling-Sitzung für SystemMonitorX (main.py --profile)
+    - Import-Zeiten ab dem Start der Sitzung (ImportTimer)
+    - Dauer aller setup_*-Methoden (inklusive Unterphasen)
+    - cProfile der Timer-Slots im GUI-Thread über ein Zeitfenster
+    - Report mit den Hot Spots pro Subsystem unter logs/metrics/
+    """
+
+    def __init__(self, window_seconds: float = 30.0, output_dir: str = PROFILE_DIR):
+        self.window_seconds = window_seconds
+        self.output_dir = output_dir
+
+        # Interpreter und Modul-Importe von main.py liegen vor der Sitzung
+        try:
+            self.process_to_session_ms = (time.time() - psutil.Process().create_time()) * 1000
+        except Exception as e:
+            print(f"Fehler beim Lesen der Prozess-Startzeit: {e}")
+            self.process_to_session_ms = None
+
+        self.import_timer = ImportTimer()
+        self.import_timer.install()
+
+        self.setup_timings = defaultdict(list)
+        self.profile = cProfile.Profile()
+        self.window_started = None
+        self.window_ms = None
+        self.report_path = None
+
+    def instrument(self, cls, prefix: str = "setup_"):
+        """Alle Methoden mit Präfix (setup_*) einer Klasse mit Zeitmessung umhüllen"""
+        for name, method in list(vars(cls).items()):
+            if name.startswith(prefix) and callable(method):
+                setattr(cls, name, self._timed(name, method))
+
+    def _timed(self, name: str, method):
+        """Methode mit Zeitmessung"""
+        timings = self.setup_timings[name]
+
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timings.append((time.perf_counter() - started) * 1000)
+
+        return wrapper
+
+    def start_window(self):
+        """Profil-Fenster starten (im GUI-Thread aufrufen)"""
+        if self.window_started is not None:
+            return
+        self.window_started = time.perf_counter()
+        self.profile.enable()
+        print(f"Profiling: Timer-Slots werden {self.window_seconds:.0f} s lang aufgezeichnet...")
+
+    def finish(self, startup_metrics=None) -> Optional[str]:
+        """Profil-Fenster beenden und Report schreiben (einmalig)"""
+        if self.report_path is not None or self.window_started is None:
+            return self.report_path
+        self.profile.disable()
+        self.window_ms = (time.perf_counter() - self.window_started) * 1000
+        self.import_timer.uninstall()
+
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.report_path = os.path.join(self.output_dir, f"profile_{stamp}.txt")
+
+            with open(self.report_path, 'w', encoding='utf-8') as f:
+                f.write(self.build_report(startup_metrics))
+
+            # Rohdaten für pstats/snakeviz
+            self.profile.dump_stats(os.path.join(self.output_dir, f"profile_{stamp}.prof"))
+            print(f"Profil-Report geschrieben: {self.report_path}")
+
+        except Exception as e:
+            print(f"Fehler beim Schreiben des Profil-Reports: {e}")
+
+        return self.report_path
+
+    def get_hot_spots(self, limit: int = 5) -> Dict[str, Dict[str, Any]]:
+        """Eigene Zeit und langsamste Funktionen pro Subsystem"""
+        stats = pstats.Stats(self.profile).stats
+        subsystems = defaultdict(lambda: {"own_ms": 0.0, "calls": 0, "functions": []})
+        for key, (_, calls, own, cumulative, _) in stats.items():
+            entry = subsystems[classify_function(key)]
+            entry["own_ms"] += own * 1000
+            entry["calls"] += calls
+            entry["functions"].append((own * 1000, cumulative * 1000, calls, key))
+
+        for entry in subsystems.values():
+            entry["functions"].sort(reverse=True)
+            del entry["functions"][limit:]
+        return dict(subsystems)
+
+    def get_slot_entries(self, limit: int = 10) -> List[Tuple[float, int, Tuple[str, int, str]]]:
+        """Eigene Funktionen (Timer-Slots und Aufgerufene) nach kumulierter Zeit"""
+        stats = pstats.Stats(self.profile).stats
+        entries = [
+            (cumulative * 1000, calls, key)
+            for key, (_, calls, _, cumulative, _) in stats.items()
+            if key[0].startswith(REPO_ROOT)
+        ]
+        entries.sort(reverse=True)
+        return entries[:limit]
+
+    def build_report(self, startup_metrics=None) -> str:
+        """Report als Text"""
+        lines = [
+            "SystemMonitorX - Profil-Report",
+            f"Erstellt: {datetime.now().isoformat(timespec='seconds')}",
+            ""
+        ]
+
+        # Start
+        lines.append("Start")
+        if self.process_to_session_ms is not None:
+            lines.append(f"  Prozessstart bis main(): {self.process_to_session_ms:.0f} ms "
+                         f"(Interpreter und Modul-Importe von main.py)")
+        if startup_metrics is not None:
+            lines.append(f"  {startup_metrics.format_summary()}")
+        lines.append("")
+
+        # Setup-Phasen
+        lines.append("Setup-Phasen (inklusive Unterphasen)")
+        for name, timings in sorted(self.setup_timings.items(), key=lambda item: -sum(item[1])):
+            if timings:
+                lines.append(f"  {name:<28} {sum(timings):8.1f} ms  ({len(timings)}x)")
+        lines.append("")
+
+        # Importe
+        lines.append("Importe nach Subsystem (eigene Zeit)")
+        by_subsystem = self.import_timer.get_by_subsystem()
+        for subsystem, (ms, count) in sorted(by_subsystem.items(), key=lambda item: -item[1][0]):
+            lines.append(f"  {subsystem:<22} {ms:8.1f} ms  ({count} Module)")
+        lines.append("")
+        lines.append("Langsamste Importe (eigene / kumulierte Zeit)")
+        for name, total, own in self.import_timer.get_top():
+            lines.append(f"  {own:8.1f} / {total:8.1f} ms  {name}  [{classify_module(name)}]")
+        lines.append("")
+
+        # Timer-Slots
+        window_s = (self.window_ms or 0.0) / 1000
+        lines.append(f"Hot Spots nach Subsystem (Profil-Fenster {window_s:.1f} s, GUI-Thread)")
+        hot_spots = self.get_hot_spots()
+        total_ms = sum(entry["own_ms"] for entry in hot_spots.values()) or 1.0
+        for subsystem, entry in sorted(hot_spots.items(), key=lambda item: -item[1]["own_ms"]):
+            share = entry["own_ms"] / total_ms
+            lines.append(f"  {subsystem}: {entry['own_ms']:.1f} ms eigene Zeit ({share:.0%}), "
+                         f"{entry['calls']} Aufrufe")
+            for own, cumulative, calls, key in entry["functions"]:
+                lines.append(f"    {own:8.1f} ms  {calls:7d}x  {format_function(key)}")
+        lines.append("")
+
+        lines.append("Eigene Funktionen nach kumulierter Zeit")
+        for cumulative, calls, key in self.get_slot_entries():
+            lines.append(f"  {cumulative:8.1f} ms  {calls:7d}x  {format_function(key)}")
+
+        return "\n".join(lines) + "\n"
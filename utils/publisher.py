@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Snapshot-Publisher
+Live-Feed der Snapshots über einen Unix-Domain-Socket oder TCP (JSONL oder Binär-Frames)
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import asyncio
+import json
+import math
+import os
+import socket
+import stat
+import struct
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Iterator, Optional
+
+# Binär-Frame: Magic, Sample-Nr., Unix-Zeit, 8 Messwerte (NaN = fehlt), Kerne, Online (-1/0/1)
+BINARY_MAGIC = b"SMX1"
+BINARY_FRAME = struct.Struct("!4sQd8dHb")
+BINARY_FIELDS = ["cpu_percent", "cpu_freq_ghz", "ram_percent", "ram_used_gb", "ram_total_gb",
+                 "disk_percent", "disk_used_gb", "disk_total_gb"]
+
+FRAME_FORMATS = ("jsonl", "binary")
+
+DEFAULT_MAX_QUEUE = 64
+
+# Wartezeit auf die Format-Zeile eines neuen Abnehmers (danach JSONL)
+FORMAT_TIMEOUT = 1.0
+
+# Standard-Port im Agent-Modus (TCP, Flotten-Ansicht)
+DEFAULT_AGENT_PORT = 9470
+
+
+def default_socket_path() -> str:
+    """Standard-Pfad des Sockets (pro Benutzer im Temp-Verzeichnis)"""
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    return os.path.join(tempfile.gettempdir(), f"systemmonitorx-{user}.sock")
+
+
+def encode_jsonl(snapshot: Dict[str, Any], sample_count: int) -> bytes:
+    """Snapshot als kompakte JSON-Zeile"""
+    data = dict(snapshot, sample_count=sample_count)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def encode_binary(snapshot: Dict[str, Any], sample_count: int) -> bytes:
+    """Snapshot als Binär-Frame fester Länge"""
+    return BINARY_FRAME.pack(*binary_values(snapshot, sample_count))
+
+
+def binary_values(snapshot: Dict[str, Any], sample_count: int) -> tuple:
+    """Werte eines Binär-Frames (für pack bzw. pack_into)"""
+    try:
+        timestamp = datetime.fromisoformat(snapshot["timestamp"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        timestamp = time.time()
+
+    values = []
+    for key in BINARY_FIELDS:
+        value = snapshot.get(key)
+        values.append(math.nan if value is None else float(value))
+
+    online = snapshot.get("online")
+    return (BINARY_MAGIC, sample_count, timestamp, *values,
+            snapshot.get("cpu_count") or 0, -1 if online is None else int(online))
+
+
+def decode_binary(frame, offset: int = 0) -> Dict[str, Any]:
+    """Binär-Frame wieder in ein Dict umwandeln (für Abnehmer, auch direkt aus einem Puffer)"""
+    magic, sample_count, timestamp, *rest = BINARY_FRAME.unpack_from(frame, offset)
+    if magic != BINARY_MAGIC:
+        raise ValueError(f"Unbekanntes Frame-Format: {magic!r}")
+    values, (cpu_count, online) = rest[:len(BINARY_FIELDS)], rest[len(BINARY_FIELDS):]
+
+    data = {"sample_count": sample_count, "timestamp": timestamp, "cpu_count": cpu_count,
+            "online": None if online < 0 else bool(online)}
+    for key, value in zip(BINARY_FIELDS, values):
+        data[key] = None if math.isnan(value) else value
+    return data
+
+
+class Subscriber:
+    """Ein verbundener Abnehmer mit eigener, begrenzter Queue"""
+
+    def __init__(self, writer: asyncio.StreamWriter, max_queue: int, frame_format: str = "jsonl"):
+        self.writer = writer
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.frame_format = frame_format
+        self.sent = 0
+
+
+class SnapshotPublisher:
+    """
+    Snapshot-Publisher für SystemMonitorX
+    - Unix-Domain-Socket oder TCP (Agent-Modus), beliebig viele Abnehmer
+    - Abnehmer wählen das Format mit einer Zeile "jsonl" (Standard) oder "binary"
+    - Jeder Snapshot wird pro Format einmal kodiert (beim Schreiben, im aktuellen Format)
+    - Backpressure pro Abnehmer: eigene Queue, Schreiben mit drain()
+    - Läuft die Queue voll, wird der Abnehmer getrennt - die Erfassung wartet nie
+    """
+
+    def __init__(self, sampler, path: Optional[str] = None, max_queue: int = DEFAULT_MAX_QUEUE,
+                 host: Optional[str] = None, port: Optional[int] = None):
+        self.sampler = sampler
+        self.max_queue = max(1, max_queue)
+
+        # TCP, sobald ein Port angegeben ist (sonst Unix-Socket)
+        self.host = host or "127.0.0.1"
+        self.port = port
+        self.path = None if port is not None else (path or default_socket_path())
+
+        self.thread = None
+        self.loop = None
+        self.stopping = None
+        self.ready = threading.Event()
+        self.error = None
+
+        self.subscribers = set()
+        self.client_tasks = set()
+        self.published = 0
+        self.frames_sent = 0
+        self.disconnected_slow = 0
+        self.max_publish_ms = 0.0
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """Publisher-Thread starten und Snapshots abonnieren"""
+        if self.thread is not None:
+            return self.ready.is_set() and self.error is None
+        if self.path is not None and not hasattr(socket, "AF_UNIX"):
+            print("Snapshot-Publisher: Unix-Domain-Sockets werden auf diesem System nicht unterstützt")
+            return False
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+        if not self.ready.wait(timeout):
+            print(f"Fehler beim Starten des Snapshot-Publishers: {self.get_address()} nach {timeout:.0f} s nicht bereit")
+            return False
+        if self.error is not None:
+            print(f"Fehler beim Starten des Snapshot-Publishers: {self.error}")
+            return False
+
+        self.sampler.add_listener(self.publish)
+        print(f"Snapshot-Publisher: {self.get_address()} (Queue {self.max_queue} Frames pro Abnehmer)")
+        return True
+
+    def stop(self):
+        """Publisher beenden, Abnehmer trennen und Socket-Datei entfernen"""
+        self.sampler.remove_listener(self.publish)
+        if self.loop is not None and self.stopping is not None:
+            self.loop.call_soon_threadsafe(self.stopping.set)
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+
+    def publish(self, snapshot: Dict[str, Any], sample_count: int):
+        """Neuen Snapshot verteilen (aus dem Sampling-Thread, blockiert nie)"""
+        if self.loop is None or not self.subscribers:
+            return
+        started = time.perf_counter()
+        try:
+            self.loop.call_soon_threadsafe(self._broadcast, snapshot, sample_count)
+        except RuntimeError:
+            # Loop wurde bereits beendet
+            return
+        self.max_publish_ms = max(self.max_publish_ms, (time.perf_counter() - started) * 1000)
+
+    def _broadcast(self, snapshot: Dict[str, Any], sample_count: int):
+        """Snapshot in die Queues legen (Loop-Thread, kodiert wird beim Schreiben)"""
+        self.published += 1
+        # Gemeinsamer Kodier-Cache: pro Format höchstens einmal kodieren
+        entry = (snapshot, sample_count, {})
+        for subscriber in list(self.subscribers):
+            try:
+                subscriber.queue.put_nowait(entry)
+            except asyncio.QueueFull:
+                # Zu langsam: trennen statt die Erfassung aufzuhalten
+                self.disconnected_slow += 1
+                self._drop(subscriber, abort=True)
+
+    def _drop(self, subscriber: Subscriber, abort: bool = False):
+        """Abnehmer entfernen und Verbindung schließen (abort: ohne Restpuffer)"""
+        if subscriber in self.subscribers:
+            self.subscribers.discard(subscriber)
+            if abort:
+                subscriber.writer.transport.abort()
+            else:
+                subscriber.writer.close()
+
+    def _run(self):
+        """Event-Loop des Publisher-Threads"""
+        try:
+            asyncio.run(self._serve())
+        except Exception as e:
+            self.error = e
+            self.ready.set()
+
+    async def _serve(self):
+        """Socket öffnen und bis stop() laufen lassen"""
+        self.loop = asyncio.get_running_loop()
+        self.stopping = asyncio.Event()
+        if self.path is None:
+            server = await asyncio.start_server(self.handle_client, self.host, self.port)
+            self.port = server.sockets[0].getsockname()[1]
+        else:
+            self._remove_stale_socket()
+            server = await asyncio.start_unix_server(self.handle_client, self.path)
+            os.chmod(self.path, 0o600)
+        self.ready.set()
+
+        try:
+            await self.stopping.wait()
+        finally:
+            server.close()
+            subscribers = list(self.subscribers)
+            for subscriber in subscribers:
+                self._drop(subscriber)
+            # Verbindungs-Tasks selbst auslaufen lassen statt sie beim Loop-Ende abzubrechen
+            if self.client_tasks:
+                await asyncio.wait(list(self.client_tasks), timeout=2)
+            # Abnehmer, die nicht mehr lesen, blockieren das Schließen - hart trennen
+            if self.client_tasks:
+                for subscriber in subscribers:
+                    subscriber.writer.transport.abort()
+                await asyncio.wait(list(self.client_tasks), timeout=1)
+            await server.wait_closed()
+            if self.path is not None:
+                try:
+                    os.unlink(self.path)
+                except OSError:
+                    pass
+
+    def _remove_stale_socket(self):
+        """Verwaiste Socket-Datei entfernen (läuft dort noch ein Publisher, abbrechen)"""
+        try:
+            if not stat.S_ISSOCK(os.stat(self.path).st_mode):
+                raise RuntimeError(f"{self.path} existiert und ist kein Socket")
+        except FileNotFoundError:
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+            raise RuntimeError(f"{self.path} wird bereits von einem anderen Publisher verwendet")
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(self.path)
+        finally:
+            probe.close()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Abnehmer verwalten, bis er trennt oder getrennt wird"""
+        current = asyncio.current_task()
+        self.client_tasks.add(current)
+
+        # Format erst lesen, dann abonnieren - sonst gehen die ersten Frames im falschen Format raus
+        frame_format = "jsonl"
+        line = None
+        try:
+            line = await asyncio.wait_for(reader.readline(), FORMAT_TIMEOUT)
+            command = line.decode("utf-8", "replace").strip().lower()
+            if command in FRAME_FORMATS:
+                frame_format = command
+        except asyncio.TimeoutError:
+            pass
+        except (ConnectionError, ValueError):
+            line = b""
+        # Getrennt, bevor das Format kam, oder Publisher wird beendet
+        if line == b"" or self.stopping.is_set():
+            writer.close()
+            self.client_tasks.discard(current)
+            return
+
+        subscriber = Subscriber(writer, self.max_queue, frame_format)
+        self.subscribers.add(subscriber)
+        tasks = [
+            asyncio.create_task(self._write_frames(subscriber)),
+            asyncio.create_task(self._read_commands(reader, subscriber))
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._drop(subscriber)
+            self.client_tasks.discard(current)
+
+    async def _write_frames(self, subscriber: Subscriber):
+        """Queue des Abnehmers in den Socket schreiben"""
+        try:
+            while True:
+                snapshot, sample_count, encoded = await subscriber.queue.get()
+                frame_format = subscriber.frame_format
+                frame = encoded.get(frame_format)
+                if frame is None:
+                    encode = encode_binary if frame_format == "binary" else encode_jsonl
+                    frame = encoded[frame_format] = encode(snapshot, sample_count)
+                subscriber.writer.write(frame)
+                # Backpressure: warten, bis der Socket-Puffer wieder Platz hat
+                await subscriber.writer.drain()
+                subscriber.sent += 1
+                self.frames_sent += 1
+        except ConnectionError:
+            return
+        except Exception as e:
+            print(f"Fehler im Snapshot-Publisher: {e}")
+
+    async def _read_commands(self, reader: asyncio.StreamReader, subscriber: Subscriber):
+        """Format-Befehle ("jsonl"/"binary") lesen, endet beim Trennen"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                command = line.decode("utf-8", "replace").strip().lower()
+                if command in FRAME_FORMATS:
+                    subscriber.frame_format = command
+        except (ConnectionError, ValueError):
+            return
+
+    def get_address(self) -> str:
+        """Adresse des Publishers (Socket-Pfad oder host:port)"""
+        return self.path if self.path is not None else f"{self.host}:{self.port}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Abnehmer, verteilte Frames und getrennte langsame Abnehmer"""
+        return {
+            "subscribers": len(self.subscribers),
+            "published": self.published,
+            "frames_sent": self.frames_sent,
+            "disconnected_slow": self.disconnected_slow,
+            "max_publish_ms": self.max_publish_ms
+        }
+
+
+def start_from_config(sampler, config_manager) -> Optional[SnapshotPublisher]:
+    """Publisher starten, falls in der Konfiguration aktiviert"""
+    config = config_manager.get_publisher_config()
+    if not config.get("enabled", False):
+        return None
+    publisher = SnapshotPublisher(sampler, config.get("socket_path") or None,
+                                  int(config.get("max_queue", DEFAULT_MAX_QUEUE)))
+    return publisher if publisher.start() else None
+
+
+def iter_frames(path: Optional[str] = None, frame_format: str = "jsonl") -> Iterator[Dict[str, Any]]:
+    """Snapshots vom Publisher lesen (blockierender Client für Skripte und Hooks)"""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(path or default_socket_path())
+    try:
+        client.sendall(frame_format.encode("ascii") + b"\n")
+        stream = client.makefile("rb")
+        while True:
+            if frame_format == "binary":
+                frame = stream.read(BINARY_FRAME.size)
+                if len(frame) < BINARY_FRAME.size:
+                    return
+                yield decode_binary(frame)
+            else:
+                line = stream.readline()
+                if not line:
+                    return
+                yield json.loads(line)
+    finally:
+        client.close()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Rate-Control
+Zentrale Verwaltung der Refresh-Intervalle für Anzeige, Graphen und Logging
+(inkl. Frame-Budget und Obergrenze des Graph-Throttlings)
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+from typing import Callable, Dict, List
+
+# Raten-Kategorie -> (Konfigurations-Bereich, Schlüssel, Standard in ms)
+RATE_SETTINGS = {
+    "display": ("monitoring", "update_interval", 1000),
+    "graphs": ("graphs", "refresh_interval", 1000),
+    "logging": ("logging", "log_interval", 1000),
+    "graphs_frame_budget": ("graphs", "frame_budget_ms", 50),
+    "graphs_max_interval": ("graphs", "max_refresh_interval", 10000)
+}
+
+
+class RateController:
+    """
+    Rate-Control für SystemMonitorX
+    - Liest die Intervalle aus dem ConfigManager
+    - Timer und Schleifen melden einen Setter pro Kategorie an
+    - apply() überträgt geänderte Intervalle sofort (ohne Neustart)
+    """
+
+    def __init__(self, config_manager):
+        self.config_manager = config_manager
+
+        # Angemeldete Setter pro Kategorie
+        self.targets = {category: [] for category in RATE_SETTINGS}
+
+        # Aktuell angewendete Intervalle
+        self.intervals = self.read_intervals()
+
+    def read_intervals(self) -> Dict[str, int]:
+        """Intervalle (ms) aus der Konfiguration lesen"""
+        intervals = {}
+        for category, (section, key, default) in RATE_SETTINGS.items():
+            value = self.config_manager.get_setting(section, key, default)
+            try:
+                intervals[category] = max(1, int(value))
+            except (TypeError, ValueError):
+                intervals[category] = default
+        return intervals
+
+    def get_interval(self, category: str) -> int:
+        """Aktuelles Intervall einer Kategorie (ms)"""
+        return self.intervals[category]
+
+    def register(self, category: str, setter: Callable[[int], None]):
+        """Setter anmelden und sofort mit dem aktuellen Intervall aufrufen"""
+        self.targets[category].append(setter)
+        setter(self.intervals[category])
+
+    def unregister(self, category: str, setter: Callable[[int], None]):
+        """Setter abmelden"""
+        self.targets[category] = [s for s in self.targets[category] if s != setter]
+
+    def apply(self) -> List[str]:
+        """Geänderte Intervalle an alle angemeldeten Timer und Schleifen übertragen"""
+        changed = []
+        for category, interval in self.read_intervals().items():
+            if interval == self.intervals[category]:
+                continue
+            self.intervals[category] = interval
+            changed.append(category)
+
+            for setter in list(self.targets[category]):
+                try:
+                    setter(interval)
+                except Exception as e:
+                    print(f"Fehler beim Anwenden des Intervalls ({category}): {e}")
+
+        if changed:
+            summary = ", ".join(f"{c}: {self.intervals[c]} ms" for c in changed)
+            print(f"Intervalle angewendet - {summary}")
+        return changed
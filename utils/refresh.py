@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Refresh-Koordinator
+Ein gemeinsamer Takt für Dashboard und Desktop-Widgets
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import time
+from PyQt6.QtCore import QObject, QTimer, Qt, pyqtSignal
+from PyQt6 import sip
+from typing import Callable, Dict, Any, Optional
+
+from utils.snapshot import SnapshotSampler
+
+
+class RefreshCoordinator(QObject):
+    """
+    Refresh-Koordinator für SystemMonitorX
+    - Ein QTimer statt eines Timers pro Widget, gestellt auf den nächsten fälligen Verbraucher
+    - Ein Snapshot pro Takt für alle fälligen Verbraucher
+    - Jeder Verbraucher hat sein eigenes Intervall und seinen letzten Zustellzeitpunkt
+    - Überspringt versteckte, minimierte und geschlossene Widgets
+    - Low-Power-Modus: langsamer, grober Takt ohne Rendering (nur im Tray)
+    - Hintergrund-Verbraucher (Logger, Graph-Verlauf) sampeln in ihrer Rate, ohne UI-Callbacks
+    """
+
+    # Signal mit dem Snapshot jedes Anzeige-Takts
+    snapshot_ready = pyqtSignal(dict)
+
+    # Ein Verbraucher gilt schon etwas vor Ablauf seines Intervalls als fällig (Timer-Ungenauigkeit)
+    DUE_TOLERANCE = 0.1
+
+    def __init__(self, sampler: Optional[SnapshotSampler] = None, interval: int = 1000,
+                 low_power_interval: int = 5000):
+        super().__init__()
+        self.sampler = sampler or SnapshotSampler()
+
+        # Takt-Intervalle (ms)
+        self.interval = interval
+        self.low_power_interval = low_power_interval
+
+        # Low-Power-Zustand und Wakeup-Messung
+        self.low_power = False
+        self.low_power_since = None
+        self.low_power_ticks = 0
+
+        # Registrierte Verbraucher: Liste von [Widget, Callback, Intervall (None = Anzeige), zuletzt]
+        self.subscribers = []
+
+        # Hintergrund-Verbraucher: Name -> [Callback, Intervall, zuletzt]
+        self.consumers = {}
+
+        # Letzter Anzeige-Takt (snapshot_ready)
+        self.last_display = None
+        self.running = False
+
+        # Einmal-Timer, nach jedem Takt auf den nächsten fälligen Verbraucher gestellt
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.tick)
+
+    def start(self):
+        """Takt starten (erster Anzeige-Takt nach einem Intervall)"""
+        self.running = True
+        self.last_display = time.monotonic()
+        self._schedule()
+
+    def stop(self):
+        """Takt stoppen"""
+        self.running = False
+        self.timer.stop()
+
+    def get_display_interval(self) -> int:
+        """Intervall des Anzeige-Takts (ms, im Low-Power-Modus der grobe Takt)"""
+        return self.low_power_interval if self.low_power else self.interval
+
+    def set_interval(self, interval: int):
+        """Anzeige-Intervall ändern (ms)"""
+        self.interval = interval
+        self._schedule()
+
+    def add_consumer(self, name: str, callback: Callable[[Dict[str, Any]], None], interval: int):
+        """Hintergrund-Verbraucher mit eigener Rate anmelden bzw. sein Intervall ändern (ms)"""
+        last = self.consumers[name][2] if name in self.consumers else None
+        self.consumers[name] = [callback, interval, last]
+        self._schedule()
+
+    def remove_consumer(self, name: str):
+        """Hintergrund-Verbraucher abmelden"""
+        if self.consumers.pop(name, None) is not None:
+            self._schedule()
+
+    def set_low_power(self, enabled: bool):
+        """Low-Power-Modus umschalten (langsamer, grober Takt ohne Rendering)"""
+        if enabled == self.low_power:
+            return
+        self.low_power = enabled
+
+        if enabled:
+            self.low_power_since = time.monotonic()
+            self.low_power_ticks = 0
+            # Grober Timer erlaubt dem System, Wakeups zusammenzulegen
+            self.timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        else:
+            self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._schedule()
+
+    def get_power_stats(self) -> Dict[str, Any]:
+        """Wakeups pro Sekunde im aktuellen bzw. letzten Low-Power-Zeitraum"""
+        duration = time.monotonic() - self.low_power_since if self.low_power_since else 0.0
+        return {
+            "low_power": self.low_power,
+            "interval_ms": self.get_display_interval(),
+            "duration_s": duration,
+            "wakeups": self.low_power_ticks,
+            "wakeups_per_second": self.low_power_ticks / duration if duration > 0 else 0.0
+        }
+
+    def register(self, widget, callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 interval: Optional[int] = None):
+        """Widget mit Update-Callback registrieren (Intervall in ms, Standard: Anzeige-Takt)"""
+        callback = callback or widget.update_data
+        self.subscribers.append([widget, callback, interval, None])
+        widget.destroyed.connect(lambda *args, w=widget: self.unregister(w))
+
+    def unregister(self, widget):
+        """Widget abmelden"""
+        self.subscribers = [entry for entry in self.subscribers if entry[0] is not widget]
+
+    def _is_visible(self, widget) -> bool:
+        """Sichtbar und nicht minimiert (gelöschte Widgets werden abgemeldet)"""
+        if sip.isdeleted(widget):
+            self.unregister(widget)
+            return False
+        return widget.isVisible() and not widget.isMinimized()
+
+    def _is_due(self, last: Optional[float], interval: int, now: float) -> bool:
+        """Ist das Intervall (ms) seit der letzten Zustellung abgelaufen?"""
+        return last is None or (now - last) * 1000 >= interval * (1 - self.DUE_TOLERANCE)
+
+    def tick(self, force: bool = False):
+        """Fällige Verbraucher mit einem gemeinsamen Snapshot versorgen (force: Anzeige sofort)"""
+        now = time.monotonic()
+        display_due = force or self._is_due(self.last_display, self.get_display_interval(), now)
+        # Nichts sichtbar (Low-Power): kein Rendering, nur Tray und Hintergrund-Verbraucher
+        subscribers = []
+        if not self.low_power:
+            subscribers = [entry for entry in list(self.subscribers) if self._is_visible(entry[0])
+                           and (force or self._is_due(entry[3], entry[2] or self.interval, now))]
+        consumers = [entry for entry in self.consumers.values() if self._is_due(entry[2], entry[1], now)]
+
+        if self.low_power:
+            # Auch Wakeups nur für den Logger zählen
+            self.low_power_ticks += 1
+        if not (display_due or subscribers or consumers):
+            # Zu früh geweckt: nur neu stellen
+            self._schedule()
+            return
+
+        snapshot = self.sampler.sample()
+
+        for entry in subscribers:
+            widget, callback = entry[0], entry[1]
+            entry[3] = now
+            try:
+                callback(snapshot)
+            except Exception as e:
+                print(f"Fehler beim Refresh von {type(widget).__name__}: {e}")
+
+        for entry in consumers:
+            entry[2] = now
+            try:
+                entry[0](snapshot)
+            except Exception as e:
+                print(f"Fehler beim Zustellen des Snapshots: {e}")
+
+        if display_due:
+            self.last_display = now
+            self.snapshot_ready.emit(snapshot)
+        self._schedule()
+
+    def _schedule(self):
+        """Timer auf den nächsten fälligen Verbraucher stellen"""
+        if not self.running:
+            return
+        now = time.monotonic()
+        deadlines = [(self.last_display or now) + self.get_display_interval() / 1000]
+        if not self.low_power:
+            deadlines += [entry[3] + (entry[2] or self.interval) / 1000 for entry in list(self.subscribers)
+                          if entry[3] is not None and self._is_visible(entry[0])]
+        deadlines += [now if entry[2] is None else entry[2] + entry[1] / 1000
+                      for entry in self.consumers.values()]
+        self.timer.start(max(0, round((min(deadlines) - now) * 1000)))
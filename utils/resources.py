@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Ressourcen-Budget
+Speicher- und CPU-Verbrauch des eigenen Prozesses messen und gegen ein Budget prüfen
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import sys
+from typing import Dict, List, Any, Optional
+import psutil
+
+# Budget für den Tray-Only-Modus (Resident Memory in MB, CPU in % eines Kerns)
+TRAY_ONLY_BUDGET = {
+    "rss_mb": 100.0,
+    "cpu_percent": 1.0
+}
+
+# Module, die im Tray-Only-Modus erst bei Bedarf geladen werden sollen
+LAZY_MODULES = ["matplotlib", "numpy", "windows.graph_window", "windows.settings_window",
+                "widgets.cpu_widget", "widgets.ram_widget", "widgets.disk_widget",
+                "widgets.system_widget"]
+
+# Budget des Headless-Collectors (collector.py)
+COLLECTOR_BUDGET = {
+    "rss_mb": 40.0,
+    "cpu_percent": 0.5
+}
+
+# Module, die der Headless-Collector nie laden darf
+HEADLESS_FORBIDDEN_MODULES = ["PyQt6", "matplotlib", "pystray", "PIL"]
+
+
+class ResourceBudget:
+    """
+    Ressourcen-Budget für SystemMonitorX
+    - Misst RSS, CPU-Anteil (seit der letzten Messung) und Threads
+    - Meldet bereits geladene "schwere" Module
+    - Prüft die Messung gegen ein Budget
+    """
+
+    def __init__(self, budget: Optional[Dict[str, float]] = None,
+                 watched_modules: Optional[List[str]] = None):
+        self.budget = dict(budget or TRAY_ONLY_BUDGET)
+        self.watched_modules = list(watched_modules or LAZY_MODULES)
+        self.process = psutil.Process()
+
+        # Referenzwert setzen: erste Messung liefert sonst immer 0.0
+        self.process.cpu_percent(interval=None)
+
+    def measure(self) -> Dict[str, Any]:
+        """Aktuellen Verbrauch des Prozesses messen"""
+        return {
+            "rss_mb": self.process.memory_info().rss / (1024**2),
+            "cpu_percent": self.process.cpu_percent(interval=None),
+            "threads": self.process.num_threads(),
+            "loaded_modules": [name for name in self.watched_modules if name in sys.modules]
+        }
+
+    def check(self, usage: Optional[Dict[str, Any]] = None) -> List[str]:
+        """Budget-Überschreitungen als Liste von Meldungen"""
+        usage = usage or self.measure()
+        violations = []
+        if usage["rss_mb"] > self.budget["rss_mb"]:
+            violations.append(f"RSS {usage['rss_mb']:.0f} MB > {self.budget['rss_mb']:.0f} MB")
+        if usage["cpu_percent"] > self.budget["cpu_percent"]:
+            violations.append(f"CPU {usage['cpu_percent']:.1f}% > {self.budget['cpu_percent']:.1f}%")
+        return violations
+
+    def format_report(self, usage: Dict[str, Any]) -> str:
+        """Messung als lesbare Zeile"""
+        modules = ", ".join(usage["loaded_modules"]) or "keine"
+        return (f"RSS {usage['rss_mb']:.0f} MB (Budget {self.budget['rss_mb']:.0f} MB) | "
+                f"CPU {usage['cpu_percent']:.1f}% (Budget {self.budget['cpu_percent']:.1f}%) | "
+                f"Threads {usage['threads']} | Geladen: {modules}")
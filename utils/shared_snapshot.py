@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Shared-Memory-Snapshots
+Letzter Snapshot und kurzer Ringpuffer in einem Shared-Memory-Segment (Seqlock)
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import os
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, Any, Optional
+
+from utils.publisher import BINARY_FRAME, BINARY_MAGIC, binary_values, decode_binary
+
+# Header: Magic, Layout-Version, Slots, Frame-Größe, PID des Schreibers, Sequenz, letzte Sample-Nr.
+SHARED_MAGIC = b"SMXS"
+SHARED_LAYOUT_VERSION = 1
+SHARED_HEADER = struct.Struct("<4sHHIQQQ")
+SEQUENCE_OFFSET = struct.calcsize("<4sHHIQ")
+SEQUENCE = struct.Struct("<QQ")
+
+DEFAULT_SLOTS = 120
+
+# Leseversuche, bevor ein Leser aufgibt (Schreiber mitten im Update)
+MAX_READ_RETRIES = 1000
+
+
+def default_segment_name() -> str:
+    """Standard-Name des Segments (pro Benutzer)"""
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    return f"systemmonitorx-{user}"
+
+
+def segment_size(slots: int) -> int:
+    """Größe des Segments in Bytes (Header + Ringpuffer)"""
+    return SHARED_HEADER.size + slots * BINARY_FRAME.size
+
+
+def attach_segment(name: str) -> shared_memory.SharedMemory:
+    """Bestehendes Segment öffnen, ohne es beim Beenden des Lesers zu entfernen"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Vor Python 3.13: der resource_tracker würde das Segment beim Beenden löschen
+        segment = shared_memory.SharedMemory(name=name)
+        if os.name == "posix":
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+
+class SharedSnapshotWriter:
+    """
+    Shared-Memory-Schreiber für SystemMonitorX
+    - Ein Segment mit Header und Ringpuffer aus Binär-Frames (Format wie der Publisher)
+    - Seqlock: Sequenz ungerade während des Schreibens, danach gerade
+    - Schreibt direkt im Sampler-Thread (pack_into, keine Zwischenkopie)
+    - Leser brauchen weder psutil noch /proc
+    """
+
+    def __init__(self, sampler, name: Optional[str] = None, slots: int = DEFAULT_SLOTS):
+        self.sampler = sampler
+        self.name = name or default_segment_name()
+        self.slots = max(1, min(int(slots), 0xFFFF))
+        self.segment = None
+        self.buffer = None
+        self.sequence = 0
+        self.sample_count = 0
+        self.write_count = 0
+        self.max_write_ms = 0.0
+
+        # Seqlock mit genau einem Schreiber (Listener laufen evtl. in mehreren Threads)
+        self.lock = threading.Lock()
+
+    def start(self) -> bool:
+        """Segment anlegen und Snapshots abonnieren"""
+        if self.segment is not None:
+            return True
+        try:
+            self.segment = self._create_segment()
+        except Exception as e:
+            print(f"Fehler beim Anlegen des Shared-Memory-Segments: {e}")
+            return False
+
+        self.buffer = self.segment.buf
+        SHARED_HEADER.pack_into(self.buffer, 0, SHARED_MAGIC, SHARED_LAYOUT_VERSION, self.slots,
+                                BINARY_FRAME.size, os.getpid(), 0, 0)
+
+        # Bereits vorhandenen Snapshot sofort veröffentlichen
+        latest = self.sampler.get_latest()
+        if latest is not None:
+            self.publish(latest, self.sampler.sample_count)
+        self.sampler.add_listener(self.publish)
+        print(f"Shared-Memory-Snapshots: {self.name} ({self.slots} Slots, {self.segment.size} Bytes)")
+        return True
+
+    def stop(self):
+        """Abo beenden und Segment entfernen"""
+        if self.segment is None:
+            return
+        self.sampler.remove_listener(self.publish)
+        with self.lock:
+            self.buffer = None
+        try:
+            self.segment.close()
+            self.segment.unlink()
+        except Exception as e:
+            print(f"Fehler beim Entfernen des Shared-Memory-Segments: {e}")
+        self.segment = None
+
+    def _create_segment(self) -> shared_memory.SharedMemory:
+        """Segment anlegen (verwaistes Segment eines beendeten Schreibers ersetzen)"""
+        size = segment_size(self.slots)
+        try:
+            return shared_memory.SharedMemory(name=self.name, create=True, size=size)
+        except FileExistsError:
+            pass
+
+        # Ohne Tracking prüfen - sonst entfernt der resource_tracker ein fremdes, aktives Segment
+        existing = attach_segment(self.name)
+        try:
+            magic, _, _, _, pid, _, _ = SHARED_HEADER.unpack_from(existing.buf, 0)
+            if magic == SHARED_MAGIC and pid != os.getpid() and _pid_alive(pid):
+                raise RuntimeError(f"{self.name} wird bereits von Prozess {pid} verwendet")
+        finally:
+            existing.close()
+
+        stale = shared_memory.SharedMemory(name=self.name)
+        stale.close()
+        stale.unlink()
+        return shared_memory.SharedMemory(name=self.name, create=True, size=size)
+
+    def publish(self, snapshot: Dict[str, Any], sample_count: int):
+        """Snapshot in den Ring schreiben (Listener des Samplers)"""
+        with self.lock:
+            # Verspätete (ältere) Snapshots überspringen
+            if self.buffer is None or sample_count <= self.sample_count:
+                return
+            started = time.perf_counter()
+            offset = SHARED_HEADER.size + (sample_count % self.slots) * BINARY_FRAME.size
+
+            # Ungerade Sequenz: Leser verwerfen, was sie gerade kopieren
+            self.sequence += 1
+            SEQUENCE.pack_into(self.buffer, SEQUENCE_OFFSET, self.sequence, self.sample_count)
+            BINARY_FRAME.pack_into(self.buffer, offset, *binary_values(snapshot, sample_count))
+            self.sequence += 1
+            self.sample_count = sample_count
+            SEQUENCE.pack_into(self.buffer, SEQUENCE_OFFSET, self.sequence, sample_count)
+
+            self.write_count += 1
+            self.max_write_ms = max(self.max_write_ms, (time.perf_counter() - started) * 1000)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Geschriebene Snapshots und längster Schreibvorgang"""
+        return {
+            "writes": self.write_count,
+            "sequence": self.sequence,
+            "max_write_ms": self.max_write_ms
+        }
+
+
+class SharedSnapshotReader:
+    """
+    Shared-Memory-Leser für SystemMonitorX
+    - Liest den letzten Snapshot bzw. den Ringpuffer eines laufenden Schreibers
+    - Konsistent über die Seqlock-Sequenz (bei gleichzeitigem Schreiben neu lesen)
+    - Dekodiert direkt aus dem Segment, ohne Systemaufrufe
+    """
+
+    def __init__(self, name: Optional[str] = None):
+        self.name = name or default_segment_name()
+        self.segment = attach_segment(self.name)
+        self.buffer = self.segment.buf
+
+        magic, layout, slots, frame_size, pid, _, _ = SHARED_HEADER.unpack_from(self.buffer, 0)
+        if magic != SHARED_MAGIC or layout != SHARED_LAYOUT_VERSION or frame_size != BINARY_FRAME.size:
+            self.close()
+            raise ValueError(f"{self.name} ist kein SystemMonitorX-Segment (Layout {layout})")
+        self.slots = slots
+        self.writer_pid = pid
+        self.retries = 0
+
+    def close(self):
+        """Segment schließen (bleibt für andere Prozesse bestehen)"""
+        if self.segment is not None:
+            self.buffer = None
+            self.segment.close()
+            self.segment = None
+
+    def get_sample_count(self) -> int:
+        """Sample-Nr. des letzten vollständig geschriebenen Snapshots"""
+        return SEQUENCE.unpack_from(self.buffer, SEQUENCE_OFFSET)[1]
+
+    def read_latest(self) -> Optional[Dict[str, Any]]:
+        """Letzten Snapshot lesen (None, solange noch keiner geschrieben wurde)"""
+        history = self._read(1)
+        return history[-1] if history else None
+
+    def read_history(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Die letzten Snapshots aus dem Ring, älteste zuerst"""
+        return self._read(self.slots if count is None else max(1, min(count, self.slots)))
+
+    def _read(self, count: int) -> List[Dict[str, Any]]:
+        """Konsistente Kopie der letzten count Frames (Seqlock-Leseschleife)"""
+        for attempt in range(MAX_READ_RETRIES):
+            sequence, sample_count = SEQUENCE.unpack_from(self.buffer, SEQUENCE_OFFSET)
+            if sequence % 2:
+                self.retries += 1
+                if attempt > 10:
+                    time.sleep(0)
+                continue
+
+            frames = []
+            for number in range(max(1, sample_count - count + 1), sample_count + 1):
+                offset = SHARED_HEADER.size + (number % self.slots) * BINARY_FRAME.size
+                # Leere Slots (Schreiber erst später gestartet) und übersprungene Samples auslassen
+                if self.buffer[offset:offset + len(BINARY_MAGIC)] != BINARY_MAGIC:
+                    continue
+                frame = decode_binary(self.buffer, offset)
+                if frame["sample_count"] == number:
+                    frames.append(frame)
+
+            if SEQUENCE.unpack_from(self.buffer, SEQUENCE_OFFSET)[0] == sequence:
+                return frames
+            self.retries += 1
+        raise TimeoutError(f"{self.name}: kein konsistenter Snapshot nach {MAX_READ_RETRIES} Versuchen")
+
+    def is_writer_alive(self) -> bool:
+        """Läuft der schreibende Prozess noch?"""
+        return _pid_alive(self.writer_pid)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Existiert ein Prozess mit dieser PID?"""
+    try:
+        import psutil
+        return psutil.pid_exists(pid)
+    except Exception:
+        return True
+
+
+def start_from_config(sampler, config_manager) -> Optional[SharedSnapshotWriter]:
+    """Shared-Memory-Schreiber starten, falls in der Konfiguration aktiviert"""
+    config = config_manager.get_shared_memory_config()
+    if not config.get("enabled", False):
+        return None
+    writer = SharedSnapshotWriter(sampler, config.get("name") or None, int(config.get("slots", DEFAULT_SLOTS)))
+    return writer if writer.start() else None
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - System-Snapshot
+Gemeinsame, Qt-freie Erfassung aller System-Daten in einem Durchlauf
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import getpass
+import os
+import socket
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+import psutil
+
+
+def get_username() -> str:
+    """Benutzernamen ermitteln (os.getlogin schlägt ohne Terminal fehl)"""
+    try:
+        return os.getlogin()
+    except OSError:
+        try:
+            return getpass.getuser()
+        except Exception:
+            return "Unknown"
+
+
+def get_os_name() -> str:
+    """Lesbaren Betriebssystem-Namen ermitteln"""
+    platform = sys.platform
+    if platform == "win32":
+        return "Windows"
+    elif platform == "darwin":
+        return "macOS"
+    elif platform.startswith("linux"):
+        return "Linux"
+    return platform
+
+
+class SnapshotSampler:
+    """
+    Snapshot-Sampler für SystemMonitorX
+    - Eine psutil-Abfrage pro Takt für alle Verbraucher
+    - Nicht-blockierende CPU-Messung (Differenz seit dem letzten Sample)
+    - Statische Werte (Kerne, OS, Benutzer) werden nur einmal ermittelt
+    - Thread-sicher
+    """
+
+    def __init__(self, disk_path: str = '/', online_check_interval: float = 10.0):
+        self.disk_path = disk_path
+        self.online_check_interval = online_check_interval
+
+        # Statische System-Informationen
+        self.cpu_count = psutil.cpu_count()
+        self.platform = sys.platform
+        self.os_name = get_os_name()
+        self.username = get_username()
+        self.hostname = socket.gethostname() or "localhost"
+
+        # Online-Status nur gelegentlich prüfen
+        self._online = None
+        self._online_checked = 0.0
+
+        self.latest = None
+        self.sample_count = 0
+        self.lock = threading.Lock()
+
+        # Abnehmer, die jeden neuen Snapshot erhalten (z. B. Socket-Publisher)
+        self.listeners = []
+
+        # Erster Aufruf liefert bei psutil immer 0.0 - Referenzwert setzen
+        psutil.cpu_percent(interval=None)
+
+    def sample(self) -> Dict[str, Any]:
+        """Neuen Snapshot erfassen"""
+        try:
+            # CPU-Daten
+            cpu_percent = psutil.cpu_percent(interval=None)
+            cpu_freq = psutil.cpu_freq()
+            cpu_freq_ghz = cpu_freq.current / 1000 if cpu_freq else None
+
+            # RAM-Daten
+            memory = psutil.virtual_memory()
+
+            # Disk-Daten
+            disk = psutil.disk_usage(self.disk_path)
+
+            snapshot = {
+                "timestamp": datetime.now().isoformat(),
+                "cpu_percent": cpu_percent,
+                "cpu_count": self.cpu_count,
+                "cpu_freq_ghz": cpu_freq_ghz,
+                "ram_percent": memory.percent,
+                "ram_used_gb": memory.used / (1024**3),
+                "ram_total_gb": memory.total / (1024**3),
+                "disk_percent": (disk.used / disk.total) * 100,
+                "disk_used_gb": disk.used / (1024**3),
+                "disk_total_gb": disk.total / (1024**3),
+                "platform": self.platform,
+                "os_name": self.os_name,
+                "username": self.username,
+                "hostname": self.hostname,
+                "online": self._check_online()
+            }
+
+        except Exception as e:
+            print(f"Fehler beim Erfassen des Snapshots: {e}")
+            snapshot = {
+                "timestamp": datetime.now().isoformat(),
+                "error": str(e)
+            }
+
+        with self.lock:
+            self.latest = snapshot
+            self.sample_count += 1
+            sample_count = self.sample_count
+
+        for listener in list(self.listeners):
+            try:
+                listener(snapshot, sample_count)
+            except Exception as e:
+                print(f"Fehler beim Weitergeben des Snapshots: {e}")
+
+        return snapshot
+
+    def add_listener(self, listener):
+        """Abnehmer für neue Snapshots anmelden (wird im Thread des Aufrufers von sample() gerufen)"""
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Abnehmer abmelden"""
+        self.listeners = [l for l in self.listeners if l != listener]
+
+    def get_latest(self) -> Optional[Dict[str, Any]]:
+        """Letzten Snapshot zurückgeben (ohne neue Abfrage)"""
+        with self.lock:
+            return self.latest
+
+    def _check_online(self) -> Optional[bool]:
+        """Netzwerk-Verfügbarkeit prüfen (gecacht)"""
+        now = time.monotonic()
+        if self._online is None or now - self._online_checked >= self.online_check_interval:
+            try:
+                self._online = bool(psutil.net_if_addrs())
+            except Exception:
+                self._online = None
+            self._online_checked = now
+        return self._online
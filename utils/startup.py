@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Startup-Metriken
+Time-to-First-Frame und Dauer der Start-Phasen pro Programmstart erfassen
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import csv
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Any, Optional
+import psutil
+
+# Eigenes Unterverzeichnis: die Log-Rotation räumt *.csv direkt in logs/ auf
+STARTUP_METRICS_PATH = os.path.join("logs", "metrics", "startup.csv")
+
+CSV_FIELDS = ["timestamp", "mode", "process_to_first_frame_ms", "main_to_first_frame_ms",
+              "deferred_ms", "phases"]
+
+
+class StartupMetrics:
+    """
+    Startup-Metriken für SystemMonitorX
+    - Misst benannte Start-Phasen (setup_*)
+    - Time-to-First-Frame ab Prozessstart und ab main()
+    - Dauer der nach dem ersten Frame nachgeladenen Subsysteme
+    - Hängt pro Start eine Zeile an logs/metrics/startup.csv an
+    """
+
+    def __init__(self, mode: str = "dashboard"):
+        self.mode = mode
+        self.started = time.perf_counter()
+        self.phases = {}
+
+        self.process_to_first_frame_ms = None
+        self.main_to_first_frame_ms = None
+        self.deferred_ms = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Dauer einer Start-Phase messen"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = (time.perf_counter() - started) * 1000
+
+    def mark_first_frame(self):
+        """Ersten Frame festhalten (nur beim ersten Aufruf)"""
+        if self.main_to_first_frame_ms is not None:
+            return
+        self.main_to_first_frame_ms = (time.perf_counter() - self.started) * 1000
+        try:
+            process_age = time.time() - psutil.Process().create_time()
+            self.process_to_first_frame_ms = process_age * 1000
+        except Exception as e:
+            print(f"Fehler beim Lesen der Prozess-Startzeit: {e}")
+
+    def mark_deferred_done(self, started: float):
+        """Dauer der nachgeladenen Subsysteme festhalten"""
+        self.deferred_ms = (time.perf_counter() - started) * 1000
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Aktuelle Messwerte"""
+        return {
+            "mode": self.mode,
+            "process_to_first_frame_ms": self.process_to_first_frame_ms,
+            "main_to_first_frame_ms": self.main_to_first_frame_ms,
+            "deferred_ms": self.deferred_ms,
+            "phases": dict(self.phases)
+        }
+
+    def format_summary(self) -> str:
+        """Messwerte als lesbare Zeile"""
+        def ms(value: Optional[float]) -> str:
+            return "-" if value is None else f"{value:.0f} ms"
+
+        phases = ", ".join(f"{name} {value:.0f} ms" for name, value in self.phases.items())
+        return (f"Erster Frame nach {ms(self.process_to_first_frame_ms)} (Prozess) / "
+                f"{ms(self.main_to_first_frame_ms)} (main) | Nachgeladen: {ms(self.deferred_ms)} | "
+                f"{phases}")
+
+    def write_csv(self, path: str = STARTUP_METRICS_PATH):
+        """Messwerte als Zeile an die CSV-Datei anhängen"""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_header = not os.path.exists(path)
+
+            def ms(value: Optional[float]) -> str:
+                return "" if value is None else f"{value:.1f}"
+
+            with open(path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if write_header:
+                    writer.writerow(CSV_FIELDS)
+                writer.writerow([
+                    datetime.now().isoformat(timespec="seconds"),
+                    self.mode,
+                    ms(self.process_to_first_frame_ms),
+                    ms(self.main_to_first_frame_ms),
+                    ms(self.deferred_ms),
+                    ";".join(f"{name}={value:.1f}" for name, value in self.phases.items())
+                ])
+
+        except Exception as e:
+            print(f"Fehler beim Schreiben der Startup-Metriken: {e}")
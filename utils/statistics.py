@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Statistik-Engine
+Gleitende Kennzahlen (EWMA, Mittelwert, Standardabweichung, Perzentile)
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import math
+import random
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+
+class SkiplistNode:
+    """Knoten der Skiplist: Wert, Nachfolger und Sprungweite pro Ebene"""
+
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value, levels: int):
+        self.value = value
+        self.next: List[Optional["SkiplistNode"]] = [None] * levels
+        self.width = [1] * levels
+
+
+class IndexableSkiplist:
+    """
+    Sortierte Folge mit Zugriff über den Rang
+    - Einfügen, Entfernen und Wert an Rang i in O(log n) (erwartet)
+    - Jede Ebene speichert die Sprungweite (übersprungene Elemente) zum Nachfolger
+    """
+
+    def __init__(self, expected_size: int = 100):
+        self.size = 0
+        self.levels = max(1, int(math.log2(max(2, expected_size))) + 1)
+        self.head = SkiplistNode(None, self.levels)
+        self.random = random.Random()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int):
+        """Wert an Rang index (0 = kleinster)"""
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+        node = self.head
+        steps = index + 1
+        for level in reversed(range(self.levels)):
+            while node.next[level] is not None and node.width[level] <= steps:
+                steps -= node.width[level]
+                node = node.next[level]
+        return node.value
+
+    def insert(self, value):
+        """Wert einsortieren (hinter gleiche Werte)"""
+        chain = [self.head] * self.levels
+        steps_at_level = [0] * self.levels
+        node = self.head
+        for level in reversed(range(self.levels)):
+            while node.next[level] is not None and node.next[level].value <= value:
+                steps_at_level[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        # Höhe geometrisch verteilt (p = 1/2)
+        height = 1
+        while height < self.levels and self.random.random() < 0.5:
+            height += 1
+
+        new_node = SkiplistNode(value, height)
+        steps = 0
+        for level in range(height):
+            previous = chain[level]
+            new_node.next[level] = previous.next[level]
+            previous.next[level] = new_node
+            new_node.width[level] = previous.width[level] - steps
+            previous.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(height, self.levels):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, value):
+        """Einen Eintrag mit diesem Wert entfernen"""
+        chain = [self.head] * self.levels
+        node = self.head
+        for level in reversed(range(self.levels)):
+            while node.next[level] is not None and node.next[level].value < value:
+                node = node.next[level]
+            chain[level] = node
+
+        target = chain[0].next[0]
+        if target is None or target.value != value:
+            raise KeyError(value)
+        for level in range(len(target.next)):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(len(target.next), self.levels):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+
+class RollingStatistics:
+    """
+    Streaming-Statistik über ein gleitendes Fenster
+    - EWMA in O(1) pro Sample
+    - Gleitender Mittelwert und Standardabweichung per Welford-Update im Fenster in O(1),
+      relativ zu einem Bezugswert, der einmal pro Fenster exakt neu berechnet wird
+      (numerisch stabil auch bei großen Werten mit kleiner Streuung)
+    - Perzentile über eine indexierbare Skiplist: Einfügen, Entfernen und Abfrage in O(log n)
+    - Thread-sicher, get_summary() liest alle Kennzahlen in einem Lock-Abschnitt
+    """
+
+    def __init__(self, window_size: int = 60, ewma_alpha: float = 0.1):
+        self.window_size = window_size
+        self.ewma_alpha = ewma_alpha
+
+        # Fenster in Eingangsreihenfolge und sortiert
+        self.window = deque()
+        self.sorted_window = IndexableSkiplist(window_size)
+
+        # Welford: Mittelwert (relativ zu shift) und Summe der quadrierten Abweichungen
+        self.shift = None
+        self.window_mean = 0.0
+        self.window_m2 = 0.0
+        self.updates_since_recompute = 0
+
+        self.ewma = None
+        self.count = 0
+
+        self.lock = threading.Lock()
+
+    def add(self, value: float):
+        """Neues Sample aufnehmen"""
+        value = float(value)
+        with self.lock:
+            # EWMA
+            if self.ewma is None:
+                self.ewma = value
+            else:
+                self.ewma += self.ewma_alpha * (value - self.ewma)
+
+            # Fenster erweitern
+            self.window.append(value)
+            self.sorted_window.insert(value)
+            self.count += 1
+            if self.shift is None:
+                self.shift = value
+            shifted = value - self.shift
+
+            if len(self.window) > self.window_size:
+                # Ältestes Sample ersetzen: Größe bleibt, Mittelwert und M2 verschieben sich
+                old_value = self.window.popleft()
+                self.sorted_window.remove(old_value)
+                old_shifted = old_value - self.shift
+                old_mean = self.window_mean
+                self.window_mean += (shifted - old_shifted) / len(self.window)
+                self.window_m2 += (shifted - old_shifted) * (shifted - self.window_mean + old_shifted - old_mean)
+            else:
+                delta = shifted - self.window_mean
+                self.window_mean += delta / len(self.window)
+                self.window_m2 += delta * (shifted - self.window_mean)
+
+            # Rundungsfehler nicht über viele Fenster ansammeln (amortisiert O(1))
+            self.updates_since_recompute += 1
+            if self.updates_since_recompute >= self.window_size:
+                self._recompute()
+
+    def _recompute(self):
+        """Bezugswert, Mittelwert und M2 exakt aus dem Fenster berechnen (Aufrufer hält den Lock)"""
+        n = len(self.window)
+        self.shift = math.fsum(self.window) / n
+        deviations = [value - self.shift for value in self.window]
+        self.window_mean = math.fsum(deviations) / n
+        self.window_m2 = math.fsum((d - self.window_mean) ** 2 for d in deviations)
+        self.updates_since_recompute = 0
+
+    def mean(self) -> Optional[float]:
+        """Gleitender Mittelwert"""
+        with self.lock:
+            return self._mean()
+
+    def std(self) -> Optional[float]:
+        """Gleitende Standardabweichung (Population)"""
+        with self.lock:
+            return self._std()
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Perzentil im Fenster (Nearest-Rank)"""
+        with self.lock:
+            return self._percentile(percent)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Alle Kennzahlen auf einmal (konsistent: dasselbe Fenster für alle Werte)"""
+        with self.lock:
+            return {
+                "ewma": self.ewma,
+                "mean": self._mean(),
+                "std": self._std(),
+                "p95": self._percentile(95),
+                "p99": self._percentile(99),
+                "count": self.count
+            }
+
+    def _mean(self) -> Optional[float]:
+        """Mittelwert (Aufrufer hält den Lock)"""
+        if not self.window:
+            return None
+        return self.shift + self.window_mean
+
+    def _std(self) -> Optional[float]:
+        """Standardabweichung (Aufrufer hält den Lock)"""
+        n = len(self.window)
+        if not n:
+            return None
+        # Rundungsfehler können M2 minimal negativ machen
+        return math.sqrt(max(0.0, self.window_m2 / n))
+
+    def _percentile(self, percent: float) -> Optional[float]:
+        """Perzentil (Aufrufer hält den Lock)"""
+        n = len(self.sorted_window)
+        if not n:
+            return None
+        rank = max(1, math.ceil(percent / 100 * n))
+        return self.sorted_window[rank - 1]
+
+    def reset(self):
+        """Statistik zurücksetzen"""
+        with self.lock:
+            self.window.clear()
+            self.sorted_window = IndexableSkiplist(self.window_size)
+            self.shift = None
+            self.window_mean = 0.0
+            self.window_m2 = 0.0
+            self.updates_since_recompute = 0
+            self.ewma = None
+            self.count = 0
+
+
+def summarize_values(values) -> Dict[str, Optional[float]]:
+    """Min, Mittelwert, Max und p95 (Nearest-Rank) einer Werteliste"""
+    ordered = sorted(float(v) for v in values if v is not None)
+    n = len(ordered)
+    if not n:
+        return {"min": None, "avg": None, "max": None, "p95": None, "count": 0}
+    rank = max(1, math.ceil(0.95 * n))
+    return {
+        "min": ordered[0],
+        "avg": sum(ordered) / n,
+        "max": ordered[-1],
+        "p95": ordered[rank - 1],
+        "count": n
+    }
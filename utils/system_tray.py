@@ -10,20 +10,21 @@ Version: 1.0.0
 
 import pystray
 import os
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import QTimer, pyqtSignal, QObject
 from PyQt6.QtGui import QIcon, QPixmap
-import psutil
-import threading
-import time
 from typing import Optional, Callable
 import math
 
+from utils.tray_atlas import TrayIconAtlas
+
 class SystemTrayIcon(QObject):
     """
     System-Tray Icon für SystemMonitorX
     - Dynamische Icons basierend auf System-Auslastung
+    - Updates aus den Snapshots der App (kein eigener Thread)
+    - Tooltip mit CPU, RAM und Festplatte
     - Context-Menü mit Aktionen
     - Minimize-to-Tray Funktionalität
     """
@@ -45,13 +46,15 @@ class SystemTrayIcon(QObject):
         # System-Tray Konfiguration
         self.tray_config = self.config_manager.get_system_tray_config()
         
-        # Icon-Generierung
+        # Icon-Generierung (vorgerenderter Atlas, 0-100 %)
         self.icon_size = 64
-        self.update_interval = 2000  # 2 Sekunden
+        self.icon_atlas = TrayIconAtlas(self.icon_size)
+        self.displayed_percent = None
+        self.displayed_tooltip = None
         
-        # Threading
-        self.update_thread = None
-        self.update_active = False
+        # Statistik
+        self.icon_updates = 0
+        self.tooltip_updates = 0
         
     def create_tray_icon(self):
         """System-Tray Icon erstellen"""
@@ -74,96 +77,28 @@ class SystemTrayIcon(QObject):
             self.icon.run_detached()
             self.tray_active = True
             
-            # Update-Thread starten
-            self.start_icon_updates()
-            
             print("System-Tray Icon erstellt")
             
         except Exception as e:
             print(f"Fehler beim Erstellen des System-Tray Icons: {e}")
             
     def create_dynamic_icon(self, cpu_percent: float = 0.0) -> Image.Image:
-        """Dynamisches Icon basierend auf CPU-Auslastung erstellen"""
-        # Icon-Größe
-        size = self.icon_size
-        
-        # Bild erstellen
-        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        # Hintergrund (abgerundetes Rechteck)
-        bg_color = (20, 20, 20, 200)  # Dark background
-        draw.rounded_rectangle([(2, 2), (size-2, size-2)], radius=8, fill=bg_color)
+        """Icon für die CPU-Auslastung aus dem vorgerenderten Atlas"""
+        return self.icon_atlas.get(cpu_percent)
         
-        # Basis-Tray-Icon laden (falls vorhanden)
-        try:
-            base_icon_path = "assets/tray/tray-icon.png"
-            if os.path.exists(base_icon_path):
-                base_icon = Image.open(base_icon_path)
-                base_icon = base_icon.resize((size-10, size-10), Image.Resampling.LANCZOS)
-                image.paste(base_icon, (5, 5), base_icon)
-        except Exception as e:
-            print(f"Fehler beim Laden des Basis-Tray-Icons: {e}")
-        
-        # CPU-Auslastung als einfacher Balken
-        center = size // 2
-        bar_width = size - 20
-        bar_height = 8
-        bar_y = center + 10
-        
-        # Hintergrund-Balken
-        draw.rectangle(
-            [10, bar_y, 10 + bar_width, bar_y + bar_height],
-            fill=(40, 40, 40, 100)
-        )
+    def update_icon(self, cpu_percent: float) -> bool:
+        """Icon nur übergeben, wenn sich der angezeigte Prozentwert ändert"""
+        percent = max(0, min(100, int(cpu_percent)))
+        if percent == self.displayed_percent:
+            return False
+        self.displayed_percent = percent
         
-        # CPU-Auslastung-Balken
-        if cpu_percent > 0:
-            # Farbe basierend auf Auslastung
-            if cpu_percent < 30:
-                color = (76, 175, 80, 255)  # Grün
-            elif cpu_percent < 70:
-                color = (255, 193, 7, 255)   # Gelb
-            else:
-                color = (244, 67, 54, 255)   # Rot
-                
-            # Balken zeichnen
-            bar_fill_width = int((cpu_percent / 100) * bar_width)
-            draw.rectangle(
-                [10, bar_y, 10 + bar_fill_width, bar_y + bar_height],
-                fill=color
-            )
-            
-        # Text (CPU %)
-        try:
-            # Einfache Schriftart verwenden
-            font_size = max(8, size // 8)
-            font = ImageFont.load_default()
-            
-            text = f"{int(cpu_percent)}%"
-            text_bbox = draw.textbbox((0, 0), text, font=font)
-            text_width = text_bbox[2] - text_bbox[0]
-            text_height = text_bbox[3] - text_bbox[1]
-            
-            text_x = center - text_width // 2
-            text_y = center - 15
-            
-            # Text-Hintergrund
-            draw.rectangle(
-                [text_x - 2, text_y - 2, text_x + text_width + 2, text_y + text_height + 2],
-                fill=(0, 0, 0, 150)
-            )
-            
-            # Text zeichnen
-            draw.text((text_x, text_y), text, fill=(242, 236, 250, 255), font=font)
-            
-        except Exception as e:
-            print(f"Fehler beim Zeichnen des Texts: {e}")
-            
-        return image
+        if self.icon:
+            # Öffentliche pystray-API: löst das Neuzeichnen im Tray aus
+            self.icon.icon = self.create_dynamic_icon(percent)
+            self.icon_updates += 1
+        return True
         
-
-            
     def create_context_menu(self):
         """Context-Menü erstellen"""
         menu_items = [
@@ -177,38 +112,33 @@ class SystemTrayIcon(QObject):
         
         return pystray.Menu(*menu_items)
         
-    def start_icon_updates(self):
-        """Icon-Updates starten"""
-        if not self.update_active:
-            self.update_active = True
-            self.update_thread = threading.Thread(target=self._update_icon_loop, daemon=True)
-            self.update_thread.start()
-            
-    def stop_icon_updates(self):
-        """Icon-Updates stoppen"""
-        self.update_active = False
-        if self.update_thread:
-            self.update_thread.join(timeout=5)
-            
-    def _update_icon_loop(self):
-        """Icon-Update-Schleife"""
-        while self.update_active:
-            try:
-                # CPU-Auslastung abrufen
-                cpu_percent = psutil.cpu_percent(interval=0.1)
-                
-                # Neues Icon erstellen
-                new_icon = self.create_dynamic_icon(cpu_percent)
-                
-                # Icon aktualisieren (falls möglich)
-                if self.icon and hasattr(self.icon, '_icon'):
-                    self.icon._icon = new_icon
-                    
-            except Exception as e:
-                print(f"Fehler im Icon-Update-Loop: {e}")
-                
-            time.sleep(self.update_interval / 1000)  # Millisekunden zu Sekunden
-            
+    def on_snapshot(self, snapshot):
+        """Icon und Tooltip aus dem Snapshot der App aktualisieren"""
+        if not self.tray_active or "error" in snapshot:
+            return
+        try:
+            self.update_icon(snapshot["cpu_percent"])
+            self.update_tooltip(snapshot)
+        except Exception as e:
+            print(f"Fehler beim Tray-Update: {e}")
+            
+    def update_tooltip(self, snapshot) -> bool:
+        """Tooltip nur bei geänderten (gerundeten) Werten setzen"""
+        tooltip = (
+            f"SystemMonitorX\n"
+            f"CPU: {snapshot['cpu_percent']:.0f}% | "
+            f"RAM: {snapshot['ram_percent']:.0f}% | "
+            f"Disk: {snapshot['disk_percent']:.0f}%"
+        )
+        if tooltip == self.displayed_tooltip:
+            return False
+        self.displayed_tooltip = tooltip
+        
+        if self.icon:
+            self.icon.title = tooltip
+            self.tooltip_updates += 1
+        return True
+        
     def on_show_main_window(self, icon, item):
         """Hauptfenster anzeigen"""
         self.show_main_window.emit()
@@ -234,7 +164,6 @@ class SystemTrayIcon(QObject):
         if self.icon:
             self.icon.stop()
             self.tray_active = False
-            self.stop_icon_updates()
             
     def update_tray_config(self):
         """Tray-Konfiguration aktualisieren"""
@@ -245,8 +174,5 @@ class SystemTrayIcon(QObject):
         return self.tray_active
         
     def get_cpu_usage(self) -> float:
-        """Aktuelle CPU-Auslastung abrufen"""
-        try:
-            return psutil.cpu_percent(interval=0.1)
-        except:
-            return 0.0 
\ No newline at end of file
+        """Zuletzt im Tray angezeigte CPU-Auslastung"""
+        return float(self.displayed_percent or 0) 
\ No newline at end of file
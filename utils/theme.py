@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Theme-Service
+App-weite Palette und Stylesheet, einmal gebaut und auf QApplication gesetzt
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import time
+from string import Template
+from typing import Dict, Any, Tuple
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QPalette, QColor
+
+# Standard-Farben (Dark Mode), falls keine Konfiguration vorhanden ist
+DEFAULT_THEME_COLORS = {
+    'background': '#141414',
+    'accent': '#4a307d',
+    'text': '#f2ecfa',
+    'text_secondary': '#a0a0a0',
+    'card_background': '#1e1e1e',
+    'progress_background': '#2a2a2a'
+}
+
+# Ein Stylesheet für alle Fenster; Desktop-Widgets über die Property "desktopWidget"
+APP_STYLESHEET = Template("""
+    QMainWindow {
+        background-color: $background;
+        border-radius: 10px;
+    }
+
+    QFrame {
+        background-color: $card_background;
+        border-radius: 8px;
+        border: 1px solid $progress_background;
+    }
+
+    QLabel {
+        color: $text;
+        font-family: 'Consolas', monospace;
+        font-size: 12px;
+    }
+
+    QPushButton {
+        background-color: $accent;
+        color: $text;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-family: 'Consolas', monospace;
+        font-size: 12px;
+        font-weight: bold;
+    }
+
+    QPushButton:hover {
+        background-color: $accent_hover;
+    }
+
+    QPushButton:pressed {
+        background-color: $accent_pressed;
+    }
+
+    QProgressBar {
+        border: 2px solid $progress_background;
+        border-radius: 6px;
+        text-align: center;
+        background-color: $progress_background;
+        color: $text;
+        font-family: 'Consolas', monospace;
+        font-size: 11px;
+    }
+
+    QProgressBar::chunk {
+        background-color: $accent;
+        border-radius: 4px;
+    }
+
+    QTabWidget::pane {
+        border: 1px solid $progress_background;
+        background-color: $card_background;
+        border-radius: 8px;
+    }
+
+    QTabBar::tab {
+        background-color: $progress_background;
+        color: $text;
+        padding: 8px 16px;
+        margin-right: 2px;
+        border-top-left-radius: 6px;
+        border-top-right-radius: 6px;
+        font-family: 'Consolas', monospace;
+        font-size: 11px;
+    }
+
+    QTabBar::tab:selected {
+        background-color: $accent;
+    }
+
+    QTabBar::tab:hover {
+        background-color: $accent_pressed;
+    }
+
+    QSpinBox, QLineEdit {
+        background-color: $progress_background;
+        color: $text;
+        border: 1px solid $accent;
+        border-radius: 4px;
+        padding: 4px 8px;
+        font-family: 'Consolas', monospace;
+        font-size: 11px;
+    }
+
+    QCheckBox {
+        color: $text;
+        font-family: 'Consolas', monospace;
+        font-size: 11px;
+    }
+
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border: 2px solid $accent;
+        border-radius: 3px;
+        background-color: $progress_background;
+    }
+
+    QCheckBox::indicator:checked {
+        background-color: $accent;
+    }
+
+    QGroupBox {
+        color: $text;
+        font-family: 'Consolas', monospace;
+        font-size: 12px;
+        font-weight: bold;
+        border: 1px solid $accent;
+        border-radius: 6px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+
+    QWidget[desktopWidget="true"], QWidget[desktopWidget="true"] QWidget {
+        background-color: $widget_background;
+        border-radius: 10px;
+        border: 1px solid $widget_border;
+    }
+
+    QWidget[desktopWidget="true"] QPushButton {
+        padding: 0px;
+    }
+
+    QWidget[desktopWidget="true"] QLabel {
+        color: $text;
+        font-family: 'Consolas', monospace;
+        font-size: 11px;
+    }
+
+    QWidget[desktopWidget="true"] QProgressBar {
+        border: 1px solid $progress_background;
+        border-radius: 4px;
+        text-align: center;
+        background-color: $widget_progress_background;
+        color: $text;
+        font-family: 'Consolas', monospace;
+        font-size: 10px;
+    }
+
+    QWidget[desktopWidget="true"] QProgressBar::chunk {
+        background-color: $accent;
+        border-radius: 3px;
+    }
+""")
+
+
+def shift_color(color: str, delta: int) -> str:
+    """Farbe pro RGB-Kanal aufhellen (+) oder abdunkeln (-)"""
+    qcolor = QColor(color)
+    channels = [max(0, min(255, c + delta)) for c in (qcolor.red(), qcolor.green(), qcolor.blue())]
+    return "#{:02x}{:02x}{:02x}".format(*channels)
+
+
+def rgba(color: str, alpha: int) -> Tuple[int, int, int, int]:
+    """Hex-Farbe als RGBA-Tupel mit eigener Transparenz"""
+    qcolor = QColor(color)
+    return (qcolor.red(), qcolor.green(), qcolor.blue(), alpha)
+
+
+def rgba_css(color: str, alpha: int) -> str:
+    """Hex-Farbe als CSS rgba()"""
+    return "rgba({}, {}, {}, {})".format(*rgba(color, alpha))
+
+
+class ThemeService:
+    """
+    Theme-Service für SystemMonitorX
+    - Baut Palette und Stylesheet einmal aus ConfigManager.get_theme_colors()
+    - Setzt beides auf QApplication statt pro Fenster
+    - Theme-Wechsel: ein einziges Repolish über die ganze App
+    - Liefert die Hintergrund-Farben der Desktop-Widgets (paintEvent)
+    """
+
+    def __init__(self, config_manager=None):
+        self.config_manager = config_manager
+        self.colors = None
+        self.palette = None
+        self.stylesheet = None
+        self.apply_count = 0
+        self.last_apply_ms = 0.0
+
+    def load_colors(self) -> Dict[str, str]:
+        """Theme-Farben aus der Konfiguration (mit Standard-Werten)"""
+        colors = dict(DEFAULT_THEME_COLORS)
+        if self.config_manager:
+            colors.update(self.config_manager.get_theme_colors())
+        return colors
+
+    def build_palette(self, colors: Dict[str, str]) -> QPalette:
+        """QPalette für Dark Mode bauen"""
+        palette = QPalette()
+        palette.setColor(QPalette.ColorRole.Window, QColor(colors['background']))
+        palette.setColor(QPalette.ColorRole.WindowText, QColor(colors['text']))
+        palette.setColor(QPalette.ColorRole.Base, QColor(colors['card_background']))
+        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(colors['accent']))
+        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(colors['background']))
+        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(colors['text']))
+        palette.setColor(QPalette.ColorRole.Text, QColor(colors['text']))
+        palette.setColor(QPalette.ColorRole.Button, QColor(colors['accent']))
+        palette.setColor(QPalette.ColorRole.ButtonText, QColor(colors['text']))
+        palette.setColor(QPalette.ColorRole.Link, QColor(colors['accent']))
+        palette.setColor(QPalette.ColorRole.Highlight, QColor(colors['accent']))
+        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(colors['text']))
+        return palette
+
+    def build_stylesheet(self, colors: Dict[str, str]) -> str:
+        """App-Stylesheet aus den Theme-Farben erzeugen"""
+        return APP_STYLESHEET.substitute(
+            colors,
+            accent_hover=shift_color(colors['accent'], 16),
+            accent_pressed=shift_color(colors['accent'], -16),
+            widget_background=rgba_css(colors['card_background'], 200),
+            widget_border=rgba_css(colors['accent'], 100),
+            widget_progress_background=rgba_css(colors['progress_background'], 150)
+        )
+
+    def apply(self, force: bool = False) -> bool:
+        """Palette und Stylesheet auf die App setzen (nur bei Änderung)"""
+        colors = self.load_colors()
+        if colors == self.colors and not force:
+            return False
+
+        app = QApplication.instance()
+        if app is None:
+            return False
+
+        started = time.perf_counter()
+        self.colors = colors
+        self.palette = self.build_palette(colors)
+        self.stylesheet = self.build_stylesheet(colors)
+        app.setPalette(self.palette)
+        app.setStyleSheet(self.stylesheet)
+        self.last_apply_ms = (time.perf_counter() - started) * 1000
+        self.apply_count += 1
+        return True
+
+    def get_widget_background(self, hovered: bool) -> Dict[str, Tuple[int, int, int, int]]:
+        """Füll- und Rahmenfarbe der Desktop-Widgets (normal / Hover)"""
+        colors = self.colors or self.load_colors()
+        return {
+            'fill': rgba(colors['card_background'], 220 if hovered else 200),
+            'border': rgba(colors['accent'], 150 if hovered else 100)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Anzahl und Dauer der App-weiten Theme-Anwendungen"""
+        return {"applied": self.apply_count, "last_apply_ms": self.last_apply_ms}
+
+
+# Gemeinsame Instanz für alle Fenster und Widgets
+_theme_service = None
+
+
+def get_theme_service(config_manager=None) -> ThemeService:
+    """Gemeinsamen Theme-Service holen und beim ersten Aufruf anwenden"""
+    global _theme_service
+    if _theme_service is None:
+        _theme_service = ThemeService(config_manager)
+        _theme_service.apply()
+    elif _theme_service.config_manager is None and config_manager is not None:
+        _theme_service.config_manager = config_manager
+        _theme_service.apply()
+    return _theme_service
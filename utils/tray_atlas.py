@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Tray-Icon-Atlas
+Vorgerenderte Tray-Icons für alle 101 Prozent-Zustände
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import os
+import threading
+from typing import Dict, Any, Optional, Tuple
+from PIL import Image, ImageDraw, ImageFont
+
+# Farbbänder: (Obergrenze exklusiv, Farbe)
+COLOR_BANDS = [
+    (30, (76, 175, 80, 255)),    # Grün
+    (70, (255, 193, 7, 255)),    # Gelb
+    (101, (244, 67, 54, 255))    # Rot
+]
+
+BASE_ICON_PATH = "assets/tray/tray-icon.png"
+
+
+def band_color(percent: int) -> Tuple[int, int, int, int]:
+    """Farbe des Bands für einen Prozentwert"""
+    for upper, color in COLOR_BANDS:
+        if percent < upper:
+            return color
+    return COLOR_BANDS[-1][1]
+
+
+class TrayIconAtlas:
+    """
+    Icon-Atlas für das System-Tray
+    - Hintergrund, Basis-Icon und Schrift werden nur einmal geladen
+    - Jeder der 101 Prozent-Zustände wird höchstens einmal gerendert
+    - Danach ist ein Update nur noch ein Listen-Zugriff
+    """
+
+    def __init__(self, size: int = 64, base_icon_path: str = BASE_ICON_PATH):
+        self.size = size
+        self.base_icon_path = base_icon_path
+
+        # Gerenderte Icons pro ganzzahligem Prozentwert
+        self.icons = [None] * 101
+        self.rendered_count = 0
+        self.lookup_count = 0
+        self.lock = threading.Lock()
+
+        self.base_layer = None
+        self.font = None
+
+    def get(self, percent: float) -> Image.Image:
+        """Icon für einen Prozentwert (bei Bedarf einmalig rendern)"""
+        index = max(0, min(100, int(percent)))
+        with self.lock:
+            self.lookup_count += 1
+            icon = self.icons[index]
+            if icon is None:
+                icon = self.render(index)
+                self.icons[index] = icon
+                self.rendered_count += 1
+        return icon
+
+    def build_all(self):
+        """Alle 101 Zustände vorab rendern"""
+        for percent in range(101):
+            self.get(percent)
+
+    def _get_base_layer(self) -> Image.Image:
+        """Hintergrund mit Basis-Icon (einmalig)"""
+        if self.base_layer is None:
+            size = self.size
+            image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(image)
+
+            # Hintergrund (abgerundetes Rechteck)
+            draw.rounded_rectangle([(2, 2), (size-2, size-2)], radius=8, fill=(20, 20, 20, 200))
+
+            # Basis-Tray-Icon laden (falls vorhanden)
+            try:
+                if os.path.exists(self.base_icon_path):
+                    with Image.open(self.base_icon_path) as base_icon:
+                        base_icon = base_icon.convert('RGBA').resize(
+                            (size-10, size-10), Image.Resampling.LANCZOS
+                        )
+                    image.paste(base_icon, (5, 5), base_icon)
+            except Exception as e:
+                print(f"Fehler beim Laden des Basis-Tray-Icons: {e}")
+
+            self.base_layer = image
+            self.font = ImageFont.load_default()
+        return self.base_layer
+
+    def render(self, percent: int) -> Image.Image:
+        """Ein Icon für einen ganzzahligen Prozentwert rendern"""
+        size = self.size
+        image = self._get_base_layer().copy()
+        draw = ImageDraw.Draw(image)
+
+        # CPU-Auslastung als einfacher Balken
+        center = size // 2
+        bar_width = size - 20
+        bar_height = 8
+        bar_y = center + 10
+
+        # Hintergrund-Balken
+        draw.rectangle(
+            [10, bar_y, 10 + bar_width, bar_y + bar_height],
+            fill=(40, 40, 40, 100)
+        )
+
+        # Auslastungs-Balken in der Farbe des Bands
+        if percent > 0:
+            bar_fill_width = int((percent / 100) * bar_width)
+            draw.rectangle(
+                [10, bar_y, 10 + bar_fill_width, bar_y + bar_height],
+                fill=band_color(percent)
+            )
+
+        # Text (CPU %)
+        try:
+            text = f"{percent}%"
+            text_bbox = draw.textbbox((0, 0), text, font=self.font)
+            text_width = text_bbox[2] - text_bbox[0]
+            text_height = text_bbox[3] - text_bbox[1]
+
+            text_x = center - text_width // 2
+            text_y = center - 15
+
+            # Text-Hintergrund
+            draw.rectangle(
+                [text_x - 2, text_y - 2, text_x + text_width + 2, text_y + text_height + 2],
+                fill=(0, 0, 0, 150)
+            )
+
+            # Text zeichnen
+            draw.text((text_x, text_y), text, fill=(242, 236, 250, 255), font=self.font)
+
+        except Exception as e:
+            print(f"Fehler beim Zeichnen des Texts: {e}")
+
+        return image
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Gerenderte Zustände und Zugriffe"""
+        return {"rendered": self.rendered_count, "lookups": self.lookup_count}
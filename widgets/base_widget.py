@@ -19,10 +19,9 @@ from PyQt6.QtCore import (
 )
 from PyQt6.QtGui import (
     QPalette, QColor, QFont, QPainter, QBrush,
-    QPen, QLinearGradient, QMouseEvent
+    QPen, QLinearGradient, QMouseEvent, QPixmap
 )
 import psutil
-import json
 import os
 
 # Theme-Farben (Dark Mode)
@@ -49,11 +48,28 @@ class BaseWidget(QWidget):
     # Signal für Widget-Schließung
     widget_closed = pyqtSignal(str)
     
-    def __init__(self, widget_type, title, icon_path):
+    # Gerenderte Hintergründe, geteilt von allen Widgets
+    _background_cache = {}
+    
+    # Snapshot-Wert für die Sparkline (None = keine Sparkline)
+    sparkline_key = None
+    
+    def __init__(self, widget_type, title, icon_path, coordinator=None, config_manager=None):
         super().__init__()
         self.widget_type = widget_type
         self.title = title
         self.icon_path = icon_path
+        self.coordinator = coordinator
+        
+        # Positionen über den (bereits geladenen) ConfigManager
+        if config_manager is None:
+            from utils.config import ConfigManager
+            config_manager = ConfigManager()
+        self.config_manager = config_manager
+        
+        # Dirty-Check für Label-/Bar-Updates
+        from utils.bindings import ui_binder
+        self.binder = ui_binder
         
         # Widget-Eigenschaften
         self.setFixedSize(320, 110)
@@ -64,6 +80,12 @@ class BaseWidget(QWidget):
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
         
+        # Hover-Zustand (wird in paintEvent ausgewertet)
+        self.hovered = False
+        
+        # Wurde das Widget bereits freigegeben?
+        self.released = False
+        
         # Drag & Drop Variablen
         self.dragging = False
         self.drag_position = QPoint()
@@ -147,52 +169,61 @@ class BaseWidget(QWidget):
         self.content_layout = QVBoxLayout(self.content_widget)
         main_layout.addWidget(self.content_widget)
         
+        # Sparkline mit dem Verlauf der letzten Werte
+        self.sparkline = None
+        if self.sparkline_key:
+            from widgets.sparkline import SparklineWidget, SPARKLINE_HEIGHT
+            self.sparkline = SparklineWidget()
+            main_layout.addWidget(self.sparkline)
+            self.setFixedSize(320, 110 + SPARKLINE_HEIGHT + main_layout.spacing())
+        
     def setup_styling(self):
-        """Styling für abgerundete Ecken und Transparenz"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: rgba(30, 30, 30, 200);
-                border-radius: 10px;
-                border: 1px solid rgba(74, 48, 125, 100);
-            }
-            
-            QLabel {
-                color: #f2ecfa;
-                font-family: 'Consolas', monospace;
-                font-size: 11px;
-            }
-            
-            QProgressBar {
-                border: 1px solid #2a2a2a;
-                border-radius: 4px;
-                text-align: center;
-                background-color: rgba(42, 42, 42, 150);
-                color: #f2ecfa;
-                font-family: 'Consolas', monospace;
-                font-size: 10px;
-            }
-            
-            QProgressBar::chunk {
-                background-color: #4a307d;
-                border-radius: 3px;
-            }
-        """)
+        """Styling über das App-Theme (Regeln für die Property "desktopWidget")"""
+        from utils.theme import get_theme_service
+        self.theme = get_theme_service(self.config_manager)
+        self.setProperty("desktopWidget", True)
         
     def setup_monitoring(self):
-        """Monitoring-Timer für Updates"""
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_data)
-        self.update_timer.start(1000)  # Jede Sekunde
+        """Beim gemeinsamen Refresh-Koordinator anmelden"""
+        self.owns_coordinator = self.coordinator is None
+        if self.owns_coordinator:
+            # Ohne App-Koordinator: eigener Takt für dieses Widget
+            from utils.refresh import RefreshCoordinator
+            self.coordinator = RefreshCoordinator()
+            self.coordinator.start()
+            
+        self.coordinator.register(self, self.on_snapshot)
+        
+    def on_snapshot(self, snapshot):
+        """Snapshot anzeigen und Sparkline fortschreiben"""
+        self.update_data(snapshot)
+        if self.sparkline is not None and snapshot.get(self.sparkline_key) is not None:
+            self.sparkline.add_value(snapshot[self.sparkline_key])
         
-    def update_data(self):
-        """Daten aktualisieren (wird von Unterklassen überschrieben)"""
+    def update_data(self, snapshot):
+        """Daten aus dem Snapshot anzeigen (wird von Unterklassen überschrieben)"""
         pass
         
     def close_widget(self):
         """Widget schließen"""
+        self.close()
+        
+    def release(self):
+        """Position sichern, vom Takt abmelden und eigenen Timer stoppen"""
+        if self.released:
+            return
+        self.released = True
+        
         self.save_position()
+        self.coordinator.unregister(self)
+        if self.owns_coordinator:
+            self.coordinator.stop()
         self.widget_closed.emit(self.widget_type)
-        self.close()
+        
+    def closeEvent(self, event):
+        """Ressourcen auch beim Schließen über das Fenstersystem freigeben"""
+        self.release()
+        super().closeEvent(event)
         
     def mousePressEvent(self, event: QMouseEvent):
         """Maus-Druck für Drag & Drop"""
@@ -215,45 +246,17 @@ class BaseWidget(QWidget):
             event.accept()
             
     def save_position(self):
-        """Widget-Position speichern"""
+        """Widget-Position an den ConfigManager übergeben (gebündelt gespeichert)"""
         try:
-            config_file = "config/widgets.json"
-            os.makedirs("config", exist_ok=True)
-            
-            # Bestehende Konfiguration laden
-            if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-            else:
-                config = {"widgets": {}}
-            
-            # Position speichern
-            config["widgets"][self.widget_type] = {
-                "x": self.x(),
-                "y": self.y(),
-                "visible": True
-            }
-            
-            # Konfiguration speichern
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
-                
+            self.config_manager.set_widget_position(self.widget_type, self.x(), self.y())
         except Exception as e:
             print(f"Fehler beim Speichern der Widget-Position: {e}")
             
     def load_position(self):
-        """Widget-Position laden"""
+        """Widget-Position aus der geladenen Konfiguration übernehmen"""
         try:
-            config_file = "config/widgets.json"
-            if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                
-                if self.widget_type in config.get("widgets", {}):
-                    widget_config = config["widgets"][self.widget_type]
-                    x = widget_config.get("x", 100)
-                    y = widget_config.get("y", 100)
-                    self.move(x, y)
+            position = self.config_manager.get_widget_position(self.widget_type)
+            self.move(position.get("x", 100), position.get("y", 100))
                     
         except Exception as e:
             print(f"Fehler beim Laden der Widget-Position: {e}")
@@ -261,32 +264,43 @@ class BaseWidget(QWidget):
             self.move(100, 100)
             
     def paintEvent(self, event):
-        """Custom Paint Event für Glasmorphismus-Effekt"""
+        """Custom Paint Event für Glasmorphismus-Effekt (gecachter Hintergrund)"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.drawPixmap(0, 0, self.get_background_pixmap())
         
-        # Abgerundetes Rechteck mit Transparenz
-        rect = self.rect()
-        painter.setPen(QPen(QColor(74, 48, 125, 100), 1))
-        painter.setBrush(QBrush(QColor(30, 30, 30, 200)))
-        painter.drawRoundedRect(rect, 10, 10)
+    def get_background_pixmap(self) -> QPixmap:
+        """Hintergrund pro Größe, Hover-Zustand und Theme nur einmal rendern"""
+        ratio = self.devicePixelRatioF()
+        style = self.theme.get_widget_background(self.hovered)
+        key = (self.width(), self.height(), ratio, self.hovered, style['fill'], style['border'])
+        
+        pixmap = BaseWidget._background_cache.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            
+            # Abgerundetes Rechteck mit Transparenz
+            painter.setPen(QPen(QColor(*style['border']), 1))
+            painter.setBrush(QBrush(QColor(*style['fill'])))
+            painter.drawRoundedRect(self.rect(), 10, 10)
+            painter.end()
+            
+            BaseWidget._background_cache[key] = pixmap
+            
+        return pixmap
         
     def enterEvent(self, event):
-        """Hover-Effekt beim Betreten"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: rgba(30, 30, 30, 220);
-                border-radius: 10px;
-                border: 1px solid rgba(74, 48, 125, 150);
-            }
-        """)
+        """Hover-Effekt beim Betreten (nur Neuzeichnen, kein Stylesheet)"""
+        self.hovered = True
+        self.update()
+        super().enterEvent(event)
         
     def leaveEvent(self, event):
         """Hover-Effekt beim Verlassen"""
-        self.setStyleSheet("""
-            QWidget {
-                background-color: rgba(30, 30, 30, 200);
-                border-radius: 10px;
-                border: 1px solid rgba(74, 48, 125, 100);
-            }
-        """) 
\ No newline at end of file
+        self.hovered = False
+        self.update()
+        super().leaveEvent(event)
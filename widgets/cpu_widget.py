@@ -10,7 +10,6 @@ Version: 1.0.0
 
 from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
 from PyQt6.QtCore import Qt
-import psutil
 from .base_widget import BaseWidget
 
 class CPUWidget(BaseWidget):
@@ -20,13 +19,19 @@ class CPUWidget(BaseWidget):
     - Anzahl der Kerne
     - Frequenz (GHz)
     - Progress-Bar
+    - Sparkline mit dem Verlauf
     """
     
-    def __init__(self):
+    # Verlauf der Auslastung als Sparkline
+    sparkline_key = "cpu_percent"
+    
+    def __init__(self, coordinator=None, config_manager=None):
         super().__init__(
             widget_type="cpu",
             title="CPU",
-            icon_path="assets/widgets/cpu_widget.png"
+            icon_path="assets/widgets/cpu_widget.png",
+            coordinator=coordinator,
+            config_manager=config_manager
         )
         
         # Widget-spezifische UI
@@ -60,27 +65,24 @@ class CPUWidget(BaseWidget):
         self.content_layout.addWidget(self.cpu_progress)
         self.content_layout.addLayout(details_layout)
         
-    def update_data(self):
-        """CPU-Daten aktualisieren"""
+    def update_data(self, snapshot):
+        """CPU-Daten aus dem Snapshot anzeigen"""
         try:
             # CPU-Auslastung
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            self.cpu_progress.setValue(int(cpu_percent))
+            self.binder.set_value(self.cpu_progress, snapshot["cpu_percent"])
             
             # CPU-Kerne
-            cpu_count = psutil.cpu_count()
-            self.cores_label.setText(f"Kerne: {cpu_count}")
+            self.binder.set_text(self.cores_label, f"Kerne: {snapshot['cpu_count']}")
             
             # CPU-Frequenz
-            cpu_freq = psutil.cpu_freq()
-            if cpu_freq:
-                freq_ghz = cpu_freq.current / 1000  # MHz zu GHz
-                self.freq_label.setText(f"Freq: {freq_ghz:.1f} GHz")
+            freq_ghz = snapshot["cpu_freq_ghz"]
+            if freq_ghz is not None:
+                self.binder.set_text(self.freq_label, f"Freq: {freq_ghz:.1f} GHz")
             else:
-                self.freq_label.setText("Freq: N/A")
+                self.binder.set_text(self.freq_label, "Freq: N/A")
                 
         except Exception as e:
             print(f"Fehler beim CPU-Widget Update: {e}")
-            self.cpu_progress.setValue(0)
-            self.cores_label.setText("Kerne: N/A")
-            self.freq_label.setText("Freq: N/A") 
\ No newline at end of file
+            self.binder.set_value(self.cpu_progress, 0)
+            self.binder.set_text(self.cores_label, "Kerne: N/A")
+            self.binder.set_text(self.freq_label, "Freq: N/A")
\ No newline at end of file
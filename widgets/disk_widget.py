@@ -10,7 +10,6 @@ Version: 1.0.0
 
 from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
 from PyQt6.QtCore import Qt
-import psutil
 from .base_widget import BaseWidget
 
 class DiskWidget(BaseWidget):
@@ -20,13 +19,19 @@ class DiskWidget(BaseWidget):
     - Verwendeter Speicher in GB
     - Gesamter Speicher in GB
     - Progress-Bar
+    - Sparkline mit dem Verlauf
     """
     
-    def __init__(self):
+    # Verlauf der Auslastung als Sparkline
+    sparkline_key = "disk_percent"
+    
+    def __init__(self, coordinator=None, config_manager=None):
         super().__init__(
             widget_type="disk",
             title="Festplatte",
-            icon_path="assets/widgets/disk_widget.png"
+            icon_path="assets/widgets/disk_widget.png",
+            coordinator=coordinator,
+            config_manager=config_manager
         )
         
         # Widget-spezifische UI
@@ -60,24 +65,18 @@ class DiskWidget(BaseWidget):
         self.content_layout.addWidget(self.disk_progress)
         self.content_layout.addLayout(details_layout)
         
-    def update_data(self):
-        """Disk-Daten aktualisieren"""
+    def update_data(self, snapshot):
+        """Disk-Daten aus dem Snapshot anzeigen"""
         try:
-            # Disk-Daten (Hauptfestplatte)
-            disk = psutil.disk_usage('/')
-            disk_percent = (disk.used / disk.total) * 100
-            disk_used_gb = disk.used / (1024**3)
-            disk_total_gb = disk.total / (1024**3)
-            
             # Progress Bar aktualisieren
-            self.disk_progress.setValue(int(disk_percent))
+            self.binder.set_value(self.disk_progress, snapshot["disk_percent"])
             
             # Labels aktualisieren
-            self.used_label.setText(f"Verwendet: {disk_used_gb:.1f} GB")
-            self.total_label.setText(f"Gesamt: {disk_total_gb:.1f} GB")
+            self.binder.set_text(self.used_label, f"Verwendet: {snapshot['disk_used_gb']:.1f} GB")
+            self.binder.set_text(self.total_label, f"Gesamt: {snapshot['disk_total_gb']:.1f} GB")
             
         except Exception as e:
             print(f"Fehler beim Disk-Widget Update: {e}")
-            self.disk_progress.setValue(0)
-            self.used_label.setText("Verwendet: N/A")
-            self.total_label.setText("Gesamt: N/A") 
\ No newline at end of file
+            self.binder.set_value(self.disk_progress, 0)
+            self.binder.set_text(self.used_label, "Verwendet: N/A")
+            self.binder.set_text(self.total_label, "Gesamt: N/A")
\ No newline at end of file
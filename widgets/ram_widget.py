@@ -10,7 +10,6 @@ Version: 1.0.0
 
 from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QProgressBar
 from PyQt6.QtCore import Qt
-import psutil
 from .base_widget import BaseWidget
 
 class RAMWidget(BaseWidget):
@@ -20,13 +19,19 @@ class RAMWidget(BaseWidget):
     - Verwendeter RAM in GB
     - Gesamter RAM in GB
     - Progress-Bar
+    - Sparkline mit dem Verlauf
     """
     
-    def __init__(self):
+    # Verlauf der Auslastung als Sparkline
+    sparkline_key = "ram_percent"
+    
+    def __init__(self, coordinator=None, config_manager=None):
         super().__init__(
             widget_type="ram",
             title="RAM",
-            icon_path="assets/widgets/ram_widget.png"
+            icon_path="assets/widgets/ram_widget.png",
+            coordinator=coordinator,
+            config_manager=config_manager
         )
         
         # Widget-spezifische UI
@@ -60,24 +65,18 @@ class RAMWidget(BaseWidget):
         self.content_layout.addWidget(self.ram_progress)
         self.content_layout.addLayout(details_layout)
         
-    def update_data(self):
-        """RAM-Daten aktualisieren"""
+    def update_data(self, snapshot):
+        """RAM-Daten aus dem Snapshot anzeigen"""
         try:
-            # RAM-Daten
-            memory = psutil.virtual_memory()
-            ram_percent = memory.percent
-            ram_used_gb = memory.used / (1024**3)
-            ram_total_gb = memory.total / (1024**3)
-            
             # Progress Bar aktualisieren
-            self.ram_progress.setValue(int(ram_percent))
+            self.binder.set_value(self.ram_progress, snapshot["ram_percent"])
             
             # Labels aktualisieren
-            self.used_label.setText(f"Verwendet: {ram_used_gb:.1f} GB")
-            self.total_label.setText(f"Gesamt: {ram_total_gb:.1f} GB")
+            self.binder.set_text(self.used_label, f"Verwendet: {snapshot['ram_used_gb']:.1f} GB")
+            self.binder.set_text(self.total_label, f"Gesamt: {snapshot['ram_total_gb']:.1f} GB")
             
         except Exception as e:
             print(f"Fehler beim RAM-Widget Update: {e}")
-            self.ram_progress.setValue(0)
-            self.used_label.setText("Verwendet: N/A")
-            self.total_label.setText("Gesamt: N/A") 
\ No newline at end of file
+            self.binder.set_value(self.ram_progress, 0)
+            self.binder.set_text(self.used_label, "Verwendet: N/A")
+            self.binder.set_text(self.total_label, "Gesamt: N/A")
\ No newline at end of file
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Widget-Registry
+Verwaltung der Desktop-Widgets: einmal erstellen, wiederverwenden, sauber freigeben
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+import importlib
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import Qt
+from PyQt6 import sip
+
+# Widget-Typ -> (Modul, Klasse); Import erst bei der ersten Erstellung
+WIDGET_CLASSES = {
+    "cpu": ("widgets.cpu_widget", "CPUWidget"),
+    "ram": ("widgets.ram_widget", "RAMWidget"),
+    "disk": ("widgets.disk_widget", "DiskWidget"),
+    "system": ("widgets.system_widget", "SystemWidget")
+}
+
+
+class WidgetRegistry:
+    """
+    Widget-Registry für SystemMonitorX
+    - Erstellt jeden Widget-Typ erst bei Bedarf und nur einmal
+    - Zeigt bzw. hebt bestehende Instanzen beim erneuten Öffnen
+    - Meldet geschlossene Widgets beim Refresh-Koordinator ab und gibt sie frei
+    """
+
+    def __init__(self, coordinator=None, config_manager=None, on_closed=None):
+        self.coordinator = coordinator
+        self.config_manager = config_manager
+        self.on_closed = on_closed
+
+        # Offene Widgets pro Typ
+        self.widgets = {}
+
+        # Statistik
+        self.created_count = 0
+        self.reused_count = 0
+        self.released_count = 0
+
+    def get(self, widget_type: str):
+        """Offenes Widget eines Typs (oder None)"""
+        widget = self.widgets.get(widget_type)
+        if widget is not None and sip.isdeleted(widget):
+            del self.widgets[widget_type]
+            return None
+        return widget
+
+    def get_or_create(self, widget_type: str):
+        """Widget wiederverwenden oder bei Bedarf erstellen"""
+        widget = self.get(widget_type)
+        if widget is not None:
+            self.reused_count += 1
+            return widget
+
+        module_name, class_name = WIDGET_CLASSES[widget_type]
+        widget_class = getattr(importlib.import_module(module_name), class_name)
+
+        widget = widget_class(self.coordinator, self.config_manager)
+        widget.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+        widget.widget_closed.connect(self.on_widget_closed)
+
+        self.widgets[widget_type] = widget
+        self.created_count += 1
+        return widget
+
+    def show(self, widget_type: str):
+        """Widget anzeigen und in den Vordergrund holen"""
+        widget = self.get_or_create(widget_type)
+        if widget.isMinimized():
+            widget.showNormal()
+        else:
+            widget.show()
+        widget.raise_()
+        return widget
+
+    def show_all(self, widget_types: Optional[List[str]] = None):
+        """Alle (oder die angegebenen) Widgets anzeigen"""
+        for widget_type in widget_types or WIDGET_CLASSES:
+            self.show(widget_type)
+
+    def close_all(self):
+        """Alle offenen Widgets schließen und freigeben"""
+        for widget_type in list(self.widgets):
+            widget = self.get(widget_type)
+            if widget is not None:
+                widget.close_widget()
+
+    def on_widget_closed(self, widget_type: str):
+        """Geschlossenes Widget aus der Registry entfernen"""
+        if self.widgets.pop(widget_type, None) is not None:
+            self.released_count += 1
+        if self.on_closed:
+            self.on_closed(widget_type)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Anzahl offener, erstellter, wiederverwendeter und freigegebener Widgets"""
+        return {
+            "open": len(self.widgets),
+            "created": self.created_count,
+            "reused": self.reused_count,
+            "released": self.released_count
+        }
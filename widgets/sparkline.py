@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Sparkline
+Kleiner Verlaufsgraph für Desktop-Widgets mit scrollendem Pixmap-Cache
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+from collections import deque
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPointF, QRectF
+from PyQt6.QtGui import QPainter, QPixmap, QColor, QPen
+
+# Darstellung
+SPARKLINE_HEIGHT = 20
+COLUMN_WIDTH = 2
+LINE_COLOR = QColor(154, 120, 220)
+FILL_COLOR = QColor(74, 48, 125, 140)
+
+
+class SparklineWidget(QWidget):
+    """
+    Sparkline für Desktop-Widgets
+    - Hält die letzten N Werte (0-100 %)
+    - Zeichnet in ein gecachtes Pixmap, das pro Wert um eine Spalte scrollt
+    - Pro neuem Wert wird nur die neue Spalte gezeichnet
+    - paintEvent kopiert nur das Pixmap (konstante Kosten)
+    """
+
+    def __init__(self, history_size: int = 150, parent=None):
+        super().__init__(parent)
+        self.values = deque(maxlen=history_size)
+        self.pixmap = None
+
+        self.setFixedHeight(SPARKLINE_HEIGHT)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+
+    def add_value(self, value: float):
+        """Neuen Wert anhängen und nur die neue Spalte zeichnen"""
+        value = max(0.0, min(100.0, float(value)))
+        previous = self.values[-1] if self.values else value
+        self.values.append(value)
+
+        if self.pixmap is None:
+            self.rebuild_pixmap()
+        else:
+            # Bestehenden Inhalt um eine Spalte nach links schieben
+            ratio = self.pixmap.devicePixelRatio()
+            self.pixmap.scroll(-int(COLUMN_WIDTH * ratio), 0, self.pixmap.rect())
+            self.draw_column(self.width() - COLUMN_WIDTH, previous, value)
+
+        # Anzeige ist nur noch eine Pixmap-Kopie
+        self.update()
+
+    def draw_column(self, x: float, previous: float, value: float):
+        """Eine Spalte (Fläche und Linie) an Position x zeichnen"""
+        height = self.height() - 1
+        y_previous = height - previous / 100 * height
+        y_value = height - value / 100 * height
+
+        painter = QPainter(self.pixmap)
+
+        # Alte Spalte löschen (scroll hinterlässt Reste)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(QRectF(x, 0, COLUMN_WIDTH, self.height()), Qt.GlobalColor.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+
+        # Fläche unter der Linie
+        painter.fillRect(QRectF(x, y_value, COLUMN_WIDTH, self.height() - y_value), FILL_COLOR)
+
+        # Linie vom vorherigen zum neuen Wert
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(LINE_COLOR, 1))
+        painter.drawLine(QPointF(x, y_previous), QPointF(x + COLUMN_WIDTH, y_value))
+        painter.end()
+
+    def rebuild_pixmap(self):
+        """Pixmap komplett aus dem Verlauf neu aufbauen (nur bei Größenänderung)"""
+        if self.width() <= 0 or self.height() <= 0:
+            self.pixmap = None
+            return
+
+        ratio = self.devicePixelRatioF()
+        self.pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        self.pixmap.setDevicePixelRatio(ratio)
+        self.pixmap.fill(Qt.GlobalColor.transparent)
+
+        # Nur so viele Werte, wie Spalten in die Breite passen
+        columns = self.width() // COLUMN_WIDTH
+        values = list(self.values)[-columns:]
+        previous = values[0] if values else 0.0
+        x = self.width() - len(values) * COLUMN_WIDTH
+        for value in values:
+            self.draw_column(x, previous, value)
+            previous = value
+            x += COLUMN_WIDTH
+
+    def resizeEvent(self, event):
+        """Bei Größenänderung einmalig neu aufbauen"""
+        super().resizeEvent(event)
+        self.rebuild_pixmap()
+
+    def paintEvent(self, event):
+        """Gecachtes Pixmap anzeigen"""
+        if self.pixmap is None:
+            return
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self.pixmap)
@@ -10,9 +10,6 @@ Version: 1.0.0
 
 from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel
 from PyQt6.QtCore import Qt
-import psutil
-import os
-import sys
 from .base_widget import BaseWidget
 
 class SystemWidget(BaseWidget):
@@ -24,11 +21,13 @@ class SystemWidget(BaseWidget):
     - System-Status
     """
     
-    def __init__(self):
+    def __init__(self, coordinator=None, config_manager=None):
         super().__init__(
             widget_type="system",
             title="System",
-            icon_path="assets/widgets/system_widget.png"
+            icon_path="assets/widgets/system_widget.png",
+            coordinator=coordinator,
+            config_manager=config_manager
         )
         
         # Widget-spezifische UI
@@ -68,53 +67,35 @@ class SystemWidget(BaseWidget):
         self.content_layout.addWidget(self.status_label)
         self.content_layout.addLayout(details_layout)
         
-    def update_data(self):
-        """System-Daten aktualisieren"""
+    def update_data(self, snapshot):
+        """System-Daten aus dem Snapshot anzeigen"""
         try:
-            # Betriebssystem
-            platform = sys.platform
-            if platform == "win32":
-                os_name = "Windows"
-            elif platform == "darwin":
-                os_name = "macOS"
-            elif platform.startswith("linux"):
-                os_name = "Linux"
-            else:
-                os_name = platform
-                
-            self.os_label.setText(f"OS: {os_name}")
-            
-            # Benutzername
-            try:
-                username = os.getlogin()
-                self.user_label.setText(f"Benutzer: {username}")
-            except:
-                self.user_label.setText("Benutzer: Unknown")
+            # Betriebssystem und Benutzername
+            self.binder.set_text(self.os_label, f"OS: {snapshot['os_name']}")
+            self.binder.set_text(self.user_label, f"Benutzer: {snapshot['username']}")
                 
-            # Online-Status (einfache Prüfung)
-            try:
-                # Prüfe ob Netzwerk verfügbar ist
-                network = psutil.net_if_addrs()
-                if network:
-                    self.online_label.setText("Online: Ja")
-                    self.status_label.setText("Status: Online")
-                    self.status_label.setStyleSheet("""
-                        font-size: 12px;
-                        font-weight: bold;
-                        color: #4a307d;
-                    """)
-                else:
-                    self.online_label.setText("Online: Nein")
-                    self.status_label.setText("Status: Offline")
-                    self.status_label.setStyleSheet("""
-                        font-size: 12px;
-                        font-weight: bold;
-                        color: #a0a0a0;
-                    """)
-            except:
-                self.online_label.setText("Online: Unbekannt")
-                self.status_label.setText("Status: Unbekannt")
-                self.status_label.setStyleSheet("""
+            # Online-Status (Netzwerk-Schnittstellen vorhanden)
+            online = snapshot["online"]
+            if online:
+                self.binder.set_text(self.online_label, "Online: Ja")
+                self.binder.set_text(self.status_label, "Status: Online")
+                self.binder.set_style(self.status_label, """
+                    font-size: 12px;
+                    font-weight: bold;
+                    color: #4a307d;
+                """)
+            elif online is False:
+                self.binder.set_text(self.online_label, "Online: Nein")
+                self.binder.set_text(self.status_label, "Status: Offline")
+                self.binder.set_style(self.status_label, """
+                    font-size: 12px;
+                    font-weight: bold;
+                    color: #a0a0a0;
+                """)
+            else:
+                self.binder.set_text(self.online_label, "Online: Unbekannt")
+                self.binder.set_text(self.status_label, "Status: Unbekannt")
+                self.binder.set_style(self.status_label, """
                     font-size: 12px;
                     font-weight: bold;
                     color: #a0a0a0;
@@ -122,12 +103,12 @@ class SystemWidget(BaseWidget):
                 
         except Exception as e:
             print(f"Fehler beim System-Widget Update: {e}")
-            self.os_label.setText("OS: N/A")
-            self.user_label.setText("Benutzer: N/A")
-            self.online_label.setText("Online: N/A")
-            self.status_label.setText("Status: Fehler")
-            self.status_label.setStyleSheet("""
+            self.binder.set_text(self.os_label, "OS: N/A")
+            self.binder.set_text(self.user_label, "Benutzer: N/A")
+            self.binder.set_text(self.online_label, "Online: N/A")
+            self.binder.set_text(self.status_label, "Status: Fehler")
+            self.binder.set_style(self.status_label, """
                 font-size: 12px;
                 font-weight: bold;
                 color: #ff4444;
-            """) 
\ No newline at end of file
+            """)
\ No newline at end of file
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SystemMonitorX - Flotten-Fenster
+Aggregierte Übersicht mehrerer Collector-Agents (Tabelle pro Host und Flotten-Kennzahlen)
+
+Autor: SystemMonitorX Team
+Version: 1.0.0
+"""
+
+from PyQt6.QtWidgets import (
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QFrame, QTableWidget, QTableWidgetItem, QHeaderView
+)
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+
+from utils.fleet import FleetClient, FLEET_METRICS, parse_agents
+
+HOST_COLUMNS = ["Host", "Adresse", "Status"] + [label for _, label in FLEET_METRICS] + ["Alter"]
+SUMMARY_COLUMNS = [("min", "Min"), ("avg", "Ø"), ("max", "Max"), ("p95", "p95")]
+
+
+def format_percent(value) -> str:
+    """Prozentwert für die Tabelle"""
+    return "–" if value is None else f"{value:.1f} %"
+
+
+class FleetWindow(QMainWindow):
+    """
+    Flotten-Fenster für SystemMonitorX
+    - Eine Zeile pro Agent (Host, Status, CPU/RAM/Festplatte, Alter des Snapshots)
+    - Flottenweite Min/Ø/Max/p95 über alle aktuellen Hosts
+    - Ein Refresh-Timer für alle Hosts: nur bei neuen Frames oder veralteten Hosts, nur geänderte Zellen
+    """
+    
+    # Signal beim Schließen
+    window_closed = pyqtSignal()
+    
+    def __init__(self, config_manager=None, agents=None):
+        super().__init__()
+        self.setWindowTitle("SystemMonitorX - Flotte")
+        self.setMinimumSize(900, 500)
+        
+        # Agents: Argument (--fleet) hat Vorrang vor der Konfiguration
+        self.config_manager = config_manager
+        if config_manager:
+            fleet_config = config_manager.get_fleet_config()
+        else:
+            from utils.config import ConfigManager
+            fleet_config = ConfigManager().default_settings["fleet"]
+        self.agents = parse_agents(agents if agents is not None else fleet_config.get("agents", []))
+        self.refresh_interval = fleet_config.get("refresh_interval", 1000)
+        
+        # Verbindungen zu den Agents (eigener asyncio-Thread)
+        self.client = FleetClient(self.agents)
+        self.last_version = -1
+        self.last_fresh_hosts = None
+        self.refresh_count = 0
+        self.redraw_count = 0
+        
+        # UI Setup
+        self.setup_theme()
+        self.setup_ui()
+        
+        self.client.start()
+        self.refresh_timer = QTimer()
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh_timer.start(self.refresh_interval)
+        
+    def setup_theme(self):
+        """Dark Mode Theme app-weit anwenden (nur beim ersten Fenster)"""
+        from utils.theme import get_theme_service
+        self.theme = get_theme_service(self.config_manager)
+        
+    def setup_ui(self):
+        """Benutzeroberfläche erstellen"""
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(20)
+        
+        self.setup_header(main_layout)
+        
+        # Tabelle pro Host
+        self.host_table = self.create_table(len(self.agents), HOST_COLUMNS)
+        for row, (host, port) in enumerate(self.agents):
+            self.host_table.item(row, 0).setText(host)
+            self.host_table.item(row, 1).setText(f"{host}:{port}")
+        main_layout.addWidget(self.host_table, 1)
+        
+        # Flotten-Kennzahlen (eine Zeile pro Kennzahl)
+        summary_columns = ["Kennzahl"] + [label for _, label in SUMMARY_COLUMNS]
+        self.summary_table = self.create_table(len(FLEET_METRICS), summary_columns)
+        for row, (_, label) in enumerate(FLEET_METRICS):
+            self.summary_table.item(row, 0).setText(label)
+        self.summary_table.setMaximumHeight(self.summary_table.verticalHeader().length()
+                                            + self.summary_table.horizontalHeader().height() + 4)
+        main_layout.addWidget(self.summary_table)
+        
+    def setup_header(self, parent_layout):
+        """Header-Bereich"""
+        header_frame = QFrame()
+        header_layout = QHBoxLayout(header_frame)
+        
+        title_label = QLabel("🌐 SystemMonitorX - Flotte")
+        title_label.setStyleSheet("""
+            font-size: 20px;
+            font-weight: bold;
+            color: #f2ecfa;
+            font-family: 'Consolas', monospace;
+        """)
+        
+        # Verbundene Hosts
+        self.status_label = QLabel(f"0/{len(self.agents)} Hosts verbunden")
+        self.status_label.setStyleSheet("""
+            font-size: 12px;
+            color: #a0a0a0;
+            font-family: 'Consolas', monospace;
+        """)
+        
+        header_layout.addWidget(title_label)
+        header_layout.addStretch()
+        header_layout.addWidget(self.status_label)
+        
+        parent_layout.addWidget(header_frame)
+        
+    def create_table(self, rows: int, columns) -> QTableWidget:
+        """Schreibgeschützte Tabelle mit vorab angelegten Zellen"""
+        table = QTableWidget(rows, len(columns))
+        table.setHorizontalHeaderLabels(columns)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        for row in range(rows):
+            for column in range(len(columns)):
+                item = QTableWidgetItem("–")
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+                table.setItem(row, column, item)
+        return table
+        
+    def set_cell(self, table: QTableWidget, row: int, column: int, text: str) -> bool:
+        """Zelltext nur bei Änderung setzen"""
+        item = table.item(row, column)
+        if item.text() == text:
+            return False
+        item.setText(text)
+        return True
+        
+    def refresh(self):
+        """Tabellen aktualisieren (ein Durchlauf für alle Hosts)"""
+        try:
+            self.refresh_count += 1
+            rows, version = self.client.get_rows()
+            new_frames = version != self.last_version
+            self.last_version = version
+            
+            # Hosts veralten auch ohne neue Frames: Kennzahlen dann ebenfalls neu berechnen
+            fresh_hosts = tuple(row["fresh"] for row in rows)
+            fresh_changed = fresh_hosts != self.last_fresh_hosts
+            self.last_fresh_hosts = fresh_hosts
+            
+            changed = False
+            self.host_table.setUpdatesEnabled(False)
+            self.summary_table.setUpdatesEnabled(False)
+            try:
+                for index, row in enumerate(rows):
+                    # Alter und Status (veraltet) ändern sich auch ohne neue Frames
+                    changed |= self.set_cell(self.host_table, index, len(HOST_COLUMNS) - 1,
+                                             "–" if row["age_s"] is None else f"{row['age_s']:.0f} s")
+                    changed |= self.set_cell(self.host_table, index, 2, row["status"])
+                    if not new_frames:
+                        continue
+                    self.host_table.item(index, 2).setToolTip(row["error"] or "")
+                    changed |= self.set_cell(self.host_table, index, 0, row["hostname"])
+                    for column, (key, _) in enumerate(FLEET_METRICS, start=3):
+                        changed |= self.set_cell(self.host_table, index, column, format_percent(row[key]))
+                        
+                if new_frames or fresh_changed:
+                    summary = self.client.get_summary(rows)
+                    for index, (key, _) in enumerate(FLEET_METRICS):
+                        for column, (field, _) in enumerate(SUMMARY_COLUMNS, start=1):
+                            changed |= self.set_cell(self.summary_table, index, column,
+                                                     format_percent(summary[key][field]))
+                    connected = sum(1 for row in rows if row["fresh"])
+                    self.status_label.setText(f"{connected}/{len(rows)} Hosts verbunden")
+            finally:
+                self.host_table.setUpdatesEnabled(True)
+                self.summary_table.setUpdatesEnabled(True)
+                
+            if changed:
+                self.redraw_count += 1
+                
+        except Exception as e:
+            print(f"Fehler beim Aktualisieren der Flotten-Ansicht: {e}")
+            
+    def closeEvent(self, event):
+        """Fenster schließen - Verbindungen zu den Agents trennen"""
+        self.refresh_timer.stop()
+        self.client.stop()
+        print(f"Flotten-Ansicht: {self.redraw_count} Neuzeichnungen bei {self.refresh_count} Refreshes")
+        self.window_closed.emit()
+        event.accept()
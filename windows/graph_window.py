@@ -9,23 +9,23 @@ Version: 1.0.0
 """
 
 import sys
+import time
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QTabWidget, QFrame
 )
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPalette, QColor
+from PyQt6.QtCore import Qt, QTimer, QEvent, pyqtSignal
 
 from utils.graphs import SystemGraphs
+from utils.frame_stats import FrameTimer
 
-# Theme-Farben (Dark Mode)
-THEME_COLORS = {
-    'background': '#141414',
-    'accent': '#4a307d',
-    'text': '#f2ecfa',
-    'text_secondary': '#a0a0a0',
-    'card_background': '#1e1e1e'
-}
+# Graph-Tabs: (Graph-Typ, Titel, Tab-Beschriftung) - aufgebaut erst bei Auswahl
+GRAPH_TABS = [
+    ("overview", "System-Übersicht", "🖥️ System-Übersicht"),
+    ("cpu", "CPU-Monitoring", "🖥️ CPU"),
+    ("ram", "RAM-Monitoring", "💾 RAM"),
+    ("disk", "Festplatten-Monitoring", "💿 Festplatte")
+]
 
 class GraphWindow(QMainWindow):
     """
@@ -33,103 +33,73 @@ class GraphWindow(QMainWindow):
     Zeigt Matplotlib-Graphen mit Dark Mode an
     """
     
-    def __init__(self):
+    # Signal beim Schließen (Low-Power-Modus der App)
+    window_closed = pyqtSignal()
+    
+    def __init__(self, config_manager=None, rate_control=None, coordinator=None):
         super().__init__()
+        self.open_started = time.perf_counter()
+        self.open_time_ms = None
         self.setWindowTitle("SystemMonitorX - Graphen")
         self.setMinimumSize(1000, 700)
         
+        # Graph-Konfiguration (Refresh-Rate, Frame-Budget)
+        self.config_manager = config_manager
+        self.rate_control = rate_control
+        if config_manager:
+            graphs_config = config_manager.get_graphs_config()
+        else:
+            from utils.config import ConfigManager
+            graphs_config = ConfigManager().default_settings["graphs"]
+        self.base_interval = graphs_config.get("refresh_interval", 1000)
+        self.max_interval = graphs_config.get("max_refresh_interval", 10000)
+        self.frame_budget_ms = graphs_config.get("frame_budget_ms", 50)
+        
+        # Frame-Zeitmessung
+        self.frame_timer = FrameTimer()
+        
         # Graph-System initialisieren
         self.graphs = SystemGraphs()
+        self.graphs.on_view_changed = self.schedule_history_load
+        
+        # Eine Datenquelle: Snapshots der App in der Graph-Rate (sonst eigener Sampler)
+        self.coordinator = coordinator
+        self.sampler = None
+        if coordinator:
+            coordinator.add_consumer("graphs", self.on_snapshot, self.base_interval)
+        else:
+            from utils.snapshot import SnapshotSampler
+            self.sampler = SnapshotSampler()
+        
+        # Verlaufs-Nachladen entprellen (Pan/Zoom feuert sehr häufig)
+        self.pending_history_graphs = set()
+        self.history_timer = QTimer()
+        self.history_timer.setSingleShot(True)
+        self.history_timer.setInterval(150)
+        self.history_timer.timeout.connect(self.load_pending_history)
         
         # UI Setup
         self.setup_theme()
         self.setup_ui()
         
-        # Live-Updates starten
-        self.graphs.start_live_updates()
+        # Redraw-Timer (Intervall wird bei Budget-Überschreitung erhöht)
+        # Mit Koordinator nur Zeichnen, sonst auch Sampeln
+        self.update_timer = QTimer()
+        self.update_timer.timeout.connect(self.update_graphs)
+        self.update_timer.start(self.base_interval)
+        
+        # Konfiguriertes Graph-Intervall, Frame-Budget und Throttling-Obergrenze live übernehmen
+        if self.rate_control:
+            self.rate_control.register("graphs", self.set_base_interval)
+            self.rate_control.register("graphs_frame_budget", self.set_frame_budget)
+            self.rate_control.register("graphs_max_interval", self.set_max_interval)
+        
+        self.frame_overlay_button.setChecked(graphs_config.get("show_frame_overlay", False))
         
     def setup_theme(self):
-        """Dark Mode Theme konfigurieren"""
-        # Palette für Dark Mode
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(THEME_COLORS['background']))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Base, QColor(THEME_COLORS['card_background']))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(THEME_COLORS['background']))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Text, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Button, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Link, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(THEME_COLORS['text']))
-        
-        self.setPalette(palette)
-        
-        # Stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #141414;
-                border-radius: 10px;
-            }
-            
-            QFrame {
-                background-color: #1e1e1e;
-                border-radius: 8px;
-                border: 1px solid #2a2a2a;
-            }
-            
-            QLabel {
-                color: #f2ecfa;
-                font-family: 'Consolas', monospace;
-                font-size: 12px;
-            }
-            
-            QPushButton {
-                background-color: #4a307d;
-                color: #f2ecfa;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-family: 'Consolas', monospace;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            
-            QPushButton:hover {
-                background-color: #5a408d;
-            }
-            
-            QPushButton:pressed {
-                background-color: #3a206d;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #2a2a2a;
-                background-color: #1e1e1e;
-                border-radius: 8px;
-            }
-            
-            QTabBar::tab {
-                background-color: #2a2a2a;
-                color: #f2ecfa;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                font-family: 'Consolas', monospace;
-                font-size: 11px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #4a307d;
-            }
-            
-            QTabBar::tab:hover {
-                background-color: #3a206d;
-            }
-        """)
+        """Dark Mode Theme app-weit anwenden (nur beim ersten Fenster)"""
+        from utils.theme import get_theme_service
+        self.theme = get_theme_service(self.config_manager)
         
     def setup_ui(self):
         """Benutzeroberfläche erstellen"""
@@ -170,40 +140,117 @@ class GraphWindow(QMainWindow):
             font-family: 'Consolas', monospace;
         """)
         
+        # Verlauf-Button (Daten aus logs/)
+        self.history_button = QPushButton("🕘 Verlauf")
+        self.history_button.setCheckable(True)
+        self.history_button.toggled.connect(self.toggle_history_mode)
+        
         header_layout.addWidget(title_label)
         header_layout.addStretch()
-        header_layout.addWidget(subtitle_label)
+        # Statistik-Button (EWMA, Ø ± σ, p95/p99 als Overlay)
+        self.statistics_button = QPushButton("📐 Statistik")
+        self.statistics_button.setCheckable(True)
+        self.statistics_button.toggled.connect(self.toggle_overlays)
         
-        parent_layout.addWidget(header_frame)
+        # Frame-Overlay (FPS, Draw-Zeit, aktuelles Intervall)
+        self.frame_overlay_label = QLabel("")
+        self.frame_overlay_label.setStyleSheet("""
+            font-size: 11px;
+            color: #a0a0a0;
+            font-family: 'Consolas', monospace;
+        """)
+        self.frame_overlay_label.hide()
         
-    def setup_tab_widget(self, parent_layout):
-        """Tab-Widget für verschiedene Graphen"""
-        self.tab_widget = QTabWidget()
+        self.frame_overlay_button = QPushButton("⏱️ FPS")
+        self.frame_overlay_button.setCheckable(True)
+        self.frame_overlay_button.toggled.connect(self.frame_overlay_label.setVisible)
+        
+        header_layout.addWidget(subtitle_label)
+        header_layout.addWidget(self.frame_overlay_label)
+        header_layout.addWidget(self.frame_overlay_button)
+        header_layout.addWidget(self.statistics_button)
+        header_layout.addWidget(self.history_button)
         
-        # System-Übersicht Tab
-        self.overview_tab = self.create_graph_tab("overview", "System-Übersicht")
-        self.tab_widget.addTab(self.overview_tab, "🖥️ System-Übersicht")
+        parent_layout.addWidget(header_frame)
         
-        # CPU Tab
-        self.cpu_tab = self.create_graph_tab("cpu", "CPU-Monitoring")
-        self.tab_widget.addTab(self.cpu_tab, "🖥️ CPU")
+    def toggle_history_mode(self, enabled: bool):
+        """Verlaufs-Modus ein-/ausschalten"""
+        try:
+            self.graphs.set_history_mode(enabled)
+            self.history_button.setText("📡 Live" if enabled else "🕘 Verlauf")
+            for graph_type in list(self.graphs.figure_pool):
+                self.refresh_graph(graph_type)
+        except Exception as e:
+            print(f"Fehler beim Umschalten des Verlaufs-Modus: {e}")
+            
+    def toggle_overlays(self, enabled: bool):
+        """Statistik-Overlays ein-/ausblenden"""
+        self.graphs.show_overlays = enabled
+        for graph_type in list(self.graphs.figure_pool):
+            self.refresh_graph(graph_type)
+            
+    def schedule_history_load(self, graph_type: str):
+        """Nachladen des sichtbaren Bereichs vormerken"""
+        self.pending_history_graphs.add(graph_type)
+        self.history_timer.start()
         
-        # RAM Tab
-        self.ram_tab = self.create_graph_tab("ram", "RAM-Monitoring")
-        self.tab_widget.addTab(self.ram_tab, "💾 RAM")
+    def load_pending_history(self):
+        """Vorgemerkte Graphen mit Verlaufsdaten neu zeichnen"""
+        pending = self.pending_history_graphs
+        self.pending_history_graphs = set()
+        for graph_type in pending:
+            self.refresh_graph(graph_type)
         
-        # Disk Tab
-        self.disk_tab = self.create_graph_tab("disk", "Festplatten-Monitoring")
-        self.tab_widget.addTab(self.disk_tab, "💿 Festplatte")
+    def setup_tab_widget(self, parent_layout):
+        """Tab-Widget für verschiedene Graphen (Inhalt erst bei Auswahl)"""
+        self.tab_widget = QTabWidget()
         
+        for graph_type, title, label in GRAPH_TABS:
+            tab = self.create_graph_tab(graph_type, title)
+            setattr(self, f"{graph_type}_tab", tab)
+            self.tab_widget.addTab(tab, label)
+            
+        self.tab_widget.currentChanged.connect(self.ensure_tab_built)
         parent_layout.addWidget(self.tab_widget)
         
+        # Ersten Tab erst nach dem ersten Paint des Fensters aufbauen
+        QTimer.singleShot(0, lambda: self.ensure_tab_built(self.tab_widget.currentIndex()))
+        
     def create_graph_tab(self, graph_type: str, title: str) -> QWidget:
-        """Graph-Tab erstellen"""
+        """Leeren Graph-Tab erstellen (Figure folgt in build_graph_tab)"""
         tab_widget = QWidget()
         layout = QVBoxLayout(tab_widget)
         layout.setContentsMargins(10, 10, 10, 10)
         
+        tab_widget.graph_type = graph_type
+        tab_widget.title = title
+        tab_widget.built = False
+        return tab_widget
+        
+    def ensure_tab_built(self, index: int):
+        """Tab beim ersten Anzeigen aufbauen und mit aktuellen Daten zeichnen"""
+        tab = self.tab_widget.widget(index)
+        if tab is None or tab.built:
+            return
+            
+        build_start = time.perf_counter()
+        self.build_graph_tab(tab)
+        self.refresh_graph(tab.graph_type)
+        build_ms = (time.perf_counter() - build_start) * 1000
+        
+        if self.open_time_ms is None:
+            self.open_time_ms = (time.perf_counter() - self.open_started) * 1000
+            print(f"Graph-Fenster bereit in {self.open_time_ms:.0f} ms "
+                  f"(erster Tab '{tab.graph_type}': {build_ms:.0f} ms)")
+        else:
+            print(f"Graph-Tab '{tab.graph_type}' aufgebaut in {build_ms:.0f} ms")
+            
+    def build_graph_tab(self, tab_widget: QWidget):
+        """Figure, Canvas und Toolbar eines Tabs erstellen"""
+        graph_type = tab_widget.graph_type
+        layout = tab_widget.layout()
+        tab_widget.built = True
+        
         # Graph-Widget erstellen
         try:
             canvas, toolbar, fig = self.graphs.create_graph_widget(graph_type)
@@ -224,7 +271,6 @@ class GraphWindow(QMainWindow):
             # Referenzen speichern
             tab_widget.canvas = canvas
             tab_widget.figure = fig
-            tab_widget.graph_type = graph_type
             
         except Exception as e:
             # Fehler-Label
@@ -232,62 +278,115 @@ class GraphWindow(QMainWindow):
             error_label.setStyleSheet("color: red; font-size: 14px;")
             layout.addWidget(error_label)
             
-        return tab_widget
-        
     def refresh_graph(self, graph_type: str):
-        """Graph aktualisieren"""
+        """Graph aktualisieren (gepoolte Figure, nur Daten neu binden)"""
         try:
-            # Neuen Graph erstellen
-            canvas, toolbar, fig = self.graphs.create_graph_widget(graph_type)
-            
-            # Tab finden und aktualisieren
-            for i in range(self.tab_widget.count()):
-                tab = self.tab_widget.widget(i)
-                if hasattr(tab, 'graph_type') and tab.graph_type == graph_type:
-                    # Alte Widgets entfernen
-                    old_layout = tab.layout()
-                    while old_layout.count():
-                        child = old_layout.takeAt(0)
-                        if child.widget():
-                            child.widget().deleteLater()
-                    
-                    # Neue Widgets hinzufügen
-                    toolbar_layout = QHBoxLayout()
-                    toolbar_layout.addWidget(toolbar)
-                    toolbar_layout.addStretch()
-                    
-                    refresh_button = QPushButton("🔄 Aktualisieren")
-                    refresh_button.clicked.connect(lambda: self.refresh_graph(graph_type))
-                    toolbar_layout.addWidget(refresh_button)
-                    
-                    old_layout.addLayout(toolbar_layout)
-                    old_layout.addWidget(canvas)
-                    
-                    # Referenzen aktualisieren
-                    tab.canvas = canvas
-                    tab.figure = fig
-                    break
-                    
+            self.graphs.refresh_graph(graph_type)
         except Exception as e:
             print(f"Fehler beim Aktualisieren des Graphen: {e}")
             
     def closeEvent(self, event):
         """Fenster schließen - Live-Updates stoppen"""
-        self.graphs.stop_live_updates()
+        self.update_timer.stop()
+        if self.coordinator:
+            self.coordinator.remove_consumer("graphs")
+        if self.rate_control:
+            self.rate_control.unregister("graphs", self.set_base_interval)
+            self.rate_control.unregister("graphs_frame_budget", self.set_frame_budget)
+            self.rate_control.unregister("graphs_max_interval", self.set_max_interval)
+        print(f"Frame-Statistik Graph-Fenster:\n{self.frame_timer.format_summary()}")
+        self.graphs.release_graph_widgets()
+        self.window_closed.emit()
         event.accept()
         
+    def changeEvent(self, event):
+        """Minimiert nicht zeichnen: Update-Timer anhalten bzw. fortsetzen"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            if self.isMinimized():
+                self.update_timer.stop()
+            elif self.isVisible() and not self.update_timer.isActive():
+                self.update_timer.start()
+        
+    def on_snapshot(self, snapshot):
+        """Snapshot der App in die Graph-Daten übernehmen (Dauer wird gemessen)"""
+        if "error" in snapshot:
+            return
+        update_start = time.perf_counter()
+        data = dict(snapshot)
+        data["cpu_freq_ghz"] = data.get("cpu_freq_ghz") or 0
+        self.graphs.update_graph_data(data)
+        self.frame_timer.record_update((time.perf_counter() - update_start) * 1000)
+        
     def update_graphs(self):
-        """Alle Graphen mit Live-Daten aktualisieren"""
+        """Sichtbaren Graph mit Live-Daten aktualisieren"""
         try:
-            # System-Daten sammeln
-            data = self.graphs._collect_system_data()
-            self.graphs.update_graph_data(data)
-            
-            # Graphen aktualisieren (falls Canvas vorhanden)
-            for i in range(self.tab_widget.count()):
-                tab = self.tab_widget.widget(i)
-                if hasattr(tab, 'canvas') and tab.canvas:
-                    tab.canvas.draw()
+            # Ohne App-Koordinator selbst sampeln
+            if self.sampler:
+                self.on_snapshot(self.sampler.sample())
+                
+            # Im Verlaufs-Modus nur bei Pan/Zoom neu zeichnen
+            if self.graphs.history_mode:
+                return
+                
+            # Sichtbaren Graph synchron zeichnen und Draw-Zeit messen
+            tab = self.tab_widget.currentWidget()
+            if tab is not None and tab.built:
+                draw_start = time.perf_counter()
+                self.graphs.refresh_graph(tab.graph_type, immediate=True)
+                self.frame_timer.record_frame(tab.graph_type, (time.perf_counter() - draw_start) * 1000)
+                
+            self.adjust_refresh_rate()
+            self.update_frame_overlay()
                     
         except Exception as e:
-            print(f"Fehler beim Aktualisieren der Graphen: {e}") 
\ No newline at end of file
+            print(f"Fehler beim Aktualisieren der Graphen: {e}")
+            
+    def set_base_interval(self, interval: int):
+        """Konfiguriertes Graph-Intervall übernehmen (ms)"""
+        self.base_interval = interval
+        self.update_timer.setInterval(interval)  # Auto-Throttling greift bei Bedarf erneut
+        # Verlauf in der konfigurierten Rate sampeln (unabhängig vom Redraw-Throttling)
+        if self.coordinator:
+            self.coordinator.add_consumer("graphs", self.on_snapshot, interval)
+        
+    def set_frame_budget(self, budget_ms: int):
+        """Frame-Budget übernehmen (ms), gilt ab dem nächsten Frame"""
+        self.frame_budget_ms = budget_ms
+        
+    def set_max_interval(self, interval: int):
+        """Obergrenze des Auto-Throttlings übernehmen (ms)"""
+        self.max_interval = interval
+        # Bereits gedrosselt über die neue Grenze hinaus: sofort zurücknehmen
+        if self.update_timer.interval() > interval:
+            self.update_timer.setInterval(max(self.base_interval, interval))
+        
+    def adjust_refresh_rate(self):
+        """Refresh-Intervall an das Frame-Budget anpassen"""
+        draw_ms = self.frame_timer.smoothed_draw_ms or 0.0
+        interval = self.update_timer.interval()
+        
+        if draw_ms > self.frame_budget_ms and interval < self.max_interval:
+            # Budget überschritten: seltener zeichnen
+            new_interval = min(self.max_interval, int(interval * 1.5))
+        elif draw_ms < self.frame_budget_ms / 2 and interval > self.base_interval:
+            # Wieder genug Luft: schrittweise zurück zur konfigurierten Rate
+            new_interval = max(self.base_interval, int(interval / 1.5))
+        else:
+            return
+            
+        self.update_timer.setInterval(new_interval)
+        print(f"Graph-Refresh-Intervall angepasst: {interval} ms -> {new_interval} ms "
+              f"(Draw-Zeit {draw_ms:.1f} ms, Budget {self.frame_budget_ms} ms)")
+        
+    def update_frame_overlay(self):
+        """FPS- und Draw-Zeit-Anzeige aktualisieren"""
+        if not self.frame_overlay_label.isVisible():
+            return
+            
+        self.frame_overlay_label.setText(
+            f"FPS: {self.frame_timer.get_fps():.1f} | "
+            f"Draw: {self.frame_timer.last_draw_ms:.1f} ms | "
+            f"Daten: {self.frame_timer.last_update_ms:.1f} ms | "
+            f"Intervall: {self.update_timer.interval()} ms"
+        )
@@ -16,19 +16,10 @@ from PyQt6.QtWidgets import (
     QFormLayout, QDialog, QFileDialog, QMessageBox
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPalette, QColor
+from PyQt6.QtGui import QColor
 
 from utils.config import ConfigManager
 
-# Theme-Farben (Dark Mode)
-THEME_COLORS = {
-    'background': '#141414',
-    'accent': '#4a307d',
-    'text': '#f2ecfa',
-    'text_secondary': '#a0a0a0',
-    'card_background': '#1e1e1e'
-}
-
 class SettingsWindow(QMainWindow):
     """
     Einstellungen-Fenster für SystemMonitorX
@@ -49,132 +40,9 @@ class SettingsWindow(QMainWindow):
         self.setup_ui()
         
     def setup_theme(self):
-        """Dark Mode Theme konfigurieren"""
-        # Palette für Dark Mode
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(THEME_COLORS['background']))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Base, QColor(THEME_COLORS['card_background']))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(THEME_COLORS['background']))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Text, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Button, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(THEME_COLORS['text']))
-        palette.setColor(QPalette.ColorRole.Link, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(THEME_COLORS['accent']))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(THEME_COLORS['text']))
-        
-        self.setPalette(palette)
-        
-        # Stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #141414;
-                border-radius: 10px;
-            }
-            
-            QFrame {
-                background-color: #1e1e1e;
-                border-radius: 8px;
-                border: 1px solid #2a2a2a;
-            }
-            
-            QLabel {
-                color: #f2ecfa;
-                font-family: 'Consolas', monospace;
-                font-size: 12px;
-            }
-            
-            QPushButton {
-                background-color: #4a307d;
-                color: #f2ecfa;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-family: 'Consolas', monospace;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            
-            QPushButton:hover {
-                background-color: #5a408d;
-            }
-            
-            QPushButton:pressed {
-                background-color: #3a206d;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #2a2a2a;
-                background-color: #1e1e1e;
-                border-radius: 8px;
-            }
-            
-            QTabBar::tab {
-                background-color: #2a2a2a;
-                color: #f2ecfa;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border-top-left-radius: 6px;
-                border-top-right-radius: 6px;
-                font-family: 'Consolas', monospace;
-                font-size: 11px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #4a307d;
-            }
-            
-            QTabBar::tab:hover {
-                background-color: #3a206d;
-            }
-            
-            QSpinBox, QLineEdit {
-                background-color: #2a2a2a;
-                color: #f2ecfa;
-                border: 1px solid #4a307d;
-                border-radius: 4px;
-                padding: 4px 8px;
-                font-family: 'Consolas', monospace;
-                font-size: 11px;
-            }
-            
-            QCheckBox {
-                color: #f2ecfa;
-                font-family: 'Consolas', monospace;
-                font-size: 11px;
-            }
-            
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 2px solid #4a307d;
-                border-radius: 3px;
-                background-color: #2a2a2a;
-            }
-            
-            QCheckBox::indicator:checked {
-                background-color: #4a307d;
-            }
-            
-            QGroupBox {
-                color: #f2ecfa;
-                font-family: 'Consolas', monospace;
-                font-size: 12px;
-                font-weight: bold;
-                border: 1px solid #4a307d;
-                border-radius: 6px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-        """)
+        """Dark Mode Theme app-weit anwenden (nur beim ersten Fenster)"""
+        from utils.theme import get_theme_service
+        self.theme = get_theme_service(self.config_manager)
         
     def setup_ui(self):
         """Benutzeroberfläche erstellen"""
@@ -296,6 +164,12 @@ class SettingsWindow(QMainWindow):
         self.logging_enabled.setChecked(logging_config.get("enabled", False))
         general_layout.addRow(self.logging_enabled)
         
+        self.log_interval = QSpinBox()
+        self.log_interval.setRange(100, 60000)
+        self.log_interval.setValue(logging_config.get("log_interval", 1000))
+        self.log_interval.setSuffix(" ms")
+        general_layout.addRow("Log-Intervall:", self.log_interval)
+        
         # Buffer-Einstellungen
         buffer_group = QGroupBox("Buffer-Einstellungen")
         buffer_layout = QFormLayout(buffer_group)
@@ -315,6 +189,12 @@ class SettingsWindow(QMainWindow):
         self.auto_save_interval.setValue(logging_config.get("auto_save_interval", 60))
         buffer_layout.addRow("Auto-Save Intervall (Sekunden):", self.auto_save_interval)
         
+        self.history_retention_days = QSpinBox()
+        self.history_retention_days.setRange(1, 365)
+        self.history_retention_days.setValue(logging_config.get("history_retention_days", 14))
+        self.history_retention_days.setSuffix(" Tage")
+        buffer_layout.addRow("Verlauf aufbewahren:", self.history_retention_days)
+        
         layout.addWidget(general_group)
         layout.addWidget(buffer_group)
         layout.addStretch()
@@ -352,8 +232,36 @@ class SettingsWindow(QMainWindow):
         self.graphs_enabled.setChecked(monitoring_config.get("graphs_enabled", True))
         features_layout.addRow(self.graphs_enabled)
         
+        # Graph-Einstellungen
+        graphs_config = self.config_manager.get_graphs_config()
+        graphs_group = QGroupBox("Graph-Einstellungen")
+        graphs_layout = QFormLayout(graphs_group)
+        
+        self.graph_refresh_interval = QSpinBox()
+        self.graph_refresh_interval.setRange(200, 10000)
+        self.graph_refresh_interval.setValue(graphs_config.get("refresh_interval", 1000))
+        self.graph_refresh_interval.setSuffix(" ms")
+        graphs_layout.addRow("Graph-Intervall:", self.graph_refresh_interval)
+        
+        self.frame_budget = QSpinBox()
+        self.frame_budget.setRange(5, 1000)
+        self.frame_budget.setValue(graphs_config.get("frame_budget_ms", 50))
+        self.frame_budget.setSuffix(" ms")
+        graphs_layout.addRow("Frame-Budget:", self.frame_budget)
+        
+        self.max_graph_interval = QSpinBox()
+        self.max_graph_interval.setRange(1000, 60000)
+        self.max_graph_interval.setValue(graphs_config.get("max_refresh_interval", 10000))
+        self.max_graph_interval.setSuffix(" ms")
+        graphs_layout.addRow("Max. Graph-Intervall (Drosselung):", self.max_graph_interval)
+        
+        self.show_frame_overlay = QCheckBox("FPS-Overlay anzeigen")
+        self.show_frame_overlay.setChecked(graphs_config.get("show_frame_overlay", False))
+        graphs_layout.addRow(self.show_frame_overlay)
+        
         layout.addWidget(update_group)
         layout.addWidget(features_group)
+        layout.addWidget(graphs_group)
         layout.addStretch()
         
         return tab
@@ -475,22 +383,36 @@ class SettingsWindow(QMainWindow):
             self.config_manager.set_theme_colors(theme_colors)
             
             # Logging-Konfiguration speichern
-            logging_config = {
+            logging_config = dict(self.config_manager.get_logging_config())
+            logging_config.update({
                 "enabled": self.logging_enabled.isChecked(),
+                "log_interval": self.log_interval.value(),
                 "buffer_size": self.buffer_size.value(),
                 "max_files": self.max_files.value(),
-                "auto_save_interval": self.auto_save_interval.value()
-            }
+                "auto_save_interval": self.auto_save_interval.value(),
+                "history_retention_days": self.history_retention_days.value()
+            })
             self.config_manager.set_logging_config(logging_config)
             
             # Monitoring-Konfiguration speichern
-            monitoring_config = {
+            monitoring_config = dict(self.config_manager.get_monitoring_config())
+            monitoring_config.update({
                 "update_interval": self.update_interval.value(),
                 "widgets_enabled": self.widgets_enabled.isChecked(),
                 "graphs_enabled": self.graphs_enabled.isChecked()
-            }
+            })
             self.config_manager.set_monitoring_config(monitoring_config)
             
+            # Graph-Konfiguration speichern
+            graphs_config = dict(self.config_manager.get_graphs_config())
+            graphs_config.update({
+                "refresh_interval": self.graph_refresh_interval.value(),
+                "frame_budget_ms": self.frame_budget.value(),
+                "max_refresh_interval": self.max_graph_interval.value(),
+                "show_frame_overlay": self.show_frame_overlay.isChecked()
+            })
+            self.config_manager.set_graphs_config(graphs_config)
+            
             # System-Tray-Konfiguration speichern
             tray_config = {
                 "enabled": self.tray_enabled.isChecked(),